@@ -1,6 +1,7 @@
-from .chunking import Chunk, chunk_text
+from .chunking import Chunk, Tokenizer, chunk_text
 
 __all__ = [
     "Chunk",
+    "Tokenizer",
     "chunk_text",
 ]
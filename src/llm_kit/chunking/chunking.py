@@ -1,11 +1,15 @@
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
-from time import monotonic
+from time import perf_counter_ns
+from typing import Any, Literal, Protocol
+
+import numpy as np
 
 from llm_kit.observability import names
 from llm_kit.observability.base import MetricsHook, NoOpMetricsHook
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Chunk:
     chunk_id: str
     text: str
@@ -14,15 +18,49 @@ class Chunk:
     metadata: dict
 
 
+class Tokenizer(Protocol):
+    """Tokenizer interface met by Hugging Face "fast" tokenizers.
+
+    Called with ``add_special_tokens=False`` and
+    ``return_offsets_mapping=True``, it returns a mapping whose
+    ``offset_mapping`` holds each token's ``(start, end)`` character span in
+    the input text.
+    """
+
+    def __call__(
+        self,
+        text: str,
+        *,
+        add_special_tokens: bool,
+        return_offsets_mapping: bool,
+    ) -> Mapping[str, Any]: ...
+
+
 def chunk_text(
     text: str,
     *,
     chunk_size: int,
     overlap: int,
     metadata: dict,
+    unit: Literal["char", "token"] = "char",
+    tokenizer: Tokenizer | None = None,
     metrics_hook: MetricsHook = NoOpMetricsHook(),
 ) -> list[Chunk]:
-    start = monotonic()
+    """
+    Split text into fixed-size, overlapping chunks.
+
+    With unit="token", chunk_size and overlap count tokenizer tokens, so every
+    chunk fits the embedding model's max sequence length without truncation.
+    Special tokens are not counted; leave room for the ones the model adds
+    (e.g. chunk_size = max_seq_length - 2 for [CLS]/[SEP]).
+
+    In both units, offset_start/offset_end (and chunk ids) are character
+    offsets into ``text`` and ``Chunk.text == text[offset_start:offset_end]``.
+    A token chunk spans from its first token's start to its last token's end;
+    its text is sliced from the source, never decoded, so tokenizer
+    normalization (case, accents, whitespace) does not leak into it.
+    """
+    t0 = perf_counter_ns()
     if chunk_size <= 0:
         raise ValueError("chunk_size must be > 0")
     if overlap < 0:
@@ -30,30 +68,47 @@ def chunk_text(
     if overlap >= chunk_size:
         raise ValueError("overlap must be < chunk_size")
 
-    chunks = []
-    step = chunk_size - overlap
-    text_len = len(text)
+    source_id = metadata.get("source_id", "unknown")
 
-    for _, start in enumerate(range(0, text_len, step)):
-        end = min(start + chunk_size, text_len)
-        chunk_text = text[start:end]
-
-        chunk_id = f"{metadata.get('source_id', 'unknown')}:{start}:{end}"
-
-        chunks.append(
+    if unit == "token":
+        if tokenizer is None:
+            raise ValueError("unit='token' requires a tokenizer")
+        spans = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)[
+            "offset_mapping"
+        ]
+        chunks = []
+        for s, e in _offsets(len(spans), chunk_size, overlap):
+            start, end = spans[s][0], spans[e - 1][1]
+            chunks.append(
+                Chunk(
+                    chunk_id=f"{source_id}:{start}:{end}",
+                    text=text[start:end],
+                    offset_start=start,
+                    offset_end=end,
+                    metadata=dict(metadata),
+                )
+            )
+    else:
+        chunks = [
             Chunk(
-                chunk_id=chunk_id,
-                text=chunk_text,
-                offset_start=start,
-                offset_end=end,
+                chunk_id=f"{source_id}:{s}:{e}",
+                text=text[s:e],
+                offset_start=s,
+                offset_end=e,
                 metadata=dict(metadata),
             )
-        )
+            for s, e in _offsets(len(text), chunk_size, overlap)
+        ]
 
-        if end == text_len:
-            break
-
-    elapsed_ms = 1000 * (monotonic() - start)
+    elapsed_ms = (perf_counter_ns() - t0) / 1_000_000
     metrics_hook.record_latency(names.CHUNKING_DURATION, elapsed_ms)
     metrics_hook.increment(names.CHUNKING_CHUNKS_CREATED, len(chunks))
     return chunks
+
+
+def _offsets(length: int, chunk_size: int, overlap: int) -> Iterator[tuple[int, int]]:
+    # Offset table: stop after the first chunk that reaches the end
+    starts = np.arange(0, length, chunk_size - overlap, dtype=np.int64)
+    ends = np.minimum(starts + chunk_size, length)
+    last = int(np.searchsorted(ends, length))
+    return zip(starts[: last + 1].tolist(), ends[: last + 1].tolist(), strict=True)
@@ -0,0 +1,23 @@
+# src/llm_kit/embeddings/_batching.py
+
+"""Internal batching helper shared by the embeddings clients."""
+
+from collections.abc import Iterable
+
+
+def batch_iter(
+    items: list[str], max_items: int, max_chars: int
+) -> Iterable[tuple[int, list[str]]]:
+    """Yield ``(offset, batch)``, closing a batch when either limit would trip."""
+    offset = 0
+    batch: list[str] = []
+    chars = 0
+    for item in items:
+        if batch and (len(batch) == max_items or chars + len(item) > max_chars):
+            yield offset, batch
+            offset += len(batch)
+            batch, chars = [], 0
+        batch.append(item)
+        chars += len(item)
+    if batch:
+        yield offset, batch
@@ -0,0 +1,56 @@
+# src/llm_kit/embeddings/_cache.py
+
+"""Internal bounded LRU cache shared by the embeddings clients."""
+
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from .base import Embedding
+
+
+class EmbeddingCache:
+    """In-memory LRU of text -> Embedding.
+
+    Keyed on the text itself: str hashes are cached by CPython and exact
+    equality means no collisions. Not thread-safe; intended for use from a
+    single event loop.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, Embedding] = OrderedDict()
+
+    async def embed(
+        self,
+        texts: list[str],
+        embed_fn: Callable[[list[str]], Awaitable[list[Embedding]]],
+    ) -> tuple[list[Embedding], int]:
+        """Serve hits from the cache and embed each distinct miss once.
+
+        Returns the embeddings in input order and the number of cache hits.
+        """
+        found: dict[str, Embedding] = {}
+        hits = 0
+        for text in texts:
+            cached = self._entries.get(text)
+            if cached is not None:
+                self._entries.move_to_end(text)
+                found[text] = cached
+                hits += 1
+
+        missing = [text for text in dict.fromkeys(texts) if text not in found]
+        if missing:
+            for text, embedding in zip(missing, await embed_fn(missing), strict=True):
+                found[text] = embedding
+                self._put(text, embedding)
+
+        return [found[text] for text in texts], hits
+
+    def _put(self, text: str, embedding: Embedding) -> None:
+        # Copy so a cached row does not pin the whole batch matrix it came from
+        self._entries[text] = Embedding(vector=embedding.vector.copy())
+        self._entries.move_to_end(text)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
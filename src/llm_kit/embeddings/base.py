@@ -1,15 +1,26 @@
-from dataclasses import dataclass
-from typing import Protocol
+from collections.abc import AsyncIterator
+from typing import NamedTuple, Protocol
+
+import numpy as np
 
 from llm_kit.observability.base import MetricsHook
 
 
-@dataclass(frozen=True)
-class Embedding:
-    vector: list[float]
+class Embedding(NamedTuple):
+    vector: np.ndarray  # 1-D float32
 
 
 class EmbeddingsClient(Protocol):
     metrics_hook: MetricsHook
 
     async def embed(self, texts: list[str]) -> list[Embedding]: ...
+
+    async def embed_matrix(self, texts: list[str]) -> np.ndarray:
+        """Embed texts into one contiguous ``(len(texts), dim)`` float32 matrix."""
+        ...
+
+    def embed_stream(
+        self, texts: list[str]
+    ) -> AsyncIterator[tuple[int, list[Embedding]]]:
+        """Yield ``(offset, embeddings)`` per batch as soon as it is ready."""
+        ...
@@ -11,7 +11,7 @@ class EmbeddingsConfig:
     provider: Provider
     model: str
     timeout: float = 30.0
-    batch_size: int = 100
+    batch_size: int | None = None  # None uses the provider client's default
 
     # provider-specific (used only when relevant)
     api_key: str | None = None
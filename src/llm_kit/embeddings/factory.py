@@ -4,7 +4,9 @@ from llm_kit.observability.base import MetricsHook, NoOpMetricsHook
 
 from .base import EmbeddingsClient
 from .config import EmbeddingsConfig
+from .local import DEFAULT_BATCH_SIZE as LOCAL_DEFAULT_BATCH_SIZE
 from .local import LocalEmbeddingsClient
+from .openai import DEFAULT_BATCH_SIZE as OPENAI_DEFAULT_BATCH_SIZE
 from .openai import OpenAIEmbeddingsClient
 
 
@@ -17,14 +19,14 @@ def create_embeddings_client(
             api_key=config.api_key or "",
             model=config.model,
             timeout=config.timeout,
-            batch_size=config.batch_size,
+            batch_size=config.batch_size or OPENAI_DEFAULT_BATCH_SIZE,
             metrics_hook=metrics_hook,
         )
 
     if config.provider == "local":
         return LocalEmbeddingsClient(
             model_name=config.model,
-            batch_size=config.batch_size,
+            batch_size=config.batch_size or LOCAL_DEFAULT_BATCH_SIZE,
             metrics_hook=metrics_hook,
         )
 
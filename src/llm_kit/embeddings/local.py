@@ -3,80 +3,261 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from collections.abc import Iterable
-from time import monotonic
+from collections.abc import AsyncIterator, Iterable
+from time import perf_counter_ns
+from typing import Literal
 
+import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
 from llm_kit.observability import names
 from llm_kit.observability.base import MetricsHook, NoOpMetricsHook
 
+from ._batching import batch_iter
+from ._cache import EmbeddingCache
 from .base import Embedding, EmbeddingsClient
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 32
+
+Precision = Literal["fp32", "fp16", "bf16"]
+Backend = Literal["torch", "onnx", "openvino"]
+
+_TORCH_DTYPES: dict[str, torch.dtype] = {
+    "fp32": torch.float32,
+    "fp16": torch.float16,
+    "bf16": torch.bfloat16,
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model(
+    model_name: str,
+    backend: Backend,
+    dtype: Precision,
+    model_file: str | None,
+) -> SentenceTransformer:
+    """
+    Load a model once per process and share it between clients.
+
+    The returned model is shared: callers must not mutate it (e.g. move it to
+    another device or change its dtype).
+    """
+    model = SentenceTransformer(
+        model_name,
+        backend=backend,
+        model_kwargs={"file_name": model_file} if model_file else None,
+    )
+    if dtype != "fp32":
+        model.to(dtype=_TORCH_DTYPES[dtype])
+    return model
+
 
 class LocalEmbeddingsClient(EmbeddingsClient):
     """
     Local embedding client using sentence-transformers.
 
     This is a thin wrapper:
-    - batching is internal
-    - returns plain Python lists
-    - no caching
+    - batching is internal (length-sorted to minimise padding, capped by
+      both text count and total characters)
+    - returns float32 NumPy vectors (no per-float Python objects)
+    - optional in-memory LRU cache of previously embedded texts
+    - loaded models are shared between clients with the same settings
     - no async
     """
 
     def __init__(
         self,
         model_name: str,
-        batch_size: int = 32,
+        batch_size: int = DEFAULT_BATCH_SIZE,
         normalize: bool = False,
+        max_batch_chars: int = 150_000,
+        dtype: Precision = "fp32",
+        backend: Backend = "torch",
+        model_file: str | None = None,
+        cache_size: int = 0,
         metrics_hook: MetricsHook = NoOpMetricsHook(),
     ) -> None:
-        self._model = SentenceTransformer(model_name)
+        """
+        Initialize local embeddings client.
+
+        Args:
+            model_name: sentence-transformers model name or path.
+            batch_size: Maximum number of texts per batch.
+            normalize: Whether to L2-normalize embeddings.
+            max_batch_chars: Maximum total characters per batch. Keeps batches of
+                long texts small enough to fit in memory while short texts still
+                fill a full batch_size.
+            dtype: Weight precision. "bf16" (Ampere+ GPUs, AMX CPUs) or "fp16"
+                (older GPUs) halve memory bandwidth; outputs are always float32.
+                Only applies to the "torch" backend.
+            backend: Inference runtime. "onnx" (ONNX Runtime) and "openvino" use
+                fused kernels and are typically several times faster on CPU.
+            model_file: Backend-specific weights file inside the model repo, e.g.
+                "onnx/model_qint8_avx512_vnni.onnx" for an int8-quantized model.
+            cache_size: Number of texts to keep in an in-memory LRU cache so
+                repeated texts skip inference. 0 disables caching.
+            metrics_hook: Hook for recording metrics.
+        """
+        if dtype != "fp32" and backend != "torch":
+            raise ValueError(f"dtype={dtype!r} requires backend='torch'")
+
+        self._model = _load_model(model_name, backend, dtype, model_file)
         self._batch_size = batch_size
+        self._max_batch_chars = max_batch_chars
+        self._cache = EmbeddingCache(cache_size) if cache_size else None
         self._normalize = normalize
         self.metrics_hook = metrics_hook
+        # Skip the metrics calls entirely when nothing would record them
+        self._emit_metrics = not isinstance(metrics_hook, NoOpMetricsHook)
         logger.info(
-            "Initialized LocalEmbeddingsClient with model=%s, batch_size=%s, normalize=%s",
+            "Initialized LocalEmbeddingsClient with model=%s, batch_size=%s, normalize=%s, dtype=%s, backend=%s",
             model_name,
             batch_size,
             normalize,
+            dtype,
+            backend,
         )
 
+    @staticmethod
+    def preload(
+        model_name: str,
+        dtype: Precision = "fp32",
+        backend: Backend = "torch",
+        model_file: str | None = None,
+    ) -> None:
+        """
+        Load a model into the shared model cache ahead of time.
+
+        Clients created later with the same arguments reuse the loaded model
+        instead of reading weights from disk again.
+        """
+        if dtype != "fp32" and backend != "torch":
+            raise ValueError(f"dtype={dtype!r} requires backend='torch'")
+        _load_model(model_name, backend, dtype, model_file)
+
     async def embed(self, texts: list[str]) -> list[Embedding]:
         if not texts:
             logger.debug("Empty input, returning empty list")
             return []
 
-        start = monotonic()
+        if self._cache is None:
+            return await self._embed(texts)
+
+        embeddings, hits = await self._cache.embed(texts, self._embed)
+        if self._emit_metrics:
+            self.metrics_hook.increment(
+                names.EMBEDDINGS_CACHE_HITS, hits, labels={"backend": "local"}
+            )
+        return embeddings
+
+    async def _embed(self, texts: list[str]) -> list[Embedding]:
+        return [Embedding(vector=row) for row in await self.embed_matrix(texts)]
+
+    async def embed_matrix(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts into one contiguous ``(len(texts), dim)`` float32 matrix.
+
+        Row ``i`` is the embedding of ``texts[i]``. Bypasses the embedding cache.
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        start = perf_counter_ns()
         logger.info("Embedding %d texts in batches of %d", len(texts), self._batch_size)
-        embeddings: list[Embedding] = []
 
-        for batch in _batch_iter(texts, self._batch_size):
+        # Smart batching: sentence-transformers pads every sequence to the
+        # longest one in its batch, so batch texts of similar length together
+        # and scatter the results back into caller order.
+        order = np.argsort([len(t) for t in texts], kind="stable")
+        sorted_texts = [texts[i] for i in order]
+        matrix: np.ndarray | None = None
+
+        for offset, batch in self._batches(sorted_texts):
             logger.debug("Processing batch with %d texts", len(batch))
-            # Use to_thread to avoid blocking event loop with CPU-bound work
-            vectors = await asyncio.to_thread(
-                self._model.encode,
-                batch,
-                convert_to_numpy=True,
-                normalize_embeddings=self._normalize,
-                show_progress_bar=False,
+            vectors = await self._encode(batch)
+
+            if matrix is None:
+                matrix = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+            matrix[order[offset : offset + len(batch)]] = vectors
+
+        assert matrix is not None
+
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(
+                names.EMBEDDINGS_LOCAL_DURATION, elapsed_ms
+            )
+            self.metrics_hook.increment(
+                names.EMBEDDINGS_REQUESTS_TOTAL, labels={"backend": "local"}
             )
+        logger.info("Successfully embedded %d texts", len(matrix))
+        return matrix
 
-            embeddings.extend(Embedding(vector=v.tolist()) for v in vectors)
+    async def embed_stream(
+        self, texts: list[str]
+    ) -> AsyncIterator[tuple[int, list[Embedding]]]:
+        """
+        Yield ``(offset, embeddings)`` per batch, in input order.
 
-        elapsed_ms = 1000 * (monotonic() - start)
-        self.metrics_hook.record_latency(names.EMBEDDINGS_LOCAL_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.EMBEDDINGS_REQUESTS_TOTAL, labels={"backend": "local"}
-        )
-        logger.info("Successfully embedded %d texts", len(embeddings))
-        return embeddings
+        ``embeddings`` correspond to ``texts[offset : offset + len(embeddings)]``.
+        The next batch is encoded while the caller handles the current one, so
+        embedding overlaps with downstream work such as vector-store upserts.
+        Streaming bypasses the embedding cache.
+        """
+        batches = list(self._batches(texts))
+        if not batches:
+            return
+
+        start = perf_counter_ns()
+        pending = asyncio.create_task(self._encode(batches[0][1]))
+        try:
+            for i, (offset, _) in enumerate(batches):
+                vectors = await pending
+                if i + 1 < len(batches):
+                    pending = asyncio.create_task(self._encode(batches[i + 1][1]))
+                yield offset, [Embedding(vector=row) for row in vectors]
+        finally:
+            pending.cancel()
 
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(
+                names.EMBEDDINGS_LOCAL_DURATION, elapsed_ms
+            )
+            self.metrics_hook.increment(
+                names.EMBEDDINGS_REQUESTS_TOTAL, labels={"backend": "local"}
+            )
+
+    def _batches(self, texts: list[str]) -> Iterable[tuple[int, list[str]]]:
+        return batch_iter(texts, self._batch_size, self._max_batch_chars)
+
+    async def _encode(self, batch: list[str]) -> np.ndarray:
+        # Use to_thread to avoid blocking event loop with CPU-bound work
+        vectors = await asyncio.to_thread(self._encode_sync, batch)
+        return np.asarray(vectors, dtype=np.float32)
+
+    def _encode_sync(self, batch: list[str]) -> np.ndarray:
+        try:
+            return self._encode_batch(batch)
+        except torch.cuda.OutOfMemoryError:
+            logger.warning(
+                "Out of memory encoding %d texts, falling back to one at a time",
+                len(batch),
+            )
+            torch.cuda.empty_cache()
+            return np.concatenate([self._encode_batch([text]) for text in batch])
 
-def _batch_iter(items: list[str], batch_size: int) -> Iterable[list[str]]:
-    for i in range(0, len(items), batch_size):
-        yield items[i : i + batch_size]
+    def _encode_batch(self, batch: list[str]) -> np.ndarray:
+        # inference_mode skips autograd bookkeeping entirely
+        with torch.inference_mode():
+            return self._model.encode(
+                batch,
+                convert_to_numpy=True,
+                normalize_embeddings=self._normalize,
+                show_progress_bar=False,
+            )
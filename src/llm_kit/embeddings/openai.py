@@ -1,24 +1,71 @@
 import asyncio
+import base64
 import logging
-from time import monotonic
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
+from importlib.util import find_spec
+from time import perf_counter_ns
 from typing import Any
 
-from openai import AsyncOpenAI, OpenAIError
+import httpx
+import numpy as np
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    InternalServerError,
+    RateLimitError,
+)
 from tenacity import (
     AsyncRetrying,
+    RetryCallState,
     before_sleep_log,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 from llm_kit.observability import names
 from llm_kit.observability.base import MetricsHook, NoOpMetricsHook
 
+from ._batching import batch_iter
+from ._cache import EmbeddingCache
 from .base import Embedding, EmbeddingsClient
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 2048
+
+
+# Transient failures only; 4xx errors like bad input fail fast.
+# APITimeoutError is a subclass of APIConnectionError.
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+_MAX_RETRY_WAIT = 30.0
+
+# Jittered so concurrent batches hitting a 429 together don't retry in lockstep
+_jittered_backoff = wait_random_exponential(multiplier=0.5, max=_MAX_RETRY_WAIT)
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1
+_HTTP2 = find_spec("h2") is not None
+
+
+def _wait_for_retry(retry_state: RetryCallState) -> float:
+    """Honor the server's Retry-After on rate limits, else back off with jitter."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, RateLimitError):
+        retry_after = exc.response.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), _MAX_RETRY_WAIT)
+            except ValueError:  # HTTP-date form; fall back to backoff
+                pass
+    return _jittered_backoff(retry_state)
+
+
+def _decode_vector(encoded: str) -> np.ndarray:
+    # base64 payloads are raw little-endian float32, ~4x smaller than JSON floats
+    return np.frombuffer(base64.b64decode(encoded), dtype=np.float32)
+
 
 class OpenAIEmbeddingsClient(EmbeddingsClient):
     def __init__(
@@ -26,8 +73,10 @@ class OpenAIEmbeddingsClient(EmbeddingsClient):
         api_key: str | None = None,
         model: str = "text-embedding-3-small",
         timeout: float = 10,
-        batch_size: int = 100,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_chars: int = 290_000,
         max_concurrent: int = 3,
+        cache_size: int = 0,
         metrics_hook: MetricsHook = NoOpMetricsHook(),
     ):
         """
@@ -37,16 +86,39 @@ class OpenAIEmbeddingsClient(EmbeddingsClient):
             api_key: OpenAI API key. If None, falls back to OPENAI_API_KEY env var.
             model: Embedding model to use.
             timeout: Request timeout in seconds.
-            batch_size: Number of texts to embed per batch.
+            batch_size: Maximum number of texts per request. The API accepts up to
+                2048 inputs; fewer, larger requests amortize HTTP/TLS/JSON overhead.
+            max_batch_chars: Maximum total characters per request. Characters are
+                an upper bound on tokens for most text, so the default keeps
+                requests under the API's 300k tokens-per-request limit.
             max_concurrent: Maximum concurrent API requests. Limits parallelism to avoid
                 rate limiting. Set to 1 for sequential processing.
+            cache_size: Number of texts to keep in an in-memory LRU cache so
+                repeated texts skip the API call. 0 disables caching.
             metrics_hook: Hook for recording metrics.
         """
-        self._client = AsyncOpenAI(api_key=api_key, timeout=timeout)
+        # Keep enough warm HTTP/2 connections for every concurrent batch so
+        # bursts reuse TLS sessions instead of re-handshaking.
+        http_client = DefaultAsyncHttpxClient(
+            http2=_HTTP2,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrent * 4,
+                max_keepalive_connections=max_concurrent * 2,
+                keepalive_expiry=90.0,
+            ),
+        )
+        self._client = AsyncOpenAI(
+            api_key=api_key, timeout=timeout, http_client=http_client
+        )
         self._model = model
         self._batch_size = batch_size
+        self._max_batch_chars = max_batch_chars
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._cache = EmbeddingCache(cache_size) if cache_size else None
         self.metrics_hook = metrics_hook
+        # Skip the metrics calls entirely when nothing would record them
+        self._emit_metrics = not isinstance(metrics_hook, NoOpMetricsHook)
         logger.info(
             "Initialized OpenAIEmbeddingsClient with model=%s, timeout=%s, batch_size=%s, max_concurrent=%s",
             model,
@@ -55,42 +127,108 @@ class OpenAIEmbeddingsClient(EmbeddingsClient):
             max_concurrent,
         )
 
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.close()
+
     async def embed(self, texts: list[str]) -> list[Embedding]:
         if not texts:
             logger.debug("Empty input, returning empty list")
             return []
 
-        start = monotonic()
-        logger.info("Embedding %d texts in batches of %d", len(texts), self._batch_size)
+        if self._cache is None:
+            return await self._embed(texts)
+
+        embeddings, hits = await self._cache.embed(texts, self._embed)
+        if self._emit_metrics:
+            self.metrics_hook.increment(
+                names.EMBEDDINGS_CACHE_HITS, hits, labels={"backend": "openai"}
+            )
+        return embeddings
+
+    async def _embed(self, texts: list[str]) -> list[Embedding]:
+        return [Embedding(vector=row) for row in await self.embed_matrix(texts)]
 
-        # Process all batches concurrently
-        batches = []
-        for batch_start in range(0, len(texts), self._batch_size):
-            end = batch_start + self._batch_size
-            batches.append(texts[batch_start:end])
+    async def embed_matrix(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts into one contiguous ``(len(texts), dim)`` float32 matrix.
+
+        Row ``i`` is the embedding of ``texts[i]``. Bypasses the embedding cache.
+        """
+        matrix: np.ndarray | None = None
+        async with aclosing(self._stream_responses(texts)) as responses:
+            # Batches complete out of order; place each one at its offset
+            async for offset, response in responses:
+                for i, data in enumerate(response.data):
+                    vector = _decode_vector(data.embedding)
+                    if matrix is None:
+                        matrix = np.empty((len(texts), len(vector)), dtype=np.float32)
+                    matrix[offset + i] = vector
+
+        if matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return matrix
+
+    async def embed_stream(
+        self, texts: list[str]
+    ) -> AsyncIterator[tuple[int, list[Embedding]]]:
+        """
+        Yield ``(offset, embeddings)`` per batch as soon as its request completes.
+
+        ``embeddings`` correspond to ``texts[offset : offset + len(embeddings)]``.
+        Batches are yielded in completion order, not input order, so callers can
+        start writing finished batches while the rest are still in flight.
+        Streaming bypasses the embedding cache.
+        """
+        async with aclosing(self._stream_responses(texts)) as responses:
+            async for offset, response in responses:
+                yield (
+                    offset,
+                    [
+                        Embedding(vector=_decode_vector(data.embedding))
+                        for data in response.data
+                    ],
+                )
 
+    async def _stream_responses(
+        self, texts: list[str]
+    ) -> AsyncGenerator[tuple[int, Any], None]:
+        if not texts:
+            return
+
+        start = perf_counter_ns()
+        logger.info("Embedding %d texts in batches of %d", len(texts), self._batch_size)
+
+        batches = list(batch_iter(texts, self._batch_size, self._max_batch_chars))
         logger.debug(
             "Processing %d batches with max %d concurrent",
             len(batches),
             self._semaphore._value,
         )
-        responses = await asyncio.gather(
-            *[self._embed_batch_with_semaphore(batch) for batch in batches]
-        )
+        tasks = [
+            asyncio.create_task(self._embed_batch_at(offset, batch))
+            for offset, batch in batches
+        ]
 
-        # Flatten results
-        embeddings: list[Embedding] = []
-        for response in responses:
-            for data in response.data:
-                embeddings.append(Embedding(vector=data.embedding))
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        elapsed_ms = 1000 * (monotonic() - start)
-        self.metrics_hook.record_latency(names.EMBEDDINGS_OPENAI_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.EMBEDDINGS_REQUESTS_TOTAL, labels={"backend": "openai"}
-        )
-        logger.info("Successfully embedded %d texts", len(embeddings))
-        return embeddings
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(
+                names.EMBEDDINGS_OPENAI_DURATION, elapsed_ms
+            )
+            self.metrics_hook.increment(
+                names.EMBEDDINGS_REQUESTS_TOTAL, labels={"backend": "openai"}
+            )
+        logger.info("Successfully embedded %d texts", len(texts))
+
+    async def _embed_batch_at(self, offset: int, batch: list[str]) -> tuple[int, Any]:
+        return offset, await self._embed_batch_with_semaphore(batch)
 
     async def _embed_batch_with_semaphore(self, batch: list[str]) -> Any:
         """Embed a batch with semaphore to limit concurrent requests."""
@@ -100,8 +238,8 @@ class OpenAIEmbeddingsClient(EmbeddingsClient):
     async def _embed_batch(self, batch: list[str]) -> Any:
         async for attempt in AsyncRetrying(
             stop=stop_after_attempt(3),
-            wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
-            retry=retry_if_exception_type(OpenAIError),
+            wait=_wait_for_retry,
+            retry=retry_if_exception_type(_RETRYABLE_ERRORS),
             before_sleep=before_sleep_log(logger, logging.WARNING),
             reraise=True,
         ):
@@ -109,4 +247,5 @@ class OpenAIEmbeddingsClient(EmbeddingsClient):
                 return await self._client.embeddings.create(
                     model=self._model,
                     input=batch,
+                    encoding_format="base64",
                 )
@@ -22,9 +22,19 @@ Example:
     >>> print(response.content)
 """
 
-from .base import LLMClient, LLMResponse, Message, Role, ToolCall, Usage
+from .base import (
+    LLMClient,
+    LLMResponse,
+    Message,
+    Role,
+    StreamChunk,
+    ToolCall,
+    Usage,
+)
+from .cache import InMemoryLRUCache, ResponseCache, SemanticCache
 from .config import LLMConfig
 from .factory import create_llm_client
+from .http import default_http_client
 
 __all__ = [
     # Factory
@@ -33,10 +43,17 @@ __all__ = [
     "LLMClient",
     # Config
     "LLMConfig",
+    # HTTP
+    "default_http_client",
+    # Caches
+    "ResponseCache",
+    "InMemoryLRUCache",
+    "SemanticCache",
     # Types
     "Message",
     "Role",
     "ToolCall",
     "LLMResponse",
+    "StreamChunk",
     "Usage",
 ]
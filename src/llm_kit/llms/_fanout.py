@@ -0,0 +1,66 @@
+# src/llm_kit/llms/_fanout.py
+
+"""Internal bounded, rate-limited fan-out shared by the LLM clients."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class RateLimiter:
+    """Token bucket allowing ``rate`` acquisitions per ``period`` seconds.
+
+    Bursts of up to ``rate`` pass immediately; after that, acquisitions are
+    spaced evenly. Intended for use from a single event loop.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self._capacity = rate
+        self._tokens = rate
+        self._refill_per_second = rate / period
+        self._updated = monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated) * self._refill_per_second,
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+
+
+async def fan_out(
+    fn: Callable[[T], Awaitable[R]],
+    items: list[T],
+    *,
+    max_concurrency: int,
+    rate_limit_per_min: float | None,
+) -> list[R | BaseException]:
+    """Call ``fn`` on every item with bounded concurrency and an optional rate cap.
+
+    Results are returned in input order; failures are returned, not raised.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limiter = RateLimiter(rate_limit_per_min) if rate_limit_per_min else None
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            if limiter is not None:
+                await limiter.acquire()
+            return await fn(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
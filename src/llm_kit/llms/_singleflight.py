@@ -0,0 +1,37 @@
+# src/llm_kit/llms/_singleflight.py
+
+"""Internal request coalescing for LLM clients.
+
+Concurrent callers sending the same deterministic request share one API call.
+This is infrastructure, not behavior: nothing is cached once the call returns.
+"""
+
+import asyncio
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def request_key(*parts: Any) -> bytes:
+    """Hash JSON-serializable request parts into a compact key."""
+    payload = json.dumps(parts, separators=(",", ":")).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one call per key at a time; concurrent callers share it."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[bytes, asyncio.Future[T]] = {}
+
+    async def do(self, key: bytes, fn: Callable[[], Awaitable[T]]) -> T:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller cancelling doesn't cancel the call for the others
+        return await asyncio.shield(future)
@@ -3,10 +3,58 @@
 """Internal module for converting Tool definitions to provider-specific schemas.
 
 This is infrastructure, not behavior. Pure data transformation.
+
+Schemas are memoized per Tool, since pydantic's model_json_schema() walk is
+expensive and agent loops send the same tools on every call. A cached schema
+is reused only while the tool's name, description and input schema are
+unchanged. The returned dicts are shared and must not be mutated.
 """
 
+from collections.abc import Callable
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+
 from llm_kit.tools.tool import Tool
 
+_Signature = tuple[str, str, type[BaseModel]]
+_SchemaCache = WeakKeyDictionary[Tool, tuple[_Signature, dict[str, Any]]]
+
+_openai_schemas: _SchemaCache = WeakKeyDictionary()
+_anthropic_schemas: _SchemaCache = WeakKeyDictionary()
+
+
+def _cached_schema(
+    tool: Tool, cache: _SchemaCache, build: Callable[[Tool], dict[str, Any]]
+) -> dict[str, Any]:
+    signature = (tool.name, tool.description, tool.input_schema)
+    entry = cache.get(tool)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    schema = build(tool)
+    cache[tool] = (signature, schema)
+    return schema
+
+
+def _openai_tool_schema(tool: Tool) -> dict[str, Any]:
+    return {
+        "type": "function",
+        "function": {
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": tool.input_schema.model_json_schema(),
+        },
+    }
+
+
+def _anthropic_tool_schema(tool: Tool) -> dict[str, Any]:
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "input_schema": tool.input_schema.model_json_schema(),
+    }
+
 
 def tools_to_openai_schema(tools: list[Tool]) -> list[dict]:
     """Convert Tool definitions to OpenAI function calling format.
@@ -18,15 +66,7 @@ def tools_to_openai_schema(tools: list[Tool]) -> list[dict]:
         List of dicts in OpenAI's tool format.
     """
     return [
-        {
-            "type": "function",
-            "function": {
-                "name": tool.name,
-                "description": tool.description,
-                "parameters": tool.input_schema.model_json_schema(),
-            },
-        }
-        for tool in tools
+        _cached_schema(tool, _openai_schemas, _openai_tool_schema) for tool in tools
     ]
 
 
@@ -40,10 +80,6 @@ def tools_to_anthropic_schema(tools: list[Tool]) -> list[dict]:
         List of dicts in Anthropic's tool format.
     """
     return [
-        {
-            "name": tool.name,
-            "description": tool.description,
-            "input_schema": tool.input_schema.model_json_schema(),
-        }
+        _cached_schema(tool, _anthropic_schemas, _anthropic_tool_schema)
         for tool in tools
     ]
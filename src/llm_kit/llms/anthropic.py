@@ -1,9 +1,15 @@
 # src/llm_kit/llms/anthropic.py
 
+import asyncio
 import logging
-from time import monotonic
+import sys
+from collections.abc import AsyncIterator
+from functools import partial
+from time import perf_counter_ns
 from typing import Any, Literal
+from weakref import WeakKeyDictionary
 
+import httpx
 from anthropic import NOT_GIVEN, APIError, AsyncAnthropic
 from tenacity import (
     AsyncRetrying,
@@ -17,11 +23,34 @@ from llm_kit.observability import names
 from llm_kit.observability.base import MetricsHook, NoOpMetricsHook
 from llm_kit.tools.tool import Tool
 
+from ._fanout import fan_out
+from ._singleflight import SingleFlight, request_key
 from ._tool_schema import tools_to_anthropic_schema
-from .base import LLMClient, LLMResponse, Message, Role, ToolCall, Usage
+from .base import (
+    LLMClient,
+    LLMResponse,
+    Message,
+    Role,
+    StreamChunk,
+    ToolCall,
+    Usage,
+)
+from .cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Plain dict lookup instead of the Enum .value descriptor per message
+_ROLE: dict[Role, str] = {role: sys.intern(role.value) for role in Role}
+
+_FINISH_REASONS: dict[str, Literal["stop", "length"]] = {
+    "end_turn": "stop",
+    "max_tokens": "length",
+}
+
+# Anthropic only caches prefixes of at least ~1024 tokens; ~4 chars per token
+_PROMPT_CACHE_MIN_CHARS = 4096
+_EPHEMERAL = {"type": "ephemeral"}
+
 
 class AnthropicLLMClient(LLMClient):
     """Anthropic LLM client.
@@ -35,12 +64,42 @@ class AnthropicLLMClient(LLMClient):
         model: str = "claude-sonnet-4-20250514",
         timeout: float = 30.0,
         max_retries: int = 3,
+        cache: ResponseCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        prompt_caching: bool = False,
         metrics_hook: MetricsHook = NoOpMetricsHook(),
     ):
-        self._client = AsyncAnthropic(api_key=api_key, timeout=timeout)
+        """
+        Initialize Anthropic LLM client.
+
+        Args:
+            api_key: Anthropic API key. If None, falls back to ANTHROPIC_API_KEY.
+            model: Model to use.
+            timeout: Request timeout in seconds.
+            max_retries: Maximum attempts per request.
+            cache: Optional response cache for deterministic requests.
+            http_client: Optional shared HTTP client (see default_http_client).
+            prompt_caching: Mark long system prompts and conversations with
+                cache_control so Anthropic reuses the cached prefix on later
+                calls. Opt-in: a cache write bills 1.25x the base input price
+                and a hit 0.1x, so it only pays off when the same prefix is
+                resent within the cache lifetime (about five minutes).
+            metrics_hook: Hook for recording metrics.
+        """
+        self._client = AsyncAnthropic(
+            api_key=api_key, timeout=timeout, http_client=http_client
+        )
         self._model = model
+        # Pre-bound: the model never changes per client
+        self._create = partial(self._client.messages.create, model=model)
         self._max_retries = max_retries
+        self._inflight: SingleFlight[LLMResponse] = SingleFlight()
+        self._cache = cache
+        self._prompt_caching = prompt_caching
+        self._message_cache: WeakKeyDictionary[Message, dict] = WeakKeyDictionary()
         self.metrics_hook = metrics_hook
+        # Skip the metrics calls entirely when nothing would record them
+        self._emit_metrics = not isinstance(metrics_hook, NoOpMetricsHook)
         logger.info(
             "Initialized AnthropicLLMClient with model=%s, timeout=%s",
             model,
@@ -55,7 +114,7 @@ class AnthropicLLMClient(LLMClient):
         temperature: float = 0.0,
         max_tokens: int | None = None,
     ) -> LLMResponse:
-        start = monotonic()
+        start = perf_counter_ns()
 
         # Extract system message (Anthropic handles it separately)
         system_content, non_system_messages = self._extract_system(messages)
@@ -71,32 +130,97 @@ class AnthropicLLMClient(LLMClient):
             len(tools) if tools else 0,
         )
 
-        raw = await self._call_api(
+        max_tokens = max_tokens or 4096  # Anthropic requires max_tokens
+        if temperature == 0.0:
+            # Deterministic: concurrent identical requests share one API call
+            key = request_key(
+                self._model,
+                system_content,
+                anthropic_messages,
+                anthropic_tools,
+                max_tokens,
+            )
+            if self._cache is not None:
+                # Everything but the messages; semantic matches stay within it
+                scope = request_key(self._model, anthropic_tools, max_tokens)
+                cached = await self._cache.get(key, messages, scope)
+                if cached is not None:
+                    if self._emit_metrics:
+                        self.metrics_hook.increment(
+                            names.LLM_CACHE_HITS,
+                            labels={"provider": "anthropic", "model": self._model},
+                        )
+                    return cached
+
+            response = await self._inflight.do(
+                key,
+                lambda: self._complete(
+                    start,
+                    system=system_content,
+                    messages=anthropic_messages,
+                    tools=anthropic_tools,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                ),
+            )
+            if self._cache is not None and response.finish_reason in (
+                "stop",
+                "tool_calls",
+            ):
+                await self._cache.put(key, messages, scope, response)
+            return response
+
+        return await self._complete(
+            start,
             system=system_content,
             messages=anthropic_messages,
             tools=anthropic_tools,
             temperature=temperature,
-            max_tokens=max_tokens or 4096,  # Anthropic requires max_tokens
+            max_tokens=max_tokens,
+        )
+
+    async def _complete(
+        self,
+        start: int,
+        *,
+        system: str | None,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> LLMResponse:
+        raw = await self._call_api(
+            system=system,
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
         )
 
-        elapsed_ms = 1000 * (monotonic() - start)
+        elapsed_ms = (perf_counter_ns() - start) / 1_000_000
 
         # Normalize immediately - provider objects never escape
         response = self._normalize_response(raw, elapsed_ms)
+        self._record_completion(response, elapsed_ms)
+        return response
 
+    def _record_completion(self, response: LLMResponse, elapsed_ms: float) -> None:
         # Metrics
-        self.metrics_hook.record_latency(names.LLM_COMPLETION_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.LLM_REQUESTS_TOTAL,
-            labels={"provider": "anthropic", "model": self._model},
-        )
-        self.metrics_hook.increment(
-            names.LLM_TOKENS_PROMPT, response.usage.prompt_tokens
-        )
-        self.metrics_hook.increment(
-            names.LLM_TOKENS_COMPLETION, response.usage.completion_tokens
-        )
-        self.metrics_hook.increment(names.LLM_TOKENS_TOTAL, response.usage.total_tokens)
+        if self._emit_metrics:
+            self.metrics_hook.record_latency(names.LLM_COMPLETION_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.LLM_REQUESTS_TOTAL,
+                labels={"provider": "anthropic", "model": self._model},
+            )
+            self.metrics_hook.increment(
+                names.LLM_TOKENS_PROMPT, response.usage.prompt_tokens
+            )
+            self.metrics_hook.increment(
+                names.LLM_TOKENS_COMPLETION, response.usage.completion_tokens
+            )
+            self.metrics_hook.increment(
+                names.LLM_TOKENS_TOTAL, response.usage.total_tokens
+            )
 
         logger.info(
             "Anthropic completion: finish=%s, tokens=%d, latency=%.0fms",
@@ -105,7 +229,194 @@ class AnthropicLLMClient(LLMClient):
             elapsed_ms,
         )
 
-        return response
+    async def stream(
+        self,
+        *,
+        messages: list[Message],
+        tools: list[Tool] | None = None,
+        temperature: float = 0.0,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a completion, yielding text deltas as they arrive.
+
+        The final chunk carries tool calls, finish reason and usage. Not
+        retried and never cached - see ``LLMClient.stream``.
+        """
+        start = perf_counter_ns()
+        system_content, non_system_messages = self._extract_system(messages)
+        anthropic_tools = tools_to_anthropic_schema(tools) if tools else None
+        system = self._system_param(system_content) if system_content else NOT_GIVEN
+
+        async with self._client.messages.stream(
+            model=self._model,
+            messages=self._with_cache_breakpoint(  # type: ignore[arg-type]
+                self._convert_messages(non_system_messages)
+            ),
+            temperature=temperature,
+            max_tokens=max_tokens or 4096,  # Anthropic requires max_tokens
+            system=system,  # type: ignore[arg-type]
+            tools=anthropic_tools if anthropic_tools else NOT_GIVEN,  # type: ignore[arg-type]
+        ) as stream:
+            async for text in stream.text_stream:
+                yield StreamChunk(delta=text)
+            raw = await stream.get_final_message()
+
+        elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+        response = self._normalize_response(raw, elapsed_ms)
+        self._record_completion(response, elapsed_ms)
+        yield StreamChunk(
+            tool_calls=response.tool_calls,
+            finish_reason=response.finish_reason,
+            usage=response.usage,
+        )
+
+    async def complete_many(
+        self,
+        requests: list[list[Message]],
+        *,
+        tools: list[Tool] | None = None,
+        temperature: float = 0.0,
+        max_tokens: int | None = None,
+        max_concurrency: int = 8,
+        rate_limit_per_min: float | None = None,
+    ) -> list[LLMResponse | BaseException]:
+        """Run many independent completions concurrently.
+
+        Wall-clock time is roughly latency × ceil(N / max_concurrency) instead
+        of latency × N. Each completion is a regular complete() call, with its
+        usual retries, caching and metrics.
+
+        Args:
+            requests: One complete message list per completion.
+            tools: Optional list of tools, offered to every completion.
+            temperature: Sampling temperature for every completion.
+            max_tokens: Maximum tokens in each response.
+            max_concurrency: Maximum completions in flight at once.
+            rate_limit_per_min: Maximum completions started per minute.
+                None disables rate limiting.
+
+        Returns:
+            One result per request, in request order. A request that failed
+            after retries yields its exception instead of an LLMResponse, so one
+            failure doesn't discard the rest.
+        """
+        return await fan_out(
+            lambda messages: self.complete(
+                messages=messages,
+                tools=tools,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            ),
+            requests,
+            max_concurrency=max_concurrency,
+            rate_limit_per_min=rate_limit_per_min,
+        )
+
+    async def complete_batch(
+        self,
+        requests: list[list[Message]],
+        *,
+        tools: list[Tool] | None = None,
+        temperature: float = 0.0,
+        max_tokens: int | None = None,
+        poll_interval: float = 30.0,
+    ) -> list[LLMResponse]:
+        """Run many independent completions through the Message Batches API.
+
+        Batch jobs cost half as much as regular requests but may take up to
+        24 hours, so this suits offline work such as dataset evaluation.
+
+        Args:
+            requests: One complete message list per completion.
+            tools: Optional list of tools, offered to every completion.
+            temperature: Sampling temperature for every completion.
+            max_tokens: Maximum tokens in each response.
+            poll_interval: Seconds to wait between batch status checks.
+
+        Returns:
+            One LLMResponse per request, in request order. Requests that failed
+            or did not finish inside the batch have finish_reason="error".
+        """
+        if not requests:
+            return []
+
+        start = perf_counter_ns()
+        anthropic_tools = tools_to_anthropic_schema(tools) if tools else None
+
+        batch_requests = []
+        for i, messages in enumerate(requests):
+            system_content, non_system_messages = self._extract_system(messages)
+            params: dict[str, Any] = {
+                "model": self._model,
+                "messages": self._convert_messages(non_system_messages),
+                "temperature": temperature,
+                "max_tokens": max_tokens or 4096,  # Anthropic requires max_tokens
+            }
+            params["messages"] = self._with_cache_breakpoint(params["messages"])
+            if system_content:
+                params["system"] = self._system_param(system_content)
+            if anthropic_tools:
+                params["tools"] = anthropic_tools
+            batch_requests.append({"custom_id": str(i), "params": params})
+
+        batch = await self._client.messages.batches.create(
+            requests=batch_requests  # type: ignore[arg-type]
+        )
+        logger.info(
+            "Submitted Anthropic batch %s with %d requests", batch.id, len(requests)
+        )
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(poll_interval)
+            batch = await self._client.messages.batches.retrieve(batch.id)
+
+        # Results arrive in any order; route them back by custom_id
+        messages_by_index: dict[int, Any] = {}
+        async for entry in await self._client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                messages_by_index[int(entry.custom_id)] = entry.result.message
+
+        elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+        responses = [
+            self._normalize_response(messages_by_index[i], elapsed_ms)
+            if i in messages_by_index
+            else LLMResponse(
+                content=None,
+                tool_calls=[],
+                finish_reason="error",
+                usage=Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+                latency_ms=elapsed_ms,
+            )
+            for i in range(len(requests))
+        ]
+
+        # Metrics
+        if self._emit_metrics:
+            self.metrics_hook.record_latency(names.LLM_COMPLETION_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.LLM_REQUESTS_TOTAL,
+                len(requests),
+                labels={"provider": "anthropic", "model": self._model},
+            )
+            self.metrics_hook.increment(
+                names.LLM_TOKENS_PROMPT, sum(r.usage.prompt_tokens for r in responses)
+            )
+            self.metrics_hook.increment(
+                names.LLM_TOKENS_COMPLETION,
+                sum(r.usage.completion_tokens for r in responses),
+            )
+            self.metrics_hook.increment(
+                names.LLM_TOKENS_TOTAL, sum(r.usage.total_tokens for r in responses)
+            )
+
+        logger.info(
+            "Anthropic batch %s: succeeded=%d/%d",
+            batch.id,
+            len(messages_by_index),
+            len(requests),
+        )
+
+        return responses
 
     async def _call_api(
         self,
@@ -116,7 +427,11 @@ class AnthropicLLMClient(LLMClient):
         temperature: float,
         max_tokens: int,
     ) -> Any:
-        """Call Anthropic API with transport-only retries."""
+        """Call Anthropic API with transport-only retries.
+
+        Anthropic documents no idempotency header, so a retry after a timeout
+        can run the request twice.
+        """
         async for attempt in AsyncRetrying(
             stop=stop_after_attempt(3),
             wait=wait_exponential(multiplier=0.5, min=0.5, max=10),
@@ -125,15 +440,48 @@ class AnthropicLLMClient(LLMClient):
             reraise=True,
         ):
             with attempt:
-                return await self._client.messages.create(
-                    model=self._model,
-                    messages=messages,  # type: ignore[arg-type]
+                return await self._create(
+                    messages=self._with_cache_breakpoint(messages),  # type: ignore[arg-type]
                     temperature=temperature,
                     max_tokens=max_tokens,
-                    system=system if system else NOT_GIVEN,
-                    tools=tools if tools else NOT_GIVEN,  # type: ignore[arg-type]
+                    system=self._system_param(system) if system else NOT_GIVEN,
+                    tools=tools or NOT_GIVEN,
                 )
 
+    def _system_param(self, system: str) -> str | list[dict[str, Any]]:
+        """Send a long system prompt as a cacheable text block."""
+        if not self._prompt_caching or len(system) < _PROMPT_CACHE_MIN_CHARS:
+            return system
+        return [{"type": "text", "text": system, "cache_control": _EPHEMERAL}]
+
+    def _with_cache_breakpoint(
+        self, messages: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Mark the last message of a long conversation with cache_control.
+
+        The next call resending this history then reads it from Anthropic's
+        prompt cache. One breakpoint per request stays well under the API's
+        limit of four. Converted messages are shared, so the last one is copied.
+        """
+        if not self._prompt_caching or not messages:
+            return messages
+        total_chars = sum(
+            len(m["content"])
+            if isinstance(m["content"], str)
+            else sum(len(str(block.get("content", ""))) for block in m["content"])
+            for m in messages
+        )
+        if total_chars < _PROMPT_CACHE_MIN_CHARS:
+            return messages
+
+        last = messages[-1]
+        content = last["content"]
+        if isinstance(content, str):
+            blocks = [{"type": "text", "text": content, "cache_control": _EPHEMERAL}]
+        else:
+            blocks = [*content[:-1], {**content[-1], "cache_control": _EPHEMERAL}]
+        return [*messages[:-1], {**last, "content": blocks}]
+
     def _extract_system(
         self, messages: list[Message]
     ) -> tuple[str | None, list[Message]]:
@@ -155,27 +503,32 @@ class AnthropicLLMClient(LLMClient):
     def _convert_messages(self, messages: list[Message]) -> list[dict]:
         """Convert Message objects to Anthropic format.
 
-        Internal only. Provider format never leaks outside.
+        Internal only. Provider format never leaks outside. Conversions are
+        memoized per Message, so the resent history of a multi-turn loop is
+        not rebuilt on every call; the returned dicts must not be mutated.
         """
-        result = []
-        for m in messages:
-            if m.role == Role.TOOL:
-                # Anthropic tool results have a different structure
-                result.append(
+        # Cache hits dominate in agent loops; keep that path a single lookup
+        cached = self._message_cache.get
+        return [cached(m) or self._convert_message(m) for m in messages]
+
+    def _convert_message(self, m: Message) -> dict:
+        msg: dict
+        if m.role == Role.TOOL:
+            # Anthropic tool results have a different structure
+            msg = {
+                "role": "user",
+                "content": [
                     {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": m.tool_call_id,
-                                "content": m.content,
-                            }
-                        ],
+                        "type": "tool_result",
+                        "tool_use_id": m.tool_call_id,
+                        "content": m.content,
                     }
-                )
-            else:
-                result.append({"role": m.role.value, "content": m.content})
-        return result
+                ],
+            }
+        else:
+            msg = {"role": _ROLE[m.role], "content": m.content}
+        self._message_cache[m] = msg
+        return msg
 
     def _normalize_response(self, raw: Any, latency_ms: float) -> LLMResponse:
         """Normalize Anthropic response to LLMResponse.
@@ -199,15 +552,11 @@ class AnthropicLLMClient(LLMClient):
                 )
 
         # Map finish reason
-        finish_reason: Literal["stop", "tool_calls", "length", "error"]
-        if tool_calls:
-            finish_reason = "tool_calls"
-        elif raw.stop_reason == "end_turn":
-            finish_reason = "stop"
-        elif raw.stop_reason == "max_tokens":
-            finish_reason = "length"
-        else:
-            finish_reason = "error"
+        finish_reason: Literal["stop", "tool_calls", "length", "error"] = (
+            "tool_calls"
+            if tool_calls
+            else _FINISH_REASONS.get(raw.stop_reason, "error")
+        )
 
         return LLMResponse(
             content=text_content,
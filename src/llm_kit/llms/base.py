@@ -1,8 +1,9 @@
 # src/llm_kit/llms/base.py
 
-from dataclasses import dataclass
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Literal, Protocol
+from typing import Any, Literal, NamedTuple, Protocol
 
 from llm_kit.observability.base import MetricsHook
 from llm_kit.tools.tool import Tool
@@ -17,11 +18,12 @@ class Role(str, Enum):
     TOOL = "tool"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Message:
     """A single message in the conversation.
 
-    Immutable. Stateless. Provider-agnostic.
+    Immutable. Stateless. Provider-agnostic. Slotted, with a weakref slot so
+    clients can memoize per-message provider conversions.
     """
 
     role: Role
@@ -29,11 +31,11 @@ class Message:
     tool_call_id: str | None = None  # Required when role=TOOL
 
 
-@dataclass(frozen=True)
-class ToolCall:
+class ToolCall(NamedTuple):
     """Normalized tool call from LLM response.
 
     Provider-agnostic representation. Never exposes raw provider objects.
+    A NamedTuple: built once per tool-use block, so construction cost matters.
     """
 
     id: str
@@ -41,8 +43,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass(frozen=True)
-class Usage:
+class Usage(NamedTuple):
     """Token usage for a completion."""
 
     prompt_tokens: int
@@ -50,7 +51,7 @@ class Usage:
     total_tokens: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMResponse:
     """Normalized LLM response.
 
@@ -65,6 +66,20 @@ class LLMResponse:
     latency_ms: float
 
 
+@dataclass(frozen=True, slots=True)
+class StreamChunk:
+    """One increment of a streamed completion.
+
+    Intermediate chunks carry only a text ``delta``. The final chunk carries
+    the complete ``tool_calls``, ``finish_reason`` and ``usage``.
+    """
+
+    delta: str = ""
+    tool_calls: list[ToolCall] = field(default_factory=list)
+    finish_reason: Literal["stop", "tool_calls", "length", "error"] | None = None
+    usage: Usage | None = None
+
+
 class LLMClient(Protocol):
     """Protocol for LLM clients.
 
@@ -104,3 +119,22 @@ class LLMClient(Protocol):
             Never retries on "bad" model output - that's the caller's problem.
         """
         ...
+
+    def stream(
+        self,
+        *,
+        messages: list[Message],
+        tools: list[Tool] | None = None,
+        temperature: float = 0.0,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Streamed completion. Same arguments as ``complete``.
+
+        Yields text deltas as they arrive, then one final chunk with tool
+        calls, finish reason and usage.
+
+        Note:
+            Streams are never retried once started - a partial response has
+            already been handed to the caller.
+        """
+        ...
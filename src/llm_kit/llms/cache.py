@@ -0,0 +1,208 @@
+# src/llm_kit/llms/cache.py
+
+"""Response caches for LLM clients.
+
+Clients only consult a cache for deterministic requests (temperature=0) and
+only store complete responses (finish_reason "stop" or "tool_calls").
+Cached responses are returned as-is, including their original latency_ms.
+"""
+
+import math
+from collections import OrderedDict
+from collections.abc import Callable
+from time import monotonic
+from typing import Protocol
+
+import numpy as np
+
+from llm_kit.embeddings.base import EmbeddingsClient
+
+from .base import LLMResponse, Message
+
+
+class ResponseCache(Protocol):
+    """Protocol for LLM response caches.
+
+    ``key`` is a digest of the full normalized request (model, messages, tools,
+    max_tokens). ``scope`` digests the same request without its messages, and
+    ``messages`` is the original conversation, for caches that match on
+    content rather than on the exact request: such matches must stay within
+    one scope, so a response is never served to a request for another model,
+    tool set or token limit.
+    """
+
+    async def get(
+        self, key: bytes, messages: list[Message], scope: bytes
+    ) -> LLMResponse | None:
+        """Return a cached response for the request, or None on a miss."""
+        ...
+
+    async def put(
+        self,
+        key: bytes,
+        messages: list[Message],
+        scope: bytes,
+        response: LLMResponse,
+    ) -> None:
+        """Store a response for the request."""
+        ...
+
+
+class InMemoryLRUCache(ResponseCache):
+    """Exact-match LRU cache with an optional time-to-live.
+
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: float | None = None,
+        on_evict: Callable[[bytes], None] | None = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached responses.
+            ttl: Seconds a response stays valid. None keeps it until evicted.
+            on_evict: Called with the key of each entry dropped for age or
+                size. Not called when an entry is replaced under its own key.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._on_evict = on_evict
+        self._entries: OrderedDict[bytes, tuple[float, LLMResponse]] = OrderedDict()
+
+    async def get(
+        self,
+        key: bytes,
+        messages: list[Message],  # noqa: ARG002
+        scope: bytes,  # noqa: ARG002
+    ) -> LLMResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at < monotonic():
+            del self._entries[key]
+            if self._on_evict is not None:
+                self._on_evict(key)
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    async def put(
+        self,
+        key: bytes,
+        messages: list[Message],  # noqa: ARG002
+        scope: bytes,  # noqa: ARG002
+        response: LLMResponse,
+    ) -> None:
+        expires_at = monotonic() + self._ttl if self._ttl is not None else math.inf
+        self._entries[key] = (expires_at, response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            evicted, _ = self._entries.popitem(last=False)
+            if self._on_evict is not None:
+                self._on_evict(evicted)
+
+
+class SemanticCache(ResponseCache):
+    """Two-tier cache: exact request match first, then embedding similarity.
+
+    On an exact miss, the conversation text is embedded and compared by cosine
+    similarity against previously cached conversations with the same scope;
+    the most similar one at or above ``threshold`` is a hit. Similarity search
+    is a brute-force matrix product, which is fast for the few thousand
+    entries kept here. Index rows are dropped as soon as their exact entry is
+    evicted or expires, so every row points at a live response.
+
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(
+        self,
+        embeddings: EmbeddingsClient,
+        threshold: float = 0.97,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            embeddings: Client used to embed conversation text.
+            threshold: Minimum cosine similarity for a semantic hit.
+            maxsize: Maximum number of cached responses.
+            ttl: Seconds a response stays valid. None keeps it until evicted.
+        """
+        self._embeddings = embeddings
+        self._threshold = threshold
+        self._exact = InMemoryLRUCache(maxsize=maxsize, ttl=ttl, on_evict=self._forget)
+        # Unit-norm vectors of cached requests, grouped by scope; each scope's
+        # stacked (keys, matrix) is rebuilt lazily after it changes
+        self._index: dict[bytes, dict[bytes, np.ndarray]] = {}
+        self._stacked: dict[bytes, tuple[list[bytes], np.ndarray]] = {}
+        self._scopes: dict[bytes, bytes] = {}
+
+    async def get(
+        self, key: bytes, messages: list[Message], scope: bytes
+    ) -> LLMResponse | None:
+        response = await self._exact.get(key, messages, scope)
+        if response is not None or scope not in self._index:
+            return response
+
+        query = await self._embed(messages)
+        # The scope may have emptied while the embedding call was in flight
+        if scope not in self._index:
+            return None
+        keys, matrix = self._matrix(scope)
+        scores = matrix @ query
+        best = int(np.argmax(scores))
+        if scores[best] < self._threshold:
+            return None
+        return await self._exact.get(keys[best], messages, scope)
+
+    async def put(
+        self,
+        key: bytes,
+        messages: list[Message],
+        scope: bytes,
+        response: LLMResponse,
+    ) -> None:
+        # Embed before storing: nothing may be evicted between storing the
+        # response and indexing it. An indexed key keeps its row, since the
+        # same key means the same messages.
+        vector = None if key in self._scopes else await self._embed(messages)
+        await self._exact.put(key, messages, scope, response)
+        if vector is not None and key not in self._scopes:
+            self._scopes[key] = scope
+            self._index.setdefault(scope, {})[key] = vector
+            self._stacked.pop(scope, None)
+
+    def _forget(self, key: bytes) -> None:
+        scope = self._scopes.pop(key, None)
+        if scope is None:
+            return
+        rows = self._index[scope]
+        del rows[key]
+        if not rows:
+            del self._index[scope]
+        self._stacked.pop(scope, None)
+
+    def _matrix(self, scope: bytes) -> tuple[list[bytes], np.ndarray]:
+        stacked = self._stacked.get(scope)
+        if stacked is None:
+            rows = self._index[scope]
+            stacked = (list(rows), np.stack(list(rows.values())))
+            self._stacked[scope] = stacked
+        return stacked
+
+    async def _embed(self, messages: list[Message]) -> np.ndarray:
+        text = "\n".join(f"{m.role.value}: {m.content}" for m in messages)
+        (embedding,) = await self._embeddings.embed([text])
+        vector: np.ndarray = embedding.vector / np.linalg.norm(embedding.vector)
+        return vector
@@ -1,10 +1,19 @@
 # src/llm_kit/llms/factory.py
 
+import importlib
+
 from llm_kit.observability.base import MetricsHook, NoOpMetricsHook
 
 from .base import LLMClient
 from .config import LLMConfig
 
+# provider -> (module, class). Modules are imported on first use so a process
+# only pays the import cost of the provider SDKs it actually uses.
+_REGISTRY: dict[str, tuple[str, str]] = {
+    "openai": ("llm_kit.llms.openai", "OpenAILLMClient"),
+    "anthropic": ("llm_kit.llms.anthropic", "AnthropicLLMClient"),
+}
+
 
 def create_llm_client(
     config: LLMConfig,
@@ -27,26 +36,17 @@ def create_llm_client(
         >>> client = create_llm_client(config)
         >>> response = client.complete(messages=[...])
     """
-    if config.provider == "openai":
-        from .openai import OpenAILLMClient
-
-        return OpenAILLMClient(
-            api_key=config.api_key,
-            model=config.model,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-            metrics_hook=metrics_hook,
-        )
-
-    if config.provider == "anthropic":
-        from .anthropic import AnthropicLLMClient
-
-        return AnthropicLLMClient(
-            api_key=config.api_key,
-            model=config.model,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-            metrics_hook=metrics_hook,
-        )
-
-    raise ValueError(f"Unknown LLM provider: {config.provider}")
+    try:
+        module_name, class_name = _REGISTRY[config.provider]
+    except KeyError:
+        raise ValueError(f"Unknown LLM provider: {config.provider}") from None
+
+    client_cls = getattr(importlib.import_module(module_name), class_name)
+    client: LLMClient = client_cls(
+        api_key=config.api_key,
+        model=config.model,
+        timeout=config.timeout,
+        max_retries=config.max_retries,
+        metrics_hook=metrics_hook,
+    )
+    return client
@@ -0,0 +1,37 @@
+# src/llm_kit/llms/http.py
+
+"""Shared HTTP connection pool for LLM clients.
+
+Each provider SDK otherwise creates its own small connection pool per client.
+Sharing one tuned pool lets fan-out workloads reuse warm TLS connections and
+multiplex requests over HTTP/2 instead of queueing for a free connection.
+"""
+
+from importlib.util import find_spec
+
+import httpx
+
+# httpx only speaks HTTP/2 with the optional h2 package (httpx[http2]);
+# without it the pool falls back to HTTP/1.1 rather than failing to start
+_HTTP2 = find_spec("h2") is not None
+
+_default_client: httpx.AsyncClient | None = None
+
+
+def default_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use.
+
+    Pass it as ``http_client`` to any number of LLM clients. The client is
+    tied to the event loop that first uses it; close it with ``aclose()`` on
+    shutdown.
+    """
+    global _default_client
+    if _default_client is None or _default_client.is_closed:
+        _default_client = httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+            ),
+        )
+    return _default_client
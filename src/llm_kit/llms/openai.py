@@ -1,11 +1,18 @@
 # src/llm_kit/llms/openai.py
 
+import asyncio
 import json
 import logging
-from time import monotonic
+import sys
+from collections.abc import AsyncIterator
+from functools import partial
+from time import perf_counter_ns
 from typing import Any, Literal
+from weakref import WeakKeyDictionary
 
+import httpx
 from openai import NOT_GIVEN, AsyncOpenAI, OpenAIError
+from openai.types.chat import ChatCompletion
 from tenacity import (
     AsyncRetrying,
     before_sleep_log,
@@ -18,11 +25,52 @@ from llm_kit.observability import names
 from llm_kit.observability.base import MetricsHook, NoOpMetricsHook
 from llm_kit.tools.tool import Tool
 
+from ._fanout import fan_out
+from ._singleflight import SingleFlight, request_key
 from ._tool_schema import tools_to_openai_schema
-from .base import LLMClient, LLMResponse, Message, ToolCall, Usage
+from .base import (
+    LLMClient,
+    LLMResponse,
+    Message,
+    Role,
+    StreamChunk,
+    ToolCall,
+    Usage,
+)
+from .cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Plain dict lookup instead of the Enum .value descriptor per message
+_ROLE: dict[Role, str] = {role: sys.intern(role.value) for role in Role}
+
+_FINISH_REASONS: dict[str, Literal["stop", "length"]] = {
+    "stop": "stop",
+    "length": "length",
+}
+
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+# Shared decoder: skips json.loads' per-call keyword handling
+_decode_json = json.JSONDecoder().decode
+
+# Compact separators: batch input files are capped at 200MB
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _parse_arguments(raw: str) -> dict[str, Any]:
+    """Parse tool call arguments, tolerating malformed model output."""
+    # No-argument tools are common; skip the parser for them
+    if not raw or raw == "{}":
+        return {}
+    try:
+        arguments = _decode_json(raw)
+    except ValueError:
+        logger.warning("Failed to parse tool call arguments: %s", raw)
+        return {}
+    return arguments if isinstance(arguments, dict) else {}
+
 
 class OpenAILLMClient(LLMClient):
     """OpenAI LLM client.
@@ -36,12 +84,23 @@ class OpenAILLMClient(LLMClient):
         model: str = "gpt-4o",
         timeout: float = 30.0,
         max_retries: int = 3,
+        cache: ResponseCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
         metrics_hook: MetricsHook = NoOpMetricsHook(),
     ):
-        self._client = AsyncOpenAI(api_key=api_key, timeout=timeout)
+        self._client = AsyncOpenAI(
+            api_key=api_key, timeout=timeout, http_client=http_client
+        )
         self._model = model
+        # Pre-bound: the model never changes per client
+        self._create = partial(self._client.chat.completions.create, model=model)
         self._max_retries = max_retries
+        self._inflight: SingleFlight[LLMResponse] = SingleFlight()
+        self._cache = cache
+        self._message_cache: WeakKeyDictionary[Message, dict] = WeakKeyDictionary()
         self.metrics_hook = metrics_hook
+        # Skip the metrics calls entirely when nothing would record them
+        self._emit_metrics = not isinstance(metrics_hook, NoOpMetricsHook)
         logger.info(
             "Initialized OpenAILLMClient with model=%s, timeout=%s",
             model,
@@ -56,7 +115,7 @@ class OpenAILLMClient(LLMClient):
         temperature: float = 0.0,
         max_tokens: int | None = None,
     ) -> LLMResponse:
-        start = monotonic()
+        start = perf_counter_ns()
 
         # Convert to provider format (internal only - never leaks)
         openai_messages = self._convert_messages(messages)
@@ -69,31 +128,86 @@ class OpenAILLMClient(LLMClient):
             len(tools) if tools else 0,
         )
 
-        raw = await self._call_api(
+        if temperature == 0.0:
+            # Deterministic: concurrent identical requests share one API call
+            key = request_key(self._model, openai_messages, openai_tools, max_tokens)
+            if self._cache is not None:
+                # Everything but the messages; semantic matches stay within it
+                scope = request_key(self._model, openai_tools, max_tokens)
+                cached = await self._cache.get(key, messages, scope)
+                if cached is not None:
+                    if self._emit_metrics:
+                        self.metrics_hook.increment(
+                            names.LLM_CACHE_HITS,
+                            labels={"provider": "openai", "model": self._model},
+                        )
+                    return cached
+
+            response = await self._inflight.do(
+                key,
+                lambda: self._complete(
+                    start,
+                    messages=openai_messages,
+                    tools=openai_tools,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                ),
+            )
+            if self._cache is not None and response.finish_reason in (
+                "stop",
+                "tool_calls",
+            ):
+                await self._cache.put(key, messages, scope, response)
+            return response
+
+        return await self._complete(
+            start,
             messages=openai_messages,
             tools=openai_tools,
             temperature=temperature,
             max_tokens=max_tokens,
         )
 
-        elapsed_ms = 1000 * (monotonic() - start)
+    async def _complete(
+        self,
+        start: int,
+        *,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        temperature: float,
+        max_tokens: int | None,
+    ) -> LLMResponse:
+        raw = await self._call_api(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+        elapsed_ms = (perf_counter_ns() - start) / 1_000_000
 
         # Normalize immediately - provider objects never escape
         response = self._normalize_response(raw, elapsed_ms)
+        self._record_completion(response, elapsed_ms)
+        return response
 
+    def _record_completion(self, response: LLMResponse, elapsed_ms: float) -> None:
         # Metrics
-        self.metrics_hook.record_latency(names.LLM_COMPLETION_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.LLM_REQUESTS_TOTAL,
-            labels={"provider": "openai", "model": self._model},
-        )
-        self.metrics_hook.increment(
-            names.LLM_TOKENS_PROMPT, response.usage.prompt_tokens
-        )
-        self.metrics_hook.increment(
-            names.LLM_TOKENS_COMPLETION, response.usage.completion_tokens
-        )
-        self.metrics_hook.increment(names.LLM_TOKENS_TOTAL, response.usage.total_tokens)
+        if self._emit_metrics:
+            self.metrics_hook.record_latency(names.LLM_COMPLETION_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.LLM_REQUESTS_TOTAL,
+                labels={"provider": "openai", "model": self._model},
+            )
+            self.metrics_hook.increment(
+                names.LLM_TOKENS_PROMPT, response.usage.prompt_tokens
+            )
+            self.metrics_hook.increment(
+                names.LLM_TOKENS_COMPLETION, response.usage.completion_tokens
+            )
+            self.metrics_hook.increment(
+                names.LLM_TOKENS_TOTAL, response.usage.total_tokens
+            )
 
         logger.info(
             "OpenAI completion: finish=%s, tokens=%d, latency=%.0fms",
@@ -102,7 +216,215 @@ class OpenAILLMClient(LLMClient):
             elapsed_ms,
         )
 
-        return response
+    async def stream(
+        self,
+        *,
+        messages: list[Message],
+        tools: list[Tool] | None = None,
+        temperature: float = 0.0,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a completion, yielding text deltas as they arrive.
+
+        The final chunk carries tool calls, finish reason and usage. Not
+        retried and never cached - see ``LLMClient.stream``.
+        """
+        start = perf_counter_ns()
+        openai_tools = tools_to_openai_schema(tools) if tools else None
+
+        async with self._client.chat.completions.stream(
+            model=self._model,
+            messages=self._convert_messages(messages),  # type: ignore[arg-type]
+            temperature=temperature,
+            tools=openai_tools if openai_tools else NOT_GIVEN,  # type: ignore[arg-type]
+            max_tokens=max_tokens if max_tokens else NOT_GIVEN,  # type: ignore[arg-type]
+            stream_options={"include_usage": True},
+        ) as stream:
+            async for event in stream:
+                if event.type == "content.delta":
+                    yield StreamChunk(delta=event.delta)
+            raw = await stream.get_final_completion()
+
+        elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+        response = self._normalize_response(raw, elapsed_ms)
+        self._record_completion(response, elapsed_ms)
+        yield StreamChunk(
+            tool_calls=response.tool_calls,
+            finish_reason=response.finish_reason,
+            usage=response.usage,
+        )
+
+    async def complete_many(
+        self,
+        requests: list[list[Message]],
+        *,
+        tools: list[Tool] | None = None,
+        temperature: float = 0.0,
+        max_tokens: int | None = None,
+        max_concurrency: int = 8,
+        rate_limit_per_min: float | None = None,
+    ) -> list[LLMResponse | BaseException]:
+        """Run many independent completions concurrently.
+
+        Wall-clock time is roughly latency × ceil(N / max_concurrency) instead
+        of latency × N. Each completion is a regular complete() call, with its
+        usual retries, caching and metrics.
+
+        Args:
+            requests: One complete message list per completion.
+            tools: Optional list of tools, offered to every completion.
+            temperature: Sampling temperature for every completion.
+            max_tokens: Maximum tokens in each response.
+            max_concurrency: Maximum completions in flight at once.
+            rate_limit_per_min: Maximum completions started per minute.
+                None disables rate limiting.
+
+        Returns:
+            One result per request, in request order. A request that failed
+            after retries yields its exception instead of an LLMResponse, so one
+            failure doesn't discard the rest.
+        """
+        return await fan_out(
+            lambda messages: self.complete(
+                messages=messages,
+                tools=tools,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            ),
+            requests,
+            max_concurrency=max_concurrency,
+            rate_limit_per_min=rate_limit_per_min,
+        )
+
+    async def complete_batch(
+        self,
+        requests: list[list[Message]],
+        *,
+        tools: list[Tool] | None = None,
+        temperature: float = 0.0,
+        max_tokens: int | None = None,
+        poll_interval: float = 30.0,
+    ) -> list[LLMResponse]:
+        """Run many independent completions through the OpenAI Batch API.
+
+        Batch jobs cost half as much as regular requests but may take up to
+        24 hours, so this suits offline work such as dataset evaluation.
+
+        Args:
+            requests: One complete message list per completion.
+            tools: Optional list of tools, offered to every completion.
+            temperature: Sampling temperature for every completion.
+            max_tokens: Maximum tokens in each response.
+            poll_interval: Seconds to wait between batch status checks.
+
+        Returns:
+            One LLMResponse per request, in request order. Requests that failed
+            or did not finish inside the batch have finish_reason="error".
+
+        Raises:
+            RuntimeError: If OpenAI rejects the batch as a whole.
+        """
+        if not requests:
+            return []
+
+        start = perf_counter_ns()
+        openai_tools = tools_to_openai_schema(tools) if tools else None
+
+        # Encode straight into one bytes buffer instead of joining str lines
+        payload = bytearray()
+        for i, messages in enumerate(requests):
+            body: dict[str, Any] = {
+                "model": self._model,
+                "messages": self._convert_messages(messages),
+                "temperature": temperature,
+            }
+            if openai_tools:
+                body["tools"] = openai_tools
+            if max_tokens:
+                body["max_tokens"] = max_tokens
+            payload += _encode_json(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body,
+                }
+            ).encode()
+            payload += b"\n"
+
+        input_file = await self._client.files.create(
+            file=("batch.jsonl", bytes(payload)), purpose="batch"
+        )
+        batch = await self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info(
+            "Submitted OpenAI batch %s with %d requests", batch.id, len(requests)
+        )
+
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await self._client.batches.retrieve(batch.id)
+
+        if batch.status == "failed":
+            raise RuntimeError(f"OpenAI batch {batch.id} failed: {batch.errors}")
+
+        # Output lines arrive in any order; route them back by custom_id
+        completions: dict[int, ChatCompletion] = {}
+        if batch.output_file_id:
+            output = await self._client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                result = json.loads(line)
+                response = result.get("response")
+                if response and response["status_code"] == 200:
+                    completions[int(result["custom_id"])] = (
+                        ChatCompletion.model_validate(response["body"])
+                    )
+
+        elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+        responses = [
+            self._normalize_response(completions[i], elapsed_ms)
+            if i in completions
+            else LLMResponse(
+                content=None,
+                tool_calls=[],
+                finish_reason="error",
+                usage=Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+                latency_ms=elapsed_ms,
+            )
+            for i in range(len(requests))
+        ]
+
+        # Metrics
+        if self._emit_metrics:
+            self.metrics_hook.record_latency(names.LLM_COMPLETION_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.LLM_REQUESTS_TOTAL,
+                len(requests),
+                labels={"provider": "openai", "model": self._model},
+            )
+            self.metrics_hook.increment(
+                names.LLM_TOKENS_PROMPT, sum(r.usage.prompt_tokens for r in responses)
+            )
+            self.metrics_hook.increment(
+                names.LLM_TOKENS_COMPLETION,
+                sum(r.usage.completion_tokens for r in responses),
+            )
+            self.metrics_hook.increment(
+                names.LLM_TOKENS_TOTAL, sum(r.usage.total_tokens for r in responses)
+            )
+
+        logger.info(
+            "OpenAI batch %s: status=%s, succeeded=%d/%d",
+            batch.id,
+            batch.status,
+            len(completions),
+            len(requests),
+        )
+
+        return responses
 
     async def _call_api(
         self,
@@ -112,7 +434,11 @@ class OpenAILLMClient(LLMClient):
         temperature: float,
         max_tokens: int | None,
     ) -> Any:
-        """Call OpenAI API with transport-only retries."""
+        """Call OpenAI API with transport-only retries.
+
+        OpenAI documents no request deduplication for chat completions, so a
+        retry after a timeout can run the request twice.
+        """
         async for attempt in AsyncRetrying(
             stop=stop_after_attempt(3),
             wait=wait_exponential(multiplier=0.5, min=0.5, max=10),
@@ -121,26 +447,30 @@ class OpenAILLMClient(LLMClient):
             reraise=True,
         ):
             with attempt:
-                return await self._client.chat.completions.create(
-                    model=self._model,
+                return await self._create(
                     messages=messages,  # type: ignore[arg-type]
                     temperature=temperature,
-                    tools=tools if tools else NOT_GIVEN,  # type: ignore[arg-type]
-                    max_tokens=max_tokens if max_tokens else NOT_GIVEN,  # type: ignore[arg-type]
+                    tools=tools or NOT_GIVEN,
+                    max_tokens=max_tokens or NOT_GIVEN,
                 )
 
     def _convert_messages(self, messages: list[Message]) -> list[dict]:
         """Convert Message objects to OpenAI format.
 
-        Internal only. Provider format never leaks outside.
+        Internal only. Provider format never leaks outside. Conversions are
+        memoized per Message, so the resent history of a multi-turn loop is
+        not rebuilt on every call; the returned dicts must not be mutated.
         """
-        result = []
-        for m in messages:
-            msg: dict = {"role": m.role.value, "content": m.content}
-            if m.tool_call_id:
-                msg["tool_call_id"] = m.tool_call_id
-            result.append(msg)
-        return result
+        # Cache hits dominate in agent loops; keep that path a single lookup
+        cached = self._message_cache.get
+        return [cached(m) or self._convert_message(m) for m in messages]
+
+    def _convert_message(self, m: Message) -> dict:
+        msg = {"role": _ROLE[m.role], "content": m.content}
+        if m.tool_call_id:
+            msg["tool_call_id"] = m.tool_call_id
+        self._message_cache[m] = msg
+        return msg
 
     def _normalize_response(self, raw: Any, latency_ms: float) -> LLMResponse:
         """Normalize OpenAI response to LLMResponse.
@@ -153,14 +483,7 @@ class OpenAILLMClient(LLMClient):
         tool_calls: list[ToolCall] = []
         if choice.message.tool_calls:
             for tc in choice.message.tool_calls:
-                try:
-                    arguments = json.loads(tc.function.arguments)
-                except json.JSONDecodeError:
-                    logger.warning(
-                        "Failed to parse tool call arguments: %s",
-                        tc.function.arguments,
-                    )
-                    arguments = {}
+                arguments = _parse_arguments(tc.function.arguments)
 
                 tool_calls.append(
                     ToolCall(
@@ -171,15 +494,11 @@ class OpenAILLMClient(LLMClient):
                 )
 
         # Map finish reason
-        finish_reason: Literal["stop", "tool_calls", "length", "error"]
-        if tool_calls:
-            finish_reason = "tool_calls"
-        elif choice.finish_reason == "stop":
-            finish_reason = "stop"
-        elif choice.finish_reason == "length":
-            finish_reason = "length"
-        else:
-            finish_reason = "error"
+        finish_reason: Literal["stop", "tool_calls", "length", "error"] = (
+            "tool_calls"
+            if tool_calls
+            else _FINISH_REASONS.get(choice.finish_reason, "error")
+        )
 
         return LLMResponse(
             content=choice.message.content,
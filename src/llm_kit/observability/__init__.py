@@ -1,8 +1,9 @@
 from . import names
-from .base import MetricsHook, NoOpMetricsHook
+from .base import MetricsHook, NoOpMetricsHook, ToolCallMetricsHook
 
 __all__ = [
     "MetricsHook",
     "NoOpMetricsHook",
+    "ToolCallMetricsHook",
     "names",
 ]
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 
 class MetricsHook(Protocol):
@@ -24,6 +24,23 @@ class MetricsHook(Protocol):
     ) -> None: ...
 
 
+@runtime_checkable
+class ToolCallMetricsHook(Protocol):
+    """Optional extension recording a tool call's latency and count together.
+
+    ToolEngine uses ``record_call`` when the hook implements it; any other
+    MetricsHook gets ``record_latency`` followed by ``increment``.
+    """
+
+    def record_call(
+        self,
+        latency_name: str,
+        counter_name: str,
+        value_ms: float,
+        labels: dict[str, str] | None = None,
+    ) -> None: ...
+
+
 class NoOpMetricsHook:
     def record_latency(
         self, name: str, value_ms: float, labels: dict[str, str] | None = None
@@ -19,6 +19,7 @@ LLM_COMPLETION_DURATION = "llm_completion_duration"
 # Counters
 LLM_REQUESTS_TOTAL = "llm_requests_total"
 LLM_ERRORS_TOTAL = "llm_errors_total"
+LLM_CACHE_HITS = "llm_cache_hits"
 
 # Counters (token usage - monotonic over time for cost/rate tracking)
 LLM_TOKENS_PROMPT = "llm_tokens_prompt"
@@ -39,6 +40,7 @@ EMBEDDINGS_LOCAL_DURATION = "local_embeddings_duration"
 # Counters
 EMBEDDINGS_REQUESTS_TOTAL = "embeddings_requests_total"
 EMBEDDINGS_ERRORS_TOTAL = "embeddings_errors_total"
+EMBEDDINGS_CACHE_HITS = "embeddings_cache_hits"
 
 # Gauges
 EMBEDDINGS_BATCH_SIZE = "embeddings_batch_size"
@@ -70,6 +72,7 @@ QDRANT_DELETE_DURATION = "qdrant_delete_duration"
 # Counters
 QDRANT_OPERATIONS_TOTAL = "qdrant_operations_total"
 QDRANT_ERRORS_TOTAL = "qdrant_errors_total"
+QDRANT_CACHE_HITS = "qdrant_cache_hits"
 
 
 # ============================================================================
@@ -1,10 +1,23 @@
+import inspect
 from collections.abc import Callable
-from typing import Any
+from typing import Any, Final
 
 from pydantic import BaseModel
 
 
 class Tool:
+    # Slotted for fast attribute access on the dispatch path; __weakref__
+    # keeps tools usable as keys of the LLM clients' schema caches
+    __slots__ = (
+        "name",
+        "description",
+        "input_schema",
+        "handler",
+        "is_async",
+        "_metric_labels",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         *,
@@ -13,10 +26,14 @@ class Tool:
         input_schema: type[BaseModel],
         handler: Callable,
     ) -> None:
-        self.name = name
+        self.name: Final = name
         self.description = description
         self.input_schema = input_schema
-        self.handler = handler
+        self.handler: Final = handler
+        # Resolved once; ToolEngine branches on it for every call
+        self.is_async: Final = inspect.iscoroutinefunction(handler)
+        # Shared by every metrics call for this tool; never mutated
+        self._metric_labels: Final = {"tool": name}
 
 
 class ToolCall(BaseModel):
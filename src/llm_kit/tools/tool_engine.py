@@ -1,10 +1,14 @@
-import inspect
+import asyncio
 import logging
-from time import monotonic
+from time import perf_counter_ns
 from typing import Any
 
 from llm_kit.observability import names
-from llm_kit.observability.base import MetricsHook, NoOpMetricsHook
+from llm_kit.observability.base import (
+    MetricsHook,
+    NoOpMetricsHook,
+    ToolCallMetricsHook,
+)
 
 from .tool import ToolCall
 from .tool_registry import ToolRegistry
@@ -20,22 +24,58 @@ class ToolEngine:
     ) -> None:
         self.tool_registry = tool_registry
         self.metrics_hook = metrics_hook
+        # Skip the metrics calls entirely when nothing would record them
+        self._emit_metrics = not isinstance(metrics_hook, NoOpMetricsHook)
+        # Hooks without the ToolCallMetricsHook extension get both calls
+        self._record_call = (
+            metrics_hook.record_call
+            if isinstance(metrics_hook, ToolCallMetricsHook)
+            else None
+        )
 
     async def call_tool(self, tool_call: ToolCall) -> Any:
+        return await self._call(tool_call, in_thread=False)
+
+    async def call_tools(self, tool_calls: list[ToolCall]) -> list[Any]:
+        """Run independent tool calls concurrently.
+
+        Async handlers run together on the event loop; sync handlers run in
+        worker threads so they neither block the loop nor each other.
+
+        Returns:
+            One result per call, in input order. A failed call's exception is
+            returned in its place rather than raised.
+        """
+        return await asyncio.gather(
+            *(self._call(tool_call, in_thread=True) for tool_call in tool_calls),
+            return_exceptions=True,
+        )
+
+    async def _call(self, tool_call: ToolCall, *, in_thread: bool) -> Any:
         logger.debug("Calling tool: %s", tool_call.tool_name)
-        start = monotonic()
+        start = perf_counter_ns()
         tool = self.tool_registry.get(tool_call.tool_name)
-        validated_args = tool.input_schema(**tool_call.arguments)
+        handler = tool.handler
+        # Validates the dict directly, without kwargs unpacking through __init__
+        validated_args = tool.input_schema.model_validate(tool_call.arguments)
 
-        # Check if handler is async
-        if inspect.iscoroutinefunction(tool.handler):
-            result = await tool.handler(validated_args)
+        if tool.is_async:
+            result = await handler(validated_args)
+        elif in_thread:
+            result = await asyncio.to_thread(handler, validated_args)
         else:
-            result = tool.handler(validated_args)
+            result = handler(validated_args)
 
-        elapsed_ms = 1000 * (monotonic() - start)
-        self.metrics_hook.record_latency(names.TOOL_CALL_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.TOOL_CALLS_TOTAL, labels={"tool": tool_call.tool_name}
-        )
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            labels = tool._metric_labels
+            if self._record_call is not None:
+                self._record_call(
+                    names.TOOL_CALL_DURATION, names.TOOL_CALLS_TOTAL, elapsed_ms, labels
+                )
+            else:
+                self.metrics_hook.record_latency(
+                    names.TOOL_CALL_DURATION, elapsed_ms, labels
+                )
+                self.metrics_hook.increment(names.TOOL_CALLS_TOTAL, labels=labels)
         return result
@@ -1,4 +1,7 @@
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Final
 
 from .tool import Tool
 
@@ -7,7 +10,8 @@ logger = logging.getLogger(__name__)
 
 class ToolRegistry:
     def __init__(self) -> None:
-        self._tools: dict[str, Tool] = {}
+        self._tools: Final[dict[str, Tool]] = {}
+        self._view: Final = MappingProxyType(self._tools)
 
     def register(self, tool: Tool) -> None:
         if tool.name in self._tools:
@@ -17,20 +21,18 @@ class ToolRegistry:
         logger.debug("Registered tool: %s", tool.name)
 
     def get(self, name: str) -> Tool:
-        try:
-            return self._tools[name]
-        except KeyError:
+        tool = self._tools.get(name)
+        if tool is None:
             logger.error("Tool not found: %s", name)
             raise KeyError(f"Tool '{name}' not found")
+        return tool
 
     def remove(self, name: str) -> None:
-        try:
-            del self._tools[name]
-            logger.debug("Removed tool: %s", name)
-        except KeyError:
+        if self._tools.pop(name, None) is None:
             logger.error("Cannot remove tool, not found: %s", name)
             raise KeyError(f"Tool '{name}' not found")
+        logger.debug("Removed tool: %s", name)
 
-    def list(self) -> dict[str, Tool]:
-        # return a shallow copy to avoid mutation
-        return dict(self._tools)
+    def list(self) -> Mapping[str, Tool]:
+        # read-only live view: reflects later register/remove calls
+        return self._view
@@ -1,14 +1,20 @@
+from ._kernels import cosine_top_k
 from .base import VectorStore
+from .cache import SemanticQueryCache
 from .pgvectorstore import PgVectorStore
 from .qdrantvectorstore import QdrantVectorStore
 from .sqlitevectorstore import SQLiteVectorStore
-from .types import QueryResult, VectorItem
+from .types import QueryResult, QueryRow, VectorItem, VectorItemBatch
 
 __all__ = [
     "PgVectorStore",
     "QdrantVectorStore",
     "SQLiteVectorStore",
+    "SemanticQueryCache",
     "QueryResult",
+    "QueryRow",
     "VectorItem",
+    "VectorItemBatch",
     "VectorStore",
+    "cosine_top_k",
 ]
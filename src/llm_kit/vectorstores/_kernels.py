@@ -0,0 +1,39 @@
+"""Vectorized similarity helpers for client-side reranking."""
+
+import numpy as np
+
+
+def cosine_top_k(
+    matrix: np.ndarray, query: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the ``k`` rows of ``matrix`` most cosine-similar to ``query``.
+
+    One matrix-vector product plus a partial sort, so it stays fast for
+    ~100k candidates; use it to post-filter store results when a filter
+    cannot be pushed down to the store.
+
+    Args:
+        matrix: ``(n, d)`` candidate vectors, e.g. ``VectorItemBatch.vectors``.
+        query: ``(d,)`` query vector.
+        k: Number of results; fewer are returned if ``n < k``.
+
+    Returns:
+        Row indices and their cosine scores, best first. Zero vectors score 0.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+
+    matrix = np.asarray(matrix, dtype=np.float32)
+    query = np.asarray(query, dtype=np.float32)
+
+    scores = matrix @ query
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    np.divide(scores, norms, out=scores, where=norms > 0)
+
+    if k < len(scores):
+        # O(n) selection of the top k, then sort only those
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    order = candidates[np.argsort(-scores[candidates], kind="stable")]
+    return order, scores[order]
@@ -0,0 +1,73 @@
+# src/llm_kit/vectorstores/_worker.py
+
+"""Internal single-thread executor for blocking database connections.
+
+One long-lived thread owns the connection and runs submitted calls in order,
+so each call skips the default executor's dispatch and never contends with
+other calls for the connection.
+"""
+
+import asyncio
+import queue
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_Job = tuple[asyncio.AbstractEventLoop, asyncio.Future[Any], Callable[[], Any]]
+
+
+class ThreadWorker:
+    """Run blocking calls one at a time on a dedicated daemon thread.
+
+    The thread starts on first use and exits after ``stop()``; a later
+    ``run()`` starts a new one.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._jobs: queue.SimpleQueue[_Job | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    async def run(self, fn: Callable[[], T]) -> T:
+        """Run ``fn`` on the worker thread and return its result."""
+        if self._thread is None or not self._thread.is_alive():
+            # Each thread drains its own queue, so one still finishing after
+            # stop() never picks up work meant for its successor
+            self._jobs = queue.SimpleQueue()
+            self._thread = threading.Thread(
+                target=_serve, args=(self._jobs,), name=self._name, daemon=True
+            )
+            self._thread.start()
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[T] = loop.create_future()
+        self._jobs.put((loop, future, fn))
+        return await future
+
+    def stop(self) -> None:
+        """Let the thread exit once the calls already queued have run."""
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread = None
+
+
+def _serve(jobs: queue.SimpleQueue[_Job | None]) -> None:
+    while (job := jobs.get()) is not None:
+        loop, future, fn = job
+        try:
+            result = fn()
+        except BaseException as exc:
+            loop.call_soon_threadsafe(_set_exception, future, exc)
+        else:
+            loop.call_soon_threadsafe(_set_result, future, result)
+
+
+def _set_result(future: asyncio.Future[Any], result: Any) -> None:
+    if not future.cancelled():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future[Any], exc: BaseException) -> None:
+    if not future.cancelled():
+        future.set_exception(exc)
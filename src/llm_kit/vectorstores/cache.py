@@ -0,0 +1,137 @@
+# src/llm_kit/vectorstores/cache.py
+
+"""Semantic cache for vector store queries.
+
+A query whose vector is nearly identical to a recent one, issued with the
+same namespace, filters and ``top_k``, is answered from memory instead of
+searching the store again.
+"""
+
+from time import monotonic
+
+import numpy as np
+
+from .types import QueryResult
+
+
+class SemanticQueryCache:
+    """Ring buffer of recent query vectors and their results.
+
+    Cached vectors are kept unit-norm in one contiguous ``(maxsize, d)``
+    float32 matrix, so a lookup is a single matrix-vector product. The most
+    similar entry in the same scope at or above ``threshold`` is a hit. When
+    full, the oldest entry is overwritten.
+
+    With ``merge_threshold`` set, a stored query that close to an existing
+    entry in its scope replaces that entry instead of taking a new slot, so
+    paraphrase-heavy traffic does not fill the cache with near-duplicates.
+    An entry always holds the vector of the query that produced its
+    results, so every hit is within ``threshold`` of that query.
+
+    Scopes are compared with ``==``. The owning store clears the cache on its
+    own writes; writes from other processes are only seen once entries
+    expire, so set ``ttl`` when the collection is shared. Not thread-safe;
+    intended for use from a single event loop.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.99,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        merge_threshold: float | None = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit.
+            maxsize: Maximum number of cached queries.
+            ttl: Seconds a result stays valid. None keeps it until overwritten.
+            merge_threshold: Minimum cosine similarity for a new query to
+                replace an existing entry. Must be >= threshold. None stores
+                every query in its own slot.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        if merge_threshold is not None and merge_threshold < threshold:
+            raise ValueError("merge_threshold must be >= threshold")
+        self._threshold = threshold
+        self._merge_threshold = merge_threshold
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._vectors: np.ndarray | None = None
+        # Parallel per-row state; rows never written have expired at -inf
+        self._expires = np.full(maxsize, -np.inf)
+        self._scopes: list[object] = [None] * maxsize
+        self._results: list[list[QueryResult]] = [[] for _ in range(maxsize)]
+        self._next = 0
+
+    def get(
+        self, scope: object, vector: list[float] | np.ndarray
+    ) -> list[QueryResult] | None:
+        """Return cached results for a similar query in ``scope``, or None."""
+        query = _normalize(vector)
+        if query is None:
+            return None
+        row = self._nearest(scope, query, self._threshold)
+        return None if row is None else self._results[row]
+
+    def put(
+        self,
+        scope: object,
+        vector: list[float] | np.ndarray,
+        results: list[QueryResult],
+    ) -> None:
+        """Cache ``results`` for a query, replacing the oldest entry when full."""
+        query = _normalize(vector)
+        if query is None:
+            return
+        if self._vectors is None or self._vectors.shape[1] != len(query):
+            self._vectors = np.zeros((self._maxsize, len(query)), dtype=np.float32)
+            self._expires[:] = -np.inf
+
+        row = None
+        if self._merge_threshold is not None:
+            row = self._nearest(scope, query, self._merge_threshold)
+        if row is None:
+            row = self._next
+            self._next = (row + 1) % self._maxsize
+
+        self._vectors[row] = query
+        self._expires[row] = (
+            monotonic() + self._ttl if self._ttl is not None else np.inf
+        )
+        self._scopes[row] = scope
+        self._results[row] = results
+
+    def _nearest(
+        self, scope: object, query: np.ndarray, threshold: float
+    ) -> int | None:
+        """Most similar live row in ``scope`` at or above ``threshold``."""
+        if self._vectors is None or len(query) != self._vectors.shape[1]:
+            return None
+
+        scores = self._vectors @ query
+        scores[self._expires < monotonic()] = -np.inf
+        # Check candidates best-first; a different scope is skipped, not a miss
+        candidates = np.flatnonzero(scores >= threshold)
+        for row in candidates[np.argsort(-scores[candidates])]:
+            if self._scopes[row] == scope:
+                return int(row)
+        return None
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._expires[:] = -np.inf
+        self._scopes = [None] * self._maxsize
+        self._results = [[] for _ in range(self._maxsize)]
+
+
+def _normalize(vector: list[float] | np.ndarray) -> np.ndarray | None:
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    if not norm:
+        return None
+    normalized: np.ndarray = array / norm
+    return normalized
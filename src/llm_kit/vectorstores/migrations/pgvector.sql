@@ -3,6 +3,7 @@ CREATE EXTENSION IF NOT EXISTS vector;
 CREATE TABLE vector_items (
     namespace TEXT NOT NULL,
     id TEXT NOT NULL,
+    -- HALFVEC(1536) with halfvec_cosine_ops for vector_dtype=np.float16
     embedding VECTOR(1536) NOT NULL,
     metadata JSONB NOT NULL,
 
@@ -13,3 +14,8 @@ CREATE TABLE vector_items (
 CREATE INDEX vector_items_embedding_idx
 ON vector_items
 USING ivfflat (embedding vector_cosine_ops);
+
+-- Serves metadata filters (metadata @> '{"key": "value"}')
+CREATE INDEX vector_items_metadata_idx
+ON vector_items
+USING gin (metadata jsonb_path_ops);
@@ -1,21 +1,84 @@
+import asyncio
+import json
 import os
-from collections.abc import Iterable
-from time import monotonic
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from itertools import islice, starmap
+from time import perf_counter_ns
+from typing import Any, Literal, overload
 
 import numpy as np
+from numpy.typing import DTypeLike
+from pgvector import HalfVector
 from pgvector.psycopg import register_vector_async
 from psycopg import AsyncConnection, sql
-from psycopg.types.json import Json
+from psycopg.types.json import Json, Jsonb
 from psycopg_pool import AsyncConnectionPool
 
 from llm_kit.observability import names
 from llm_kit.observability.base import MetricsHook, NoOpMetricsHook
 
+from ._batcher import Batcher
 from .base import VectorStore
-from .types import QueryResult, VectorItem
+from .types import QueryResult, QueryRow, VectorItem, VectorItemBatch
 
 DEFAULT_NAMESPACE = "__global__"
 
+# Element dtype -> pgvector column type storing it
+_COLUMN_TYPES = {np.dtype(np.float32): "vector", np.dtype(np.float16): "halfvec"}
+
+# Compact metadata JSON for COPY; jsonb re-parses it, so spacing is wasted bytes
+_dumps_metadata = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _where(has_filters: bool, has_ids: bool) -> sql.Composable:
+    clauses = [sql.SQL("namespace = %(namespace)s")]
+    if has_ids:
+        clauses.append(sql.SQL("id = ANY(%(ids)s)"))
+    if has_filters:
+        # Containment is typed and served by the GIN index on metadata
+        clauses.append(sql.SQL("metadata @> %(filters)s"))
+    return sql.SQL(" AND ").join(clauses)
+
+
+# Vectors are sent (%b) and results received in binary, skipping the text
+# float formatting and parsing pgvector otherwise does per element. The named
+# %(vector)b maps both uses to one server parameter, so it is encoded once.
+def _compose_query(has_filters: bool) -> sql.Composed:
+    return sql.SQL(
+        """
+    SELECT
+        id,
+        1 - (embedding <=> %(vector)b) AS score,
+        metadata
+    FROM vector_items
+    WHERE {where_clause}
+    ORDER BY embedding <=> %(vector)b
+    LIMIT %(top_k)s
+    """
+    ).format(where_clause=_where(has_filters, has_ids=False))
+
+
+def _compose_delete(has_filters: bool, has_ids: bool) -> sql.Composed:
+    return sql.SQL(
+        """
+    DELETE FROM vector_items
+    WHERE {where_clause};
+    """
+    ).format(where_clause=_where(has_filters, has_ids))
+
+
+# Statements depend only on which clauses are present, so every variant is
+# rendered to bytes once at import; executed with prepare=True, each reuses
+# its server-side plan per connection
+_QUERY_SQL: dict[bool, bytes] = {
+    has_filters: _compose_query(has_filters).as_bytes() for has_filters in (False, True)
+}
+_DELETE_SQL: dict[tuple[bool, bool], bytes] = {
+    (has_filters, has_ids): _compose_delete(has_filters, has_ids).as_bytes()
+    for has_filters in (False, True)
+    for has_ids in (False, True)
+}
+
 
 async def _configure_connection(conn: AsyncConnection[tuple]) -> None:
     """Register pgvector types on new connections."""
@@ -28,9 +91,32 @@ class PgVectorStore(VectorStore):
         dsn: str,
         pool_min_size: int | None = None,
         pool_max_size: int | None = None,
+        vector_dtype: DTypeLike = np.float32,
+        buffered_batch_size: int = 1000,
+        buffered_flush_interval_ms: float = 25.0,
         metrics_hook: MetricsHook = NoOpMetricsHook(),
     ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            dsn: PostgreSQL connection string.
+            pool_min_size: Minimum pool size (env LLM_KIT_PG_POOL_MIN_SIZE, default 1).
+            pool_max_size: Maximum pool size (env LLM_KIT_PG_POOL_MAX_SIZE, default 10).
+            vector_dtype: np.float32 for a ``vector`` embedding column, or
+                np.float16 for ``halfvec``, which halves storage and wire bytes.
+            buffered_batch_size: Most items ``upsert_buffered`` writes at once.
+            buffered_flush_interval_ms: Longest an ``upsert_buffered`` item
+                waits for its batch to fill.
+            metrics_hook: Optional metrics hook for observability.
+        """
         self.metrics_hook = metrics_hook
+        # Skip the metrics calls entirely when nothing would record them
+        self._emit_metrics = not isinstance(metrics_hook, NoOpMetricsHook)
+        self._vector_dtype = np.dtype(vector_dtype)
+        if self._vector_dtype not in _COLUMN_TYPES:
+            raise ValueError(f"Unsupported vector_dtype: {self._vector_dtype}")
+        self._column_type = _COLUMN_TYPES[self._vector_dtype]
         pool_min_size = self._get_param_value(
             pool_min_size, "LLM_KIT_PG_POOL_MIN_SIZE", 1
         )
@@ -43,47 +129,149 @@ class PgVectorStore(VectorStore):
             max_size=pool_max_size,
             configure=_configure_connection,
         )
+        self._batcher: Batcher[tuple[str, VectorItem]] = Batcher(
+            self._flush_buffered,
+            max_size=buffered_batch_size,
+            max_delay=buffered_flush_interval_ms / 1000,
+        )
 
     async def close(self) -> None:
-        """Close the connection pool."""
+        """Stop buffered writes and close the connection pool."""
+        await self._batcher.close()
         await self._pool.close()
 
+    async def upsert_buffered(
+        self, *, namespace: str = DEFAULT_NAMESPACE, item: VectorItem
+    ) -> None:
+        """
+        Insert or update one vector, coalesced with concurrent callers.
+
+        Items from many coroutines are written together in one ``upsert``,
+        trading up to ``buffered_flush_interval_ms`` of latency per item for
+        far fewer round trips. Returns once the item's batch is committed.
+        """
+        await self._batcher.submit((namespace, item))
+
+    async def _flush_buffered(self, entries: list[tuple[str, VectorItem]]) -> None:
+        by_namespace: dict[str, list[VectorItem]] = {}
+        for namespace, item in entries:
+            by_namespace.setdefault(namespace, []).append(item)
+        for namespace, items in by_namespace.items():
+            await self.upsert(namespace=namespace, items=items)
+
     async def upsert(
-        self, *, namespace: str = DEFAULT_NAMESPACE, items: Iterable[VectorItem]
+        self,
+        *,
+        namespace: str = DEFAULT_NAMESPACE,
+        items: Iterable[VectorItem],
+        batch_size: int = 1000,
+        max_concurrency: int | None = None,
     ) -> None:
-        start = monotonic()
-        rows = [
-            (
-                namespace,
-                item.id,
-                np.array(item.vector),
-                Json(dict(item.metadata)),
-            )
-            for item in items
-        ]
+        """
+        Insert or update vectors.
 
-        if not rows:
+        Items are read lazily and written in batches of ``batch_size``, each
+        on its own pooled connection and transaction, with up to
+        ``max_concurrency`` batches in flight (default: the pool's max size).
+        Ids repeated within a batch keep the last item; ids repeated across
+        batches may resolve in either order.
+        """
+        start = perf_counter_ns()
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        rows: Iterator[tuple[str, list[float] | np.ndarray, Mapping[str, Any]]]
+        if isinstance(items, VectorItemBatch):
+            # Column batch: zip yields row views of the matrix, no VectorItems
+            rows = zip(items.ids, items.vectors, items.metadatas, strict=True)
+        else:
+            rows = ((item.id, item.vector, item.metadata) for item in items)
+        batches = iter(lambda: list(islice(rows, batch_size)), [])
+        semaphore = asyncio.Semaphore(max_concurrency or self._pool.max_size)
+        flushed = False
+
+        async with asyncio.TaskGroup() as tg:
+            for batch in batches:
+                # Acquire before reading the next batch to bound memory
+                await semaphore.acquire()
+                task = tg.create_task(self._flush(namespace, batch))
+                task.add_done_callback(lambda _: semaphore.release())
+                flushed = True
+
+        if not flushed:
             return
 
-        query = sql.SQL(
-            """
-        INSERT INTO vector_items (namespace, id, embedding, metadata)
-        VALUES (%s, %s, %s, %s)
-        ON CONFLICT (namespace, id)
-        DO UPDATE SET
-            embedding = EXCLUDED.embedding,
-            metadata = EXCLUDED.metadata;
-        """
-        )
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(names.PGVECTOR_UPSERT_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.PGVECTOR_OPERATIONS_TOTAL, labels={"operation": "upsert"}
+            )
 
+    async def _flush(
+        self,
+        namespace: str,
+        rows: list[tuple[str, list[float] | np.ndarray, Mapping[str, Any]]],
+    ) -> None:
+        # Stream rows into a staging table with binary COPY, then merge them
+        # with a single statement instead of one INSERT round trip per row
         async with self._pool.connection() as conn, conn.cursor() as cur:
-            await cur.executemany(query, rows)
+            await cur.execute(
+                "CREATE TEMP TABLE _stage (LIKE vector_items INCLUDING DEFAULTS) "
+                "ON COMMIT DROP"
+            )
+            async with cur.copy(
+                "COPY _stage (namespace, id, embedding, metadata) "
+                "FROM STDIN WITH (FORMAT BINARY)"
+            ) as copy:
+                copy.set_types(["text", "text", self._column_type, "jsonb"])
+                for id_, vector, metadata in rows:
+                    # Plain dicts are serialized in place; only copy other Mappings
+                    if type(metadata) is not dict:
+                        metadata = dict(metadata)
+                    await copy.write_row(
+                        (
+                            namespace,
+                            id_,
+                            self._adapt(vector),
+                            Json(metadata, _dumps_metadata),
+                        )
+                    )
+            await cur.execute(
+                """
+            INSERT INTO vector_items (namespace, id, embedding, metadata)
+            SELECT DISTINCT ON (namespace, id) namespace, id, embedding, metadata
+            FROM _stage
+            -- Last write wins for ids repeated within one batch
+            ORDER BY namespace, id, ctid DESC
+            ON CONFLICT (namespace, id)
+            DO UPDATE SET
+                embedding = EXCLUDED.embedding,
+                metadata = EXCLUDED.metadata;
+            """
+            )
 
-        elapsed_ms = 1000 * (monotonic() - start)
-        self.metrics_hook.record_latency(names.PGVECTOR_UPSERT_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.PGVECTOR_OPERATIONS_TOTAL, labels={"operation": "upsert"}
-        )
+    @overload
+    async def query(
+        self,
+        *,
+        namespace: str = ...,
+        vector: list[float],
+        top_k: int,
+        filters: dict | None = ...,
+        raw: Literal[False] = ...,
+    ) -> list[QueryResult]: ...
+
+    @overload
+    async def query(
+        self,
+        *,
+        namespace: str = ...,
+        vector: list[float],
+        top_k: int,
+        filters: dict | None = ...,
+        raw: Literal[True],
+    ) -> list[QueryRow]: ...
 
     async def query(
         self,
@@ -92,55 +280,75 @@ class PgVectorStore(VectorStore):
         vector: list[float],
         top_k: int,
         filters: dict | None = None,
-    ) -> list[QueryResult]:
-        start = monotonic()
+        raw: bool = False,
+    ) -> list[QueryResult] | list[QueryRow]:
+        """
+        Return the ``top_k`` nearest vectors in the namespace.
+
+        With ``raw=True`` the fetched ``(id, score, metadata)`` tuples are
+        returned as-is, skipping the per-row ``QueryResult`` construction.
+        """
+        start = perf_counter_ns()
         if top_k < 1:
             raise ValueError("top_k must be at least 1")
 
-        where_clauses = [sql.SQL("namespace = %s")]
-        params: list = [namespace]
+        params = self._query_params(namespace, vector, top_k, filters)
 
-        if filters:
-            for key, value in filters.items():
-                where_clauses.append(sql.SQL("metadata ->> %s = %s"))
-                params.extend([key, str(value)])
-
-        where_sql = sql.SQL(" AND ").join(where_clauses)
+        async with (
+            self._pool.connection() as conn,
+            conn.cursor(binary=True) as cur,
+        ):
+            await cur.execute(_QUERY_SQL[bool(filters)], params, prepare=True)
+            rows = await cur.fetchall()
 
-        query = sql.SQL(
-            """
-        SELECT
-            id,
-            1 - (embedding <=> %s) AS score,
-            metadata
-        FROM vector_items
-        WHERE {where_clause}
-        ORDER BY embedding <=> %s
-        LIMIT %s;
-        """
-        ).format(where_clause=where_sql)
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(names.PGVECTOR_QUERY_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.PGVECTOR_OPERATIONS_TOTAL, labels={"operation": "query"}
+            )
 
-        vector_arr = np.array(vector)
-        params = [vector_arr] + params + [vector_arr, top_k]
+        if raw:
+            return rows
+        return list(starmap(QueryResult, rows))
 
-        async with self._pool.connection() as conn, conn.cursor() as cur:
-            await cur.execute(query, params)
-            rows = await cur.fetchall()
+    async def query_stream(
+        self,
+        *,
+        namespace: str = DEFAULT_NAMESPACE,
+        vector: list[float],
+        top_k: int,
+        filters: dict | None = None,
+        itersize: int = 256,
+    ) -> AsyncIterator[QueryResult]:
+        """
+        Like ``query``, but yields results as they are fetched.
 
-        elapsed_ms = 1000 * (monotonic() - start)
-        self.metrics_hook.record_latency(names.PGVECTOR_QUERY_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.PGVECTOR_OPERATIONS_TOTAL, labels={"operation": "query"}
-        )
+        Uses a server-side cursor that fetches ``itersize`` rows per round
+        trip, so memory stays constant in ``top_k``. The pooled connection is
+        held until the iterator is exhausted or closed.
+        """
+        start = perf_counter_ns()
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
 
-        return [
-            QueryResult(
-                id=row[0],
-                score=row[1],
-                metadata=row[2],
+        params = self._query_params(namespace, vector, top_k, filters)
+
+        async with (
+            self._pool.connection() as conn,
+            conn.cursor(name="query_stream", binary=True) as cur,
+        ):
+            cur.itersize = itersize
+            await cur.execute(_QUERY_SQL[bool(filters)], params)
+            async for row in cur:
+                yield QueryResult(*row)
+
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(names.PGVECTOR_QUERY_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.PGVECTOR_OPERATIONS_TOTAL, labels={"operation": "query"}
             )
-            for row in rows
-        ]
 
     async def delete(
         self,
@@ -149,43 +357,55 @@ class PgVectorStore(VectorStore):
         ids: Iterable[str] | None = None,
         filters: dict | None = None,
     ) -> int:
-        start = monotonic()
+        start = perf_counter_ns()
         if not ids and not filters:
             raise ValueError("delete requires ids or filters")
 
-        where_clauses: list[sql.SQL] = [sql.SQL("namespace = %s")]
-        params: list = [namespace]
-
+        params: dict[str, Any] = {"namespace": namespace}
         if ids:
-            where_clauses.append(sql.SQL("id = ANY(%s)"))
-            params.append(list(ids))
-
+            params["ids"] = list(ids)
         if filters:
-            for key, value in filters.items():
-                where_clauses.append(sql.SQL("metadata ->> %s = %s"))
-                params.extend([key, str(value)])
-
-        where_sql = sql.SQL(" AND ").join(where_clauses)
-
-        delete_query = sql.SQL(
-            """
-        DELETE FROM vector_items
-        WHERE {where_clause};
-        """
-        ).format(where_clause=where_sql)
+            params["filters"] = Jsonb(filters)
 
         async with self._pool.connection() as conn, conn.cursor() as cur:
-            await cur.execute(delete_query, params)
+            await cur.execute(
+                _DELETE_SQL[bool(filters), bool(ids)],
+                params,
+                prepare=True,
+            )
             deleted: int = cur.rowcount
 
-        elapsed_ms = 1000 * (monotonic() - start)
-        self.metrics_hook.record_latency(names.PGVECTOR_DELETE_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.PGVECTOR_OPERATIONS_TOTAL, labels={"operation": "delete"}
-        )
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(names.PGVECTOR_DELETE_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.PGVECTOR_OPERATIONS_TOTAL, labels={"operation": "delete"}
+            )
 
         return deleted
 
+    def _query_params(
+        self,
+        namespace: str,
+        vector: list[float],
+        top_k: int,
+        filters: dict | None,
+    ) -> dict[str, Any]:
+        return {
+            "vector": self._adapt(vector),
+            "namespace": namespace,
+            "filters": Jsonb(filters) if filters else None,
+            "top_k": top_k,
+        }
+
+    def _adapt(self, vector: list[float] | np.ndarray) -> np.ndarray | HalfVector:
+        """Convert a vector to the embedding column's element type.
+
+        Zero-copy when ``vector`` is already an ndarray of that dtype.
+        """
+        arr = np.asarray(vector, dtype=self._vector_dtype)
+        return arr if self._column_type == "vector" else HalfVector(arr)
+
     @staticmethod
     def _get_param_value(passed_value: int | None, env_var: str, default: int) -> int:
         if passed_value is not None:
@@ -1,9 +1,14 @@
-from collections.abc import Iterable
-from time import monotonic
-from typing import TypeAlias
-
+import asyncio
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from itertools import islice
+from time import perf_counter_ns
+from typing import Any, TypeAlias
+
+import numpy as np
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
+    Batch,
     Distance,
     FieldCondition,
     Filter,
@@ -14,15 +19,18 @@ from qdrant_client.models import (
     IsNullCondition,
     MatchValue,
     NestedCondition,
-    PointStruct,
+    PayloadSelectorExclude,
+    PointIdsList,
     VectorParams,
 )
 
+from llm_kit.embeddings.base import EmbeddingsClient
 from llm_kit.observability import names
 from llm_kit.observability.base import MetricsHook, NoOpMetricsHook
 
 from .base import VectorStore
-from .types import QueryResult, VectorItem
+from .cache import SemanticQueryCache
+from .types import QueryResult, VectorItem, VectorItemBatch
 
 # Type alias for Qdrant filter conditions
 Condition: TypeAlias = (
@@ -37,6 +45,31 @@ Condition: TypeAlias = (
 
 DEFAULT_NAMESPACE = "__global__"
 
+_EXCLUDE_NAMESPACE = PayloadSelectorExclude(exclude=["_namespace"])
+
+
+def _filter_key(filters: dict | None) -> tuple[tuple[str, type, Any], ...]:
+    # Carry each value's type: True == 1 and hash alike, so without it
+    # {"flag": True} and {"flag": 1} would share a cached filter and scope
+    if not filters:
+        return ()
+    return tuple(sorted((key, type(value), value) for key, value in filters.items()))
+
+
+# Building and validating the pydantic filter models costs more than the rest
+# of a small query's Python-side work, and most traffic repeats a few
+# namespace/filter combinations. The cached models are never mutated.
+@lru_cache(maxsize=256)
+def _metadata_filter(
+    namespace: str, filters: tuple[tuple[str, type, Any], ...]
+) -> Filter:
+    must: list[Condition] = [
+        FieldCondition(key="_namespace", match=MatchValue(value=namespace))
+    ]
+    for key, _, value in filters:
+        must.append(FieldCondition(key=key, match=MatchValue(value=value)))
+    return Filter(must=must)
+
 
 class QdrantVectorStore(VectorStore):
     """Vector store implementation using Qdrant."""
@@ -47,10 +80,16 @@ class QdrantVectorStore(VectorStore):
         url: str | None = None,
         path: str | None = None,
         api_key: str | None = None,
+        prefer_grpc: bool = False,
+        grpc_port: int = 6334,
         collection_name: str,
         vector_size: int,
         distance: Distance = Distance.COSINE,
         on_disk: bool = False,
+        batch_size: int = 256,
+        max_in_flight: int = 4,
+        query_cache: SemanticQueryCache | None = None,
+        embeddings: EmbeddingsClient | None = None,
         metrics_hook: MetricsHook = NoOpMetricsHook(),
     ) -> None:
         """
@@ -60,10 +99,20 @@ class QdrantVectorStore(VectorStore):
             url: Qdrant server URL. If provided, connects to remote server.
             path: Path to local Qdrant storage directory. If provided, uses local persistence.
             api_key: API key for Qdrant Cloud (only used with url).
+            prefer_grpc: Talk to the server over gRPC instead of REST. Vectors
+                then travel as packed floats rather than JSON text, which
+                shrinks requests and their encoding cost. Only used with url.
+            grpc_port: Server gRPC port (only used with prefer_grpc).
             collection_name: Name of the collection.
             vector_size: Dimensionality of vectors.
             distance: Distance metric (COSINE, EUCLID, DOT).
             on_disk: Whether to store vectors on disk (for large datasets).
+            batch_size: Points sent per upsert request.
+            max_in_flight: Upsert requests outstanding at once.
+            query_cache: Optional cache answering near-duplicate queries
+                without a search. Writes through this store clear it.
+            embeddings: Client used by ``query_text`` to embed query text.
+                Give it a ``cache_size`` so repeated texts skip embedding.
             metrics_hook: Hook for recording metrics.
 
         Note:
@@ -81,12 +130,22 @@ class QdrantVectorStore(VectorStore):
 
             # Remote server
             store = QdrantVectorStore(url="http://localhost:6333", collection_name="docs", vector_size=384)
+
+            # Remote server over gRPC
+            store = QdrantVectorStore(url="http://localhost:6333", prefer_grpc=True, collection_name="docs", vector_size=384)
         """
         self.metrics_hook = metrics_hook
+        # Skip the metrics calls entirely when nothing would record them
+        self._emit_metrics = not isinstance(metrics_hook, NoOpMetricsHook)
 
         if url:
             # Remote Qdrant server
-            self._client = AsyncQdrantClient(url=url, api_key=api_key)
+            self._client = AsyncQdrantClient(
+                url=url,
+                api_key=api_key,
+                prefer_grpc=prefer_grpc,
+                grpc_port=grpc_port,
+            )
         elif path:
             # Local file persistence
             self._client = AsyncQdrantClient(path=path)
@@ -98,19 +157,35 @@ class QdrantVectorStore(VectorStore):
         self._vector_size = vector_size
         self._distance = distance
         self._on_disk = on_disk
+        if batch_size < 1 or max_in_flight < 1:
+            raise ValueError("batch_size and max_in_flight must be at least 1")
+        self._batch_size = batch_size
+        self._max_in_flight = max_in_flight
+        self._query_cache = query_cache
+        self._embeddings = embeddings
+        self._collection_ready = False
+        self._collection_lock = asyncio.Lock()
 
     async def _ensure_collection(self) -> None:
         """Create collection if it doesn't exist."""
-        exists = await self._client.collection_exists(self._collection_name)
-        if not exists:
-            await self._client.create_collection(
-                collection_name=self._collection_name,
-                vectors_config=VectorParams(
-                    size=self._vector_size,
-                    distance=self._distance,
-                    on_disk=self._on_disk,
-                ),
-            )
+        # Checked once per store; the lock keeps concurrent first calls from
+        # racing to create it
+        if self._collection_ready:
+            return
+        async with self._collection_lock:
+            if self._collection_ready:
+                return
+            exists = await self._client.collection_exists(self._collection_name)
+            if not exists:
+                await self._client.create_collection(
+                    collection_name=self._collection_name,
+                    vectors_config=VectorParams(
+                        size=self._vector_size,
+                        distance=self._distance,
+                        on_disk=self._on_disk,
+                    ),
+                )
+            self._collection_ready = True
 
     async def close(self) -> None:
         """Close the Qdrant client."""
@@ -122,99 +197,163 @@ class QdrantVectorStore(VectorStore):
         """
         Insert or update vectors.
 
+        Items are read lazily and sent in batches of ``batch_size`` with up to
+        ``max_in_flight`` requests outstanding. All but the last batch are
+        sent without waiting for indexing; the last one waits, and since
+        Qdrant applies updates in order, it returns once every batch is
+        applied. Ids repeated across batches may resolve in either order.
+
         Args:
             namespace: Logical namespace for multi-tenancy.
             items: Iterable of VectorItem to upsert.
         """
         await self._ensure_collection()
 
-        start = monotonic()
-        points = [
-            PointStruct(
-                id=item.id,
-                vector=item.vector,
-                payload={"_namespace": namespace, **dict(item.metadata)},
+        start = perf_counter_ns()
+        batches = self._batches(namespace, items)
+        pending = next(batches, None)
+        if pending is None:
+            return
+
+        semaphore = asyncio.Semaphore(self._max_in_flight)
+        async with asyncio.TaskGroup() as tg:
+            for batch in batches:
+                # Acquire before building the next batch to bound memory
+                await semaphore.acquire()
+                task = tg.create_task(self._send(pending, wait=False))
+                task.add_done_callback(lambda _: semaphore.release())
+                pending = batch
+        await self._send(pending, wait=True)
+
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(names.QDRANT_UPSERT_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.QDRANT_OPERATIONS_TOTAL, labels={"operation": "upsert"}
             )
-            for item in items
-        ]
 
-        if not points:
+    def _batches(self, namespace: str, items: Iterable[VectorItem]) -> Iterator[Batch]:
+        # Column-oriented Batch skips building a PointStruct per point
+        size = self._batch_size
+        if isinstance(items, VectorItemBatch):
+            for i in range(0, len(items), size):
+                yield Batch(
+                    ids=list(items.ids[i : i + size]),
+                    # One C-level conversion per float32 matrix slice
+                    vectors=np.asarray(
+                        items.vectors[i : i + size], dtype=np.float32
+                    ).tolist(),
+                    payloads=[
+                        {"_namespace": namespace, **md}
+                        for md in items.metadatas[i : i + size]
+                    ],
+                )
             return
 
-        await self._client.upsert(
-            collection_name=self._collection_name,
-            wait=True,
-            points=points,
-        )
+        iterator = iter(items)
+        while chunk := list(islice(iterator, size)):
+            yield Batch(
+                ids=[item.id for item in chunk],
+                vectors=[
+                    item.vector.tolist()
+                    if isinstance(item.vector, np.ndarray)
+                    else item.vector
+                    for item in chunk
+                ],
+                payloads=[{"_namespace": namespace, **item.metadata} for item in chunk],
+            )
 
-        elapsed_ms = 1000 * (monotonic() - start)
-        self.metrics_hook.record_latency(names.QDRANT_UPSERT_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.QDRANT_OPERATIONS_TOTAL, labels={"operation": "upsert"}
+    async def _send(self, batch: Batch, *, wait: bool) -> None:
+        await self._client.upsert(
+            collection_name=self._collection_name, wait=wait, points=batch
         )
 
     async def query(
         self,
         *,
         namespace: str = DEFAULT_NAMESPACE,
-        vector: list[float],
+        vector: list[float] | np.ndarray,
         top_k: int,
         filters: dict | None = None,
+        use_cache: bool = True,
     ) -> list[QueryResult]:
         """
         Query for similar vectors.
 
         Args:
             namespace: Logical namespace to search within.
-            vector: Query vector.
+            vector: Query vector; sent as float32, lists are converted.
             top_k: Number of results to return.
             filters: Optional metadata filters (exact match).
+            use_cache: Consult and fill the query cache, if one is configured.
 
         Returns:
             List of QueryResult sorted by similarity (highest first).
         """
         await self._ensure_collection()
 
-        start = monotonic()
+        start = perf_counter_ns()
         if top_k < 1:
             raise ValueError("top_k must be at least 1")
 
-        must_conditions: list[Condition] = [
-            FieldCondition(key="_namespace", match=MatchValue(value=namespace))
-        ]
-
-        if filters:
-            for key, value in filters.items():
-                must_conditions.append(
-                    FieldCondition(key=key, match=MatchValue(value=value))
-                )
+        cache = self._query_cache if use_cache else None
+        if cache is not None:
+            scope = (namespace, top_k, _filter_key(filters))
+            cached = cache.get(scope, vector)
+            if cached is not None:
+                if self._emit_metrics:
+                    self.metrics_hook.increment(names.QDRANT_CACHE_HITS)
+                return cached
 
-        query_filter = Filter(must=must_conditions)
+        query_filter = _metadata_filter(namespace, _filter_key(filters))
 
         results = await self._client.query_points(
             collection_name=self._collection_name,
-            query=vector,
+            query=np.asarray(vector, dtype=np.float32),
             query_filter=query_filter,
             limit=top_k,
-            with_payload=True,
+            # The server strips the internal namespace key from payloads
+            with_payload=_EXCLUDE_NAMESPACE,
         )
 
-        elapsed_ms = 1000 * (monotonic() - start)
-        self.metrics_hook.record_latency(names.QDRANT_QUERY_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.QDRANT_OPERATIONS_TOTAL, labels={"operation": "query"}
-        )
-
-        return [
-            QueryResult(
-                id=str(hit.id),
-                score=hit.score,
-                metadata={
-                    k: v for k, v in (hit.payload or {}).items() if k != "_namespace"
-                },
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(names.QDRANT_QUERY_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.QDRANT_OPERATIONS_TOTAL, labels={"operation": "query"}
             )
+
+        query_results = [
+            QueryResult(id=str(hit.id), score=hit.score, metadata=hit.payload or {})
             for hit in results.points
         ]
+        if cache is not None:
+            cache.put(scope, vector, query_results)
+        return query_results
+
+    async def query_text(
+        self,
+        text: str,
+        *,
+        namespace: str = DEFAULT_NAMESPACE,
+        top_k: int,
+        filters: dict | None = None,
+    ) -> list[QueryResult]:
+        """
+        Embed ``text`` with the configured embeddings client and query with it.
+
+        Repeated texts are only embedded once when that client has an
+        embedding cache; its cache is per client, so per model.
+        """
+        if self._embeddings is None:
+            raise ValueError("query_text requires an embeddings client")
+        (embedding,) = await self._embeddings.embed([text])
+        return await self.query(
+            namespace=namespace, vector=embedding.vector, top_k=top_k, filters=filters
+        )
 
     async def delete(
         self,
@@ -222,6 +361,7 @@ class QdrantVectorStore(VectorStore):
         namespace: str = DEFAULT_NAMESPACE,
         ids: Iterable[str] | None = None,
         filters: dict | None = None,
+        return_count: bool = True,
     ) -> int:
         """
         Delete vectors by id or by metadata filter.
@@ -230,49 +370,71 @@ class QdrantVectorStore(VectorStore):
             namespace: Logical namespace.
             ids: Optional iterable of IDs to delete.
             filters: Optional metadata filters for deletion.
+            return_count: Count the matching points first. Filtered deletes
+                need an extra exact count for this; pass False to skip it.
 
         Returns:
-            Number of points deleted.
+            Number of points deleted, or 0 when ``return_count`` is False.
         """
         await self._ensure_collection()
 
-        start = monotonic()
-        if not ids and not filters:
+        start = perf_counter_ns()
+        id_list = list(ids) if ids is not None else []
+        if not id_list and not filters:
             raise ValueError("delete requires ids or filters")
 
-        # Count before deletion to return deleted count
-        count_before = await self._count_matching(
-            namespace=namespace, ids=ids, filters=filters
-        )
-
-        # Build filter conditions - always include namespace
-        must_conditions: list[Condition] = [
-            FieldCondition(key="_namespace", match=MatchValue(value=namespace))
-        ]
-
-        if ids:
-            # Add HasIdCondition to filter by specific IDs
-            must_conditions.append(HasIdCondition(has_id=list(ids)))
-
-        if filters:
-            for key, value in filters.items():
-                must_conditions.append(
-                    FieldCondition(key=key, match=MatchValue(value=value))
+        if id_list and not filters:
+            # One retrieve finds the ids in this namespace; delete exactly those
+            points = await self._client.retrieve(
+                collection_name=self._collection_name,
+                ids=id_list,
+                with_payload=["_namespace"],
+                with_vectors=False,
+            )
+            matched = [
+                p.id
+                for p in points
+                if p.payload and p.payload.get("_namespace") == namespace
+            ]
+            if matched:
+                await self._client.delete(
+                    collection_name=self._collection_name,
+                    points_selector=PointIdsList(points=matched),
+                    wait=True,
+                )
+            deleted = len(matched)
+        else:
+            deleted = (
+                await self._count_matching(
+                    namespace=namespace, ids=id_list, filters=filters
                 )
+                if return_count
+                else 0
+            )
 
-        await self._client.delete(
-            collection_name=self._collection_name,
-            points_selector=FilterSelector(filter=Filter(must=must_conditions)),
-            wait=True,
-        )
+            delete_filter = _metadata_filter(namespace, _filter_key(filters))
+            if id_list:
+                # Add HasIdCondition to filter by specific IDs
+                delete_filter = Filter(
+                    must=[delete_filter, HasIdCondition(has_id=list(id_list))]
+                )
 
-        elapsed_ms = 1000 * (monotonic() - start)
-        self.metrics_hook.record_latency(names.QDRANT_DELETE_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.QDRANT_OPERATIONS_TOTAL, labels={"operation": "delete"}
-        )
+            await self._client.delete(
+                collection_name=self._collection_name,
+                points_selector=FilterSelector(filter=delete_filter),
+                wait=True,
+            )
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(names.QDRANT_DELETE_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.QDRANT_OPERATIONS_TOTAL, labels={"operation": "delete"}
+            )
 
-        return count_before
+        return deleted
 
     async def _count_matching(
         self,
@@ -282,17 +444,7 @@ class QdrantVectorStore(VectorStore):
         filters: dict | None = None,
     ) -> int:
         """Count points matching the given criteria."""
-        must_conditions: list[Condition] = [
-            FieldCondition(key="_namespace", match=MatchValue(value=namespace))
-        ]
-
-        if filters:
-            for key, value in filters.items():
-                must_conditions.append(
-                    FieldCondition(key=key, match=MatchValue(value=value))
-                )
-
-        query_filter = Filter(must=must_conditions)
+        query_filter = _metadata_filter(namespace, _filter_key(filters))
 
         if ids:
             # For ID-based deletion, we need to check which IDs exist
@@ -1,23 +1,181 @@
 """SQLite vector store using sqlite-vec extension for native vector operations."""
 
-import asyncio
 import json
-from collections.abc import Iterable
+import math
+from collections.abc import Iterable, Sequence
 from pathlib import Path
-from time import monotonic
-from typing import Any
+from time import perf_counter_ns
+from typing import Any, Literal
 
 import apsw
+import numpy as np
 import sqlite_vec
 
 from llm_kit.observability import names
 from llm_kit.observability.base import MetricsHook, NoOpMetricsHook
 
+from ._worker import ThreadWorker
 from .base import VectorStore
 from .types import QueryResult, VectorItem
 
 DEFAULT_NAMESPACE = "__global__"
 
+_PRAGMAS = (
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",  # 256 MB
+    "cache_size=-65536",  # 64 MB
+    # Bound the sampling done by PRAGMA optimize so it stays cheap
+    "analysis_limit=400",
+)
+
+# Rows written between PRAGMA optimize runs. vec0 keeps ids and vectors in
+# ordinary shadow tables, whose planner statistics go stale as they grow
+_OPTIMIZE_EVERY = 1024
+
+# Shared codecs: skip json.dumps/loads' per-call keyword handling; metadata is
+# only read back through SQLite's JSON functions, so spacing is wasted bytes.
+# Keys are sorted so nested objects compare equal regardless of insertion order
+_dumps_metadata = json.JSONEncoder(separators=(",", ":"), sort_keys=True).encode
+_loads_metadata = json.JSONDecoder().decode
+
+# SQL is fixed text built once, so apsw's statement cache finds the prepared
+# statement on every call
+_INSERT_SQL = """
+    INSERT INTO vec_items(composite_id, namespace, embedding, metadata, item_id)
+    VALUES (?, ?, ?, ?, ?)
+"""
+# KNN query using sqlite-vec MATCH syntax with partition key filter. We select
+# item_id (auxiliary column) not composite_id (primary key)
+_KNN_SQL = """
+    SELECT
+        item_id,
+        distance,
+        metadata
+    FROM vec_items
+    WHERE embedding MATCH ?
+        AND k = ?
+        AND namespace = ?
+"""
+_SCAN_SQL = """
+    SELECT
+        item_id,
+        vec_distance_cosine(embedding, ?) AS distance,
+        metadata
+    FROM vec_items
+    WHERE namespace = ?{where}
+    ORDER BY distance
+    LIMIT ?
+"""
+_COUNT_SQL = "SELECT COUNT(*) FROM vec_items WHERE namespace = ?"
+_DELETE_SQL = "DELETE FROM vec_items WHERE namespace = ?"
+# Id lookups go one key per statement: vec0 resolves composite_id = ? through
+# its primary key, but answers composite_id IN (...) by scanning every row
+_DELETE_KEY_SQL = f"{_DELETE_SQL} AND composite_id = ?"
+_GET_SQL = """
+    SELECT item_id, embedding, metadata
+    FROM vec_items
+    WHERE namespace = ? AND composite_id = ?
+"""
+
+# int8 tables search over the quantized column and keep the float32 vector in
+# an auxiliary column, read back only for re-scoring and get_by_ids
+_INSERT_INT8_SQL = """
+    INSERT INTO vec_items(
+        composite_id, namespace, embedding, metadata, item_id, embedding_f32
+    )
+    VALUES (?, ?, vec_int8(?), ?, ?, ?)
+"""
+_KNN_INT8_SQL = """
+    SELECT
+        item_id,
+        embedding_f32,
+        metadata
+    FROM vec_items
+    WHERE embedding MATCH vec_int8(?)
+        AND k = ?
+        AND namespace = ?
+"""
+_SCAN_INT8_SQL = """
+    SELECT
+        item_id,
+        embedding_f32,
+        metadata,
+        vec_distance_l2(embedding, vec_int8(?)) AS distance
+    FROM vec_items
+    WHERE namespace = ?{where}
+    ORDER BY distance
+    LIMIT ?
+"""
+_GET_INT8_SQL = """
+    SELECT item_id, embedding_f32, metadata
+    FROM vec_items
+    WHERE namespace = ? AND composite_id = ?
+"""
+
+# Candidates fetched per requested result before exact float32 re-scoring
+_RESCORE_FACTOR = 4
+
+
+def _filter_sql(filters: dict[str, Any] | None) -> tuple[str, list[Any]]:
+    """Translate exact-match metadata filters into ``AND ...`` SQL and params.
+
+    Keys are bound as JSON paths, so they need no escaping beyond quoting.
+    None matches a missing or null key; lists and dicts compare as canonical
+    JSON, which matches rows written with sorted keys (see _dumps_metadata).
+    """
+    clauses: list[str] = []
+    params: list[Any] = []
+    for key, value in (filters or {}).items():
+        path = '$."' + key.replace('"', '\\"') + '"'
+        if value is None:
+            clauses.append(" AND json_extract(metadata, ?) IS NULL")
+            params.append(path)
+        elif isinstance(value, (dict, list)):
+            clauses.append(" AND json_extract(metadata, ?) = json(?)")
+            params.extend((path, _dumps_metadata(value)))
+        else:
+            clauses.append(" AND json_extract(metadata, ?) = ?")
+            params.extend((path, value))
+    return "".join(clauses), params
+
+
+def _quantize_int8(vector: np.ndarray) -> bytes:
+    """Normalize a vector to unit length and round it to int8.
+
+    Every vector shares one scale, which maps +/-4 standard deviations of a
+    unit vector's components (1/sqrt(d) each) onto +/-127 and clips beyond.
+    L2 distance between the results then ranks like cosine distance, and
+    sqlite-vec's int8 L2 kernel is much faster than its int8 cosine one.
+    """
+    norm = float(np.linalg.norm(vector)) or 1.0
+    scale = 127.0 * math.sqrt(vector.shape[-1]) / (4.0 * norm)
+    return np.clip(np.rint(vector * scale), -127, 127).astype(np.int8).tobytes()
+
+
+def _rescore(
+    query: np.ndarray, rows: Iterable[tuple[Any, ...]], top_k: int
+) -> list[QueryResult]:
+    """Rank ``(item_id, float32 blob, metadata, ...)`` rows by exact cosine."""
+    candidates = list(rows)
+    if not candidates:
+        return []
+    matrix = np.frombuffer(b"".join(row[1] for row in candidates), dtype="<f4").reshape(
+        len(candidates), -1
+    )
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    cosine = (matrix @ query) / np.where(norms == 0, 1.0, norms)
+    order = np.argsort(-cosine, kind="stable")[:top_k]
+    # Same 0-1 scale as float32 tables: 1 - cosine_distance / 2
+    return [
+        QueryResult(
+            id=candidates[i][0],
+            score=float(1.0 + cosine[i]) / 2.0,
+            metadata=_loads_metadata(candidates[i][2]),
+        )
+        for i in order
+    ]
+
 
 class SQLiteVectorStore(VectorStore):
     """Vector store implementation using SQLite with sqlite-vec extension.
@@ -39,6 +197,7 @@ class SQLiteVectorStore(VectorStore):
         self,
         db_path: str | Path = ":memory:",
         dimensions: int = 1536,
+        quantization: Literal["float32", "int8"] = "float32",
         metrics_hook: MetricsHook = NoOpMetricsHook(),
     ) -> None:
         """
@@ -47,23 +206,45 @@ class SQLiteVectorStore(VectorStore):
         Args:
             db_path: Path to SQLite database file. Use ":memory:" for in-memory database.
             dimensions: Dimension of vectors to store. Must be specified at table creation.
+            quantization: Element type of the searched vector column. "int8"
+                scans a quarter of the bytes per vector and re-scores the best
+                candidates against a float32 copy. Must match the layout of an
+                existing table.
             metrics_hook: Hook for recording metrics.
         """
         self.metrics_hook = metrics_hook
+        # Skip the metrics calls entirely when nothing would record them
+        self._emit_metrics = not isinstance(metrics_hook, NoOpMetricsHook)
         self._db_path = str(db_path)
         self._dimensions = dimensions
+        if quantization not in ("float32", "int8"):
+            raise ValueError("quantization must be 'float32' or 'int8'")
+        self._int8 = quantization == "int8"
         self._conn: apsw.Connection | None = None
+        # Rows upserted since the last PRAGMA optimize; worker thread only
+        self._pending_writes = 0
+        # All connection access runs in order on one dedicated thread
+        self._worker = ThreadWorker(name="sqlite-vector-store")
 
     def _get_connection(self) -> apsw.Connection:
         """Get or create SQLite connection with sqlite-vec loaded (lazy initialization)."""
         if self._conn is None:
             self._conn = apsw.Connection(self._db_path)
+            # Wait out another process's write lock instead of failing at once
+            self._conn.setbusytimeout(5000)
 
             # Load sqlite-vec extension
             self._conn.enableloadextension(True)
             self._conn.loadextension(sqlite_vec.loadable_path())
             self._conn.enableloadextension(False)
 
+            # WAL with synchronous=NORMAL syncs on checkpoint rather than on
+            # every commit; the cache and mmap keep hot vec0 pages in memory
+            if self._db_path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            for pragma in _PRAGMAS:
+                self._conn.execute(f"PRAGMA {pragma}")
+
             self._initialize_schema()
         return self._conn
 
@@ -80,6 +261,26 @@ class SQLiteVectorStore(VectorStore):
             return key[len(prefix) :]
         return key
 
+    @staticmethod
+    def _delete_keys(
+        conn: apsw.Connection,
+        namespace: str,
+        composite_ids: Iterable[str],
+        where: str = "",
+        params: Sequence[Any] = (),
+    ) -> int:
+        """Delete rows by composite key, one primary-key lookup per key.
+
+        ``where``/``params`` add conditions (see ``_filter_sql``). Returns the
+        number of rows deleted, as reported by ``changes()``.
+        """
+        sql = _DELETE_KEY_SQL + where
+        deleted = 0
+        for key in composite_ids:
+            conn.execute(sql, (namespace, key, *params))
+            deleted += conn.changes()
+        return deleted
+
     def _initialize_schema(self) -> None:
         """Create vec0 virtual table if it doesn't exist."""
         if self._conn is None:
@@ -88,12 +289,17 @@ class SQLiteVectorStore(VectorStore):
         # Create vec0 virtual table for vector storage with cosine distance
         # Using namespace as partition key for efficient multi-tenant queries
         # The primary key is a composite of namespace:item_id to ensure uniqueness
+        column = (
+            f"embedding int8[{self._dimensions}], +embedding_f32 BLOB"
+            if self._int8
+            else f"embedding float[{self._dimensions}] distance_metric=cosine"
+        )
         self._conn.execute(
             f"""
             CREATE VIRTUAL TABLE IF NOT EXISTS vec_items USING vec0(
                 composite_id TEXT PRIMARY KEY,
                 namespace TEXT PARTITION KEY,
-                embedding float[{self._dimensions}] distance_metric=cosine,
+                {column},
                 +metadata TEXT,
                 +item_id TEXT
             )
@@ -103,8 +309,14 @@ class SQLiteVectorStore(VectorStore):
     async def close(self) -> None:
         """Close the database connection."""
         if self._conn:
-            await asyncio.to_thread(self._conn.close)
-            self._conn = None
+            conn, self._conn = self._conn, None
+
+            def _close() -> None:
+                conn.execute("PRAGMA optimize")
+                conn.close()
+
+            await self._worker.run(_close)
+        self._worker.stop()
 
     async def upsert(
         self, *, namespace: str = DEFAULT_NAMESPACE, items: Iterable[VectorItem]
@@ -118,7 +330,7 @@ class SQLiteVectorStore(VectorStore):
             namespace: Logical namespace for multi-tenancy.
             items: Iterable of VectorItem to upsert.
         """
-        start = monotonic()
+        start = perf_counter_ns()
         items_list = list(items)
 
         if not items_list:
@@ -126,47 +338,55 @@ class SQLiteVectorStore(VectorStore):
 
         def _upsert() -> None:
             conn = self._get_connection()
-
-            # Delete existing items first (sqlite-vec doesn't support UPDATE)
-            composite_ids = [self._make_key(namespace, item.id) for item in items_list]
-            placeholders = ",".join("?" * len(composite_ids))
-            conn.execute(
-                f"""
-                DELETE FROM vec_items
-                WHERE namespace = ? AND composite_id IN ({placeholders})
-                """,
-                (namespace, *composite_ids),
-            )
-
-            # Insert new items using sqlite-vec serialization
+            rows: list[tuple[Any, ...]] = []
             for item in items_list:
-                conn.execute(
-                    """
-                    INSERT INTO vec_items(composite_id, namespace, embedding, metadata, item_id)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (
-                        self._make_key(namespace, item.id),
-                        namespace,
-                        sqlite_vec.serialize_float32(item.vector),
-                        json.dumps(dict(item.metadata)),
-                        item.id,
-                    ),
+                vector = np.asarray(item.vector, dtype="<f4")
+                key = self._make_key(namespace, item.id)
+                metadata = _dumps_metadata(
+                    item.metadata
+                    if type(item.metadata) is dict
+                    else dict(item.metadata)
                 )
-
-        await asyncio.to_thread(_upsert)
-
-        elapsed_ms = 1000 * (monotonic() - start)
-        self.metrics_hook.record_latency(names.SQLITE_UPSERT_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.SQLITE_OPERATIONS_TOTAL, labels={"operation": "upsert"}
-        )
+                if self._int8:
+                    rows.append(
+                        (
+                            key,
+                            namespace,
+                            _quantize_int8(vector),
+                            metadata,
+                            item.id,
+                            vector.tobytes(),
+                        )
+                    )
+                else:
+                    rows.append((key, namespace, vector.tobytes(), metadata, item.id))
+
+            # One transaction for the whole batch: a single commit (and fsync)
+            # instead of one per statement
+            with conn:
+                # Delete existing items first (sqlite-vec doesn't support UPDATE)
+                self._delete_keys(conn, namespace, [row[0] for row in rows])
+                conn.executemany(_INSERT_INT8_SQL if self._int8 else _INSERT_SQL, rows)
+
+            self._pending_writes += len(rows)
+            if self._pending_writes >= _OPTIMIZE_EVERY:
+                self._pending_writes = 0
+                conn.execute("PRAGMA optimize")
+
+        await self._worker.run(_upsert)
+
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(names.SQLITE_UPSERT_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.SQLITE_OPERATIONS_TOTAL, labels={"operation": "upsert"}
+            )
 
     async def query(
         self,
         *,
         namespace: str = DEFAULT_NAMESPACE,
-        vector: list[float],
+        vector: list[float] | np.ndarray,
         top_k: int,
         filters: dict[str, Any] | None = None,
     ) -> list[QueryResult]:
@@ -177,79 +397,71 @@ class SQLiteVectorStore(VectorStore):
             namespace: Logical namespace to search within.
             vector: Query vector.
             top_k: Number of results to return.
-            filters: Optional metadata filters (exact match, applied post-query).
+            filters: Optional metadata filters (exact match, applied in SQL).
 
         Returns:
             List of QueryResult sorted by similarity (highest first).
         """
-        start = monotonic()
+        start = perf_counter_ns()
         if top_k < 1:
             raise ValueError("top_k must be at least 1")
 
+        # sqlite-vec takes raw little-endian float32 blobs
+        query_vector = np.asarray(vector, dtype="<f4")
+        query_blob = query_vector.tobytes()
+
         def _query() -> list[QueryResult]:
             conn = self._get_connection()
 
-            # Serialize query vector to sqlite-vec format
-            query_blob = sqlite_vec.serialize_float32(vector)
-
-            # Fetch more results if we have filters (post-filtering)
-            fetch_k = top_k * 3 if filters else top_k
-
-            # KNN query using sqlite-vec MATCH syntax with partition key filter
-            # We select item_id (auxiliary column) not composite_id (primary key)
-            rows = list(
-                conn.execute(
-                    """
-                    SELECT
-                        item_id,
-                        distance,
-                        metadata
-                    FROM vec_items
-                    WHERE embedding MATCH ?
-                        AND k = ?
-                        AND namespace = ?
-                    """,
-                    (query_blob, fetch_k, namespace),
-                )
-            )
-
-            results: list[QueryResult] = []
-
-            for row in rows:
-                item_id, distance, metadata_json = row
-                metadata = json.loads(metadata_json)
-
-                # Apply metadata filters if provided
+            if self._int8:
+                # Over-fetch on the int8 column, then rank by exact cosine
+                limit = top_k * _RESCORE_FACTOR
+                quantized = _quantize_int8(query_vector)
                 if filters:
-                    match = all(metadata.get(k) == v for k, v in filters.items())
-                    if not match:
-                        continue
-
-                # Convert cosine distance to similarity score
-                # cosine distance is 0 for identical, 2 for opposite
-                # Convert to 0-1 score where 1 is most similar
-                score = 1.0 - (distance / 2.0)
-
-                results.append(
-                    QueryResult(
-                        id=item_id,
-                        score=score,
-                        metadata=metadata,
+                    where, params = _filter_sql(filters)
+                    candidates = conn.execute(
+                        _SCAN_INT8_SQL.format(where=where),
+                        (quantized, namespace, *params, limit),
+                    )
+                else:
+                    candidates = conn.execute(
+                        _KNN_INT8_SQL, (quantized, limit, namespace)
                     )
+                return _rescore(query_vector, candidates, top_k)
+
+            if filters:
+                # vec0 applies k before any auxiliary-column condition, so a
+                # filtered KNN query could return fewer than top_k matches.
+                # vec0 search is a full scan anyway; scan with the filter in
+                # SQL and order by distance instead.
+                where, params = _filter_sql(filters)
+                rows = conn.execute(
+                    _SCAN_SQL.format(where=where),
+                    (query_blob, namespace, *params, top_k),
                 )
+            else:
+                rows = conn.execute(_KNN_SQL, (query_blob, top_k, namespace))
+
+            # Convert cosine distance to similarity score
+            # cosine distance is 0 for identical, 2 for opposite
+            # Convert to 0-1 score where 1 is most similar
+            return [
+                QueryResult(
+                    id=item_id,
+                    score=1.0 - (distance / 2.0),
+                    metadata=_loads_metadata(metadata_json),
+                )
+                for item_id, distance, metadata_json in rows
+            ]
 
-                if len(results) >= top_k:
-                    break
-
-            return results
-
-        results = await asyncio.to_thread(_query)
+        results = await self._worker.run(_query)
 
-        elapsed_ms = 1000 * (monotonic() - start)
-        self.metrics_hook.record_latency(names.SQLITE_QUERY_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.SQLITE_OPERATIONS_TOTAL, labels={"operation": "query"}
-        )
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(names.SQLITE_QUERY_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.SQLITE_OPERATIONS_TOTAL, labels={"operation": "query"}
+            )
 
         return results
 
@@ -271,86 +483,38 @@ class SQLiteVectorStore(VectorStore):
         Returns:
             Number of vectors deleted.
         """
-        start = monotonic()
+        start = perf_counter_ns()
         if not ids and not filters:
             raise ValueError("delete requires ids or filters")
 
         def _delete() -> int:
             conn = self._get_connection()
 
-            if ids and not filters:
-                # Direct delete by IDs using composite keys
-                id_list = list(ids)
-                composite_ids = [self._make_key(namespace, id_) for id_ in id_list]
-                placeholders = ",".join("?" * len(composite_ids))
-
-                # Count existing
-                count_before: int = list(
-                    conn.execute(
-                        f"""
-                        SELECT COUNT(*) FROM vec_items
-                        WHERE namespace = ? AND composite_id IN ({placeholders})
-                        """,
-                        (namespace, *composite_ids),
-                    )
-                )[0][0]
-
-                conn.execute(
-                    f"""
-                    DELETE FROM vec_items
-                    WHERE namespace = ? AND composite_id IN ({placeholders})
-                    """,
-                    (namespace, *composite_ids),
-                )
-                return count_before
-            else:
-                # Need to query for metadata filtering
-                rows = list(
-                    conn.execute(
-                        """
-                        SELECT item_id, metadata
-                        FROM vec_items
-                        WHERE namespace = ?
-                        """,
-                        (namespace,),
+            # Metadata filters are evaluated by SQLite, and changes() reports
+            # how many rows each DELETE removed, so nothing is counted first
+            where, params = _filter_sql(filters)
+            with conn:
+                if not ids:
+                    conn.execute(_DELETE_SQL + where, (namespace, *params))
+                    deleted: int = conn.changes()
+                else:
+                    deleted = self._delete_keys(
+                        conn,
+                        namespace,
+                        (self._make_key(namespace, id_) for id_ in ids),
+                        where,
+                        params,
                     )
-                )
-
-                # Filter by metadata and optionally by IDs
-                id_set = set(ids) if ids else None
-                matching_ids = []
-                for row in rows:
-                    item_id, metadata_json = row
-                    if id_set and item_id not in id_set:
-                        continue
-                    if filters:
-                        metadata = json.loads(metadata_json)
-                        if not all(metadata.get(k) == v for k, v in filters.items()):
-                            continue
-                    matching_ids.append(item_id)
-
-                if not matching_ids:
-                    return 0
-
-                # Delete matching IDs using composite keys
-                composite_ids = [self._make_key(namespace, id_) for id_ in matching_ids]
-                placeholders = ",".join("?" * len(composite_ids))
-                conn.execute(
-                    f"""
-                    DELETE FROM vec_items
-                    WHERE namespace = ? AND composite_id IN ({placeholders})
-                    """,
-                    (namespace, *composite_ids),
-                )
-                return len(matching_ids)
+            return deleted
 
-        deleted = await asyncio.to_thread(_delete)
+        deleted = await self._worker.run(_delete)
 
-        elapsed_ms = 1000 * (monotonic() - start)
-        self.metrics_hook.record_latency(names.SQLITE_DELETE_DURATION, elapsed_ms)
-        self.metrics_hook.increment(
-            names.SQLITE_OPERATIONS_TOTAL, labels={"operation": "delete"}
-        )
+        if self._emit_metrics:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            self.metrics_hook.record_latency(names.SQLITE_DELETE_DURATION, elapsed_ms)
+            self.metrics_hook.increment(
+                names.SQLITE_OPERATIONS_TOTAL, labels={"operation": "delete"}
+            )
 
         return deleted
 
@@ -368,47 +532,32 @@ class SQLiteVectorStore(VectorStore):
             ids: Iterable of IDs to retrieve.
 
         Returns:
-            List of VectorItem for found IDs.
+            List of VectorItem for found IDs, in the order first requested,
+            with float32 array vectors.
         """
         id_list = list(ids)
         if not id_list:
             return []
 
+        get_sql = _GET_INT8_SQL if self._int8 else _GET_SQL
+
         def _get() -> list[VectorItem]:
             conn = self._get_connection()
-            # Use composite keys for lookup
-            composite_ids = [self._make_key(namespace, id_) for id_ in id_list]
-            placeholders = ",".join("?" * len(composite_ids))
-            rows = list(
-                conn.execute(
-                    f"""
-                    SELECT item_id, embedding, metadata
-                    FROM vec_items
-                    WHERE namespace = ? AND composite_id IN ({placeholders})
-                    """,
-                    (namespace, *composite_ids),
+            # Stored blobs are raw float32; wrap them as read-only arrays
+            # instead of boxing every element into a Python float
+            return [
+                VectorItem(
+                    id=item_id,
+                    vector=np.frombuffer(embedding_blob, dtype="<f4"),
+                    metadata=_loads_metadata(metadata_json),
                 )
-            )
-
-            items = []
-            for row in rows:
-                item_id, embedding_blob, metadata_json = row
-                # Deserialize vector from sqlite-vec blob using vec_to_json
-                vec_json = list(
-                    conn.execute("SELECT vec_to_json(?)", (embedding_blob,))
-                )[0][0]
-                vector = json.loads(vec_json)
-                metadata = json.loads(metadata_json)
-                items.append(
-                    VectorItem(
-                        id=item_id,
-                        vector=vector,
-                        metadata=metadata,
-                    )
+                for id_ in dict.fromkeys(id_list)
+                for item_id, embedding_blob, metadata_json in conn.execute(
+                    get_sql, (namespace, self._make_key(namespace, id_))
                 )
-            return items
+            ]
 
-        return await asyncio.to_thread(_get)
+        return await self._worker.run(_get)
 
     async def count(self, *, namespace: str = DEFAULT_NAMESPACE) -> int:
         """
@@ -423,13 +572,7 @@ class SQLiteVectorStore(VectorStore):
 
         def _count() -> int:
             conn = self._get_connection()
-            result = list(
-                conn.execute(
-                    "SELECT COUNT(*) FROM vec_items WHERE namespace = ?",
-                    (namespace,),
-                )
-            )
-            count: int = result[0][0]
+            count: int = next(conn.execute(_COUNT_SQL, (namespace,)))[0]
             return count
 
-        return await asyncio.to_thread(_count)
+        return await self._worker.run(_count)
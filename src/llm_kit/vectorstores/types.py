@@ -1,17 +1,52 @@
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class VectorItem:
     id: str
-    vector: list[float]
+    vector: list[float] | np.ndarray  # float32 arrays are passed through as-is
     metadata: Mapping[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueryResult:
     id: str
     score: float
     metadata: Mapping[str, Any]
+
+
+# (id, score, metadata), as returned by ``PgVectorStore.query(raw=True)``
+QueryRow = tuple[str, float, Mapping[str, Any]]
+
+
+@dataclass(frozen=True)
+class VectorItemBatch:
+    """Column-oriented batch: one contiguous ``(n, d)`` float32 matrix plus
+    parallel ids and metadata.
+
+    Iterates as ``VectorItem``s (each vector a row view, not a copy), so any
+    store accepts it; PgVectorStore streams the columns without building them.
+    """
+
+    ids: list[str]
+    vectors: np.ndarray
+    metadatas: list[Mapping[str, Any]]
+
+    def __post_init__(self) -> None:
+        if self.vectors.ndim != 2:
+            raise ValueError("vectors must be a 2-D (n, d) array")
+        if not len(self.ids) == len(self.vectors) == len(self.metadatas):
+            raise ValueError("ids, vectors and metadatas must have equal length")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[VectorItem]:
+        for id_, vector, metadata in zip(
+            self.ids, self.vectors, self.metadatas, strict=True
+        ):
+            yield VectorItem(id=id_, vector=vector, metadata=metadata)
@@ -105,9 +105,9 @@ def _create_edge_case_pdf(path: Path) -> None:
     c.save()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def pdf_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    """Create all test PDFs once per module."""
+    """Create all test PDFs once per test session."""
     dir_path: Path = tmp_path_factory.mktemp("pdfs")
 
     _create_sample_pdf(dir_path / "sample.pdf")
@@ -117,7 +117,7 @@ def pdf_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     return dir_path
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def parsed_sample(pdf_dir: Path) -> ParsedDocument:
     """Parse sample PDF once, reuse across tests."""
     parser = PdfParser()
@@ -125,7 +125,7 @@ def parsed_sample(pdf_dir: Path) -> ParsedDocument:
         return parser.parse(f)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def parsed_multipage(pdf_dir: Path) -> ParsedDocument:
     """Parse multipage PDF once, reuse across tests."""
     parser = PdfParser()
@@ -133,7 +133,7 @@ def parsed_multipage(pdf_dir: Path) -> ParsedDocument:
         return parser.parse(f)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def parsed_edge_case(pdf_dir: Path) -> ParsedDocument:
     """Parse edge case PDF once, reuse across tests."""
     parser = PdfParser()
@@ -1,11 +1,13 @@
+import asyncio
 import os
 from collections.abc import AsyncGenerator
 
+import numpy as np
 import psycopg
 import pytest
 
 from llm_kit.vectorstores.pgvectorstore import PgVectorStore
-from llm_kit.vectorstores.types import VectorItem
+from llm_kit.vectorstores.types import VectorItem, VectorItemBatch
 
 
 @pytest.fixture(scope="session")
@@ -87,6 +89,72 @@ async def test_upsert_updates_existing_rows(store: PgVectorStore) -> None:
     assert results[0].metadata["k"] == "new"
 
 
+@pytest.mark.asyncio
+async def test_upsert_keeps_last_duplicate_in_batch(store: PgVectorStore) -> None:
+    await store.upsert(
+        items=[
+            VectorItem(id="a", vector=[1, 0, 0], metadata={"k": "first"}),
+            VectorItem(id="a", vector=[0, 1, 0], metadata={"k": "last"}),
+        ]
+    )
+
+    results = await store.query(vector=[0, 1, 0], top_k=10)
+    assert len(results) == 1
+    assert results[0].metadata["k"] == "last"
+
+
+@pytest.mark.asyncio
+async def test_upsert_accepts_generator(store: PgVectorStore) -> None:
+    await store.upsert(
+        items=(VectorItem(id=str(i), vector=[1, 0, i], metadata={}) for i in range(3))
+    )
+
+    results = await store.query(vector=[1, 0, 0], top_k=10)
+    assert {r.id for r in results} == {"0", "1", "2"}
+
+
+@pytest.mark.asyncio
+async def test_upsert_flushes_concurrent_batches(store: PgVectorStore) -> None:
+    await store.upsert(
+        items=[VectorItem(id=str(i), vector=[1, 0, i], metadata={}) for i in range(5)],
+        batch_size=2,
+        max_concurrency=2,
+    )
+
+    results = await store.query(vector=[1, 0, 0], top_k=10)
+    assert len(results) == 5
+
+
+@pytest.mark.asyncio
+async def test_upsert_accepts_column_batch(store: PgVectorStore) -> None:
+    await store.upsert(
+        items=VectorItemBatch(
+            ids=["a", "b"],
+            vectors=np.array([[1, 0, 0], [0, 1, 0]], dtype=np.float32),
+            metadatas=[{"k": "a"}, {"k": "b"}],
+        )
+    )
+
+    results = await store.query(vector=[0, 1, 0], top_k=1)
+    assert results[0].id == "b"
+    assert results[0].metadata["k"] == "b"
+
+
+@pytest.mark.asyncio
+async def test_upsert_buffered_writes_concurrent_items(store: PgVectorStore) -> None:
+    await asyncio.gather(
+        *(
+            store.upsert_buffered(
+                item=VectorItem(id=str(i), vector=[1, 0, i], metadata={})
+            )
+            for i in range(5)
+        )
+    )
+
+    results = await store.query(vector=[1, 0, 0], top_k=10)
+    assert len(results) == 5
+
+
 # --- Query ---
 
 
@@ -103,6 +171,34 @@ async def test_query_returns_nearest_neighbors(store: PgVectorStore) -> None:
     assert results[0].id == "close"
 
 
+@pytest.mark.asyncio
+async def test_query_raw_returns_tuples(store: PgVectorStore) -> None:
+    await store.upsert(
+        items=[VectorItem(id="a", vector=[1, 0, 0], metadata={"k": "v"})]
+    )
+
+    rows = await store.query(vector=[1, 0, 0], top_k=1, raw=True)
+    assert rows[0][0] == "a"
+    assert rows[0][2] == {"k": "v"}
+
+
+@pytest.mark.asyncio
+async def test_query_stream_yields_results_in_score_order(
+    store: PgVectorStore,
+) -> None:
+    await store.upsert(
+        items=[
+            VectorItem(id="close", vector=[1, 0, 0], metadata={}),
+            VectorItem(id="far", vector=[0, 1, 0], metadata={}),
+        ]
+    )
+
+    results = [
+        r async for r in store.query_stream(vector=[1, 0, 0], top_k=10, itersize=1)
+    ]
+    assert [r.id for r in results] == ["close", "far"]
+
+
 @pytest.mark.asyncio
 async def test_query_respects_namespace_isolation(store: PgVectorStore) -> None:
     await store.upsert(
@@ -1,14 +1,19 @@
 """Integration tests for QdrantVectorStore using local Qdrant instance."""
 
+import asyncio
 import contextlib
 import os
 import uuid
 from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock
 
+import numpy as np
 import pytest
 
+from llm_kit.embeddings.base import Embedding
+from llm_kit.vectorstores.cache import SemanticQueryCache
 from llm_kit.vectorstores.qdrantvectorstore import QdrantVectorStore
-from llm_kit.vectorstores.types import VectorItem
+from llm_kit.vectorstores.types import VectorItem, VectorItemBatch
 
 VECTOR_SIZE = 4
 COLLECTION_NAME = "llm-kit-test"
@@ -113,6 +118,34 @@ async def test_query_with_filters(store: QdrantVectorStore) -> None:
     assert all(r.metadata["color"] == "red" for r in results)
 
 
+@pytest.mark.asyncio
+async def test_filters_distinguish_bool_from_int() -> None:
+    """Test that True and 1 filters never share a cached filter or scope."""
+    store = QdrantVectorStore(
+        collection_name="test_bool_int_filters",
+        vector_size=VECTOR_SIZE,
+        query_cache=SemanticQueryCache(),
+    )
+    await store.upsert(
+        items=[
+            VectorItem(id=ID_A, vector=[1.0, 0.0, 0.0, 0.0], metadata={"flag": True}),
+            VectorItem(id=ID_B, vector=[1.0, 0.0, 0.0, 0.0], metadata={"flag": 1}),
+        ]
+    )
+
+    as_bool = await store.query(
+        vector=[1.0, 0.0, 0.0, 0.0], top_k=5, filters={"flag": True}
+    )
+    as_int = await store.query(
+        vector=[1.0, 0.0, 0.0, 0.0], top_k=5, filters={"flag": 1}
+    )
+
+    assert [r.id for r in as_bool] == [ID_A]
+    assert [r.id for r in as_int] == [ID_B]
+
+    await store.close()
+
+
 @pytest.mark.asyncio
 async def test_query_respects_top_k(store: QdrantVectorStore) -> None:
     """Test that query respects top_k limit."""
@@ -127,6 +160,19 @@ async def test_query_respects_top_k(store: QdrantVectorStore) -> None:
     assert len(results) == 3
 
 
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_create_collection(
+    store: QdrantVectorStore,
+) -> None:
+    """Test that concurrent first operations share one collection setup."""
+    results = await asyncio.gather(
+        *(store.query(vector=[1.0, 0.0, 0.0, 0.0], top_k=1) for _ in range(5))
+    )
+
+    assert results == [[]] * 5
+    assert await store._client.collection_exists(COLLECTION_NAME)
+
+
 @pytest.mark.asyncio
 async def test_query_top_k_validation(store: QdrantVectorStore) -> None:
     """Test that top_k < 1 raises ValueError."""
@@ -134,6 +180,90 @@ async def test_query_top_k_validation(store: QdrantVectorStore) -> None:
         await store.query(vector=[1.0, 0.0, 0.0, 0.0], top_k=0)
 
 
+@pytest.mark.asyncio
+async def test_upsert_sends_lazy_items_in_batches(qdrant_url: str) -> None:
+    """Test that a generator spanning several batches is fully written."""
+    store = QdrantVectorStore(
+        url=qdrant_url,
+        collection_name=COLLECTION_NAME,
+        vector_size=VECTOR_SIZE,
+        batch_size=2,
+        max_in_flight=2,
+    )
+    try:
+        await store.upsert(
+            items=(
+                VectorItem(
+                    id=make_id(str(i)), vector=[1.0, 0.0, 0.0, float(i)], metadata={}
+                )
+                for i in range(5)
+            )
+        )
+
+        results = await store.query(vector=[1.0, 0.0, 0.0, 0.0], top_k=10)
+        assert len(results) == 5
+    finally:
+        await store._client.delete_collection(COLLECTION_NAME)
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_upsert_column_batch_and_array_query(store: QdrantVectorStore) -> None:
+    """Test float32 column batches and ndarray query vectors."""
+    await store.upsert(
+        items=VectorItemBatch(
+            ids=[ID_A, ID_B],
+            vectors=np.array([[1, 0, 0, 0], [0, 1, 0, 0]], dtype=np.float32),
+            metadatas=[{"k": "a"}, {"k": "b"}],
+        )
+    )
+
+    results = await store.query(
+        vector=np.array([0, 1, 0, 0], dtype=np.float32), top_k=1
+    )
+
+    assert results[0].id == ID_B
+    assert results[0].metadata == {"k": "b"}
+
+
+@pytest.mark.asyncio
+async def test_query_text_embeds_and_queries(store: QdrantVectorStore) -> None:
+    """Test that query_text embeds the text and searches with the vector."""
+    embeddings = AsyncMock()
+    embeddings.embed.return_value = [
+        Embedding(vector=np.array([1, 0, 0, 0], dtype=np.float32))
+    ]
+    store._embeddings = embeddings
+    await store.upsert(
+        items=[VectorItem(id=ID_A, vector=[1.0, 0.0, 0.0, 0.0], metadata={})]
+    )
+
+    results = await store.query_text("hello", top_k=1)
+
+    embeddings.embed.assert_awaited_once_with(["hello"])
+    assert results[0].id == ID_A
+
+
+@pytest.mark.asyncio
+async def test_query_cache_serves_repeats_until_write(
+    store: QdrantVectorStore,
+) -> None:
+    """Test that the query cache answers repeats and is cleared by upserts."""
+    store._query_cache = SemanticQueryCache()
+    await store.upsert(
+        items=[VectorItem(id=ID_A, vector=[1.0, 0.0, 0.0, 0.0], metadata={})]
+    )
+
+    first = await store.query(vector=[1.0, 0.0, 0.0, 0.0], top_k=5)
+    assert await store.query(vector=[1.0, 0.0, 0.0, 0.0], top_k=5) is first
+
+    await store.upsert(
+        items=[VectorItem(id=ID_B, vector=[0.9, 0.1, 0.0, 0.0], metadata={})]
+    )
+    results = await store.query(vector=[1.0, 0.0, 0.0, 0.0], top_k=5)
+    assert len(results) == 2
+
+
 @pytest.mark.asyncio
 async def test_delete_by_ids(store: QdrantVectorStore) -> None:
     """Test deleting items by IDs."""
@@ -174,6 +304,36 @@ async def test_delete_by_filters(store: QdrantVectorStore) -> None:
     assert results[0].id == ID_B
 
 
+@pytest.mark.asyncio
+async def test_delete_by_ids_skips_other_namespaces(store: QdrantVectorStore) -> None:
+    """Test that id-based deletes leave other namespaces untouched."""
+    await store.upsert(
+        namespace="other",
+        items=[VectorItem(id=ID_A, vector=[1.0, 0.0, 0.0, 0.0], metadata={})],
+    )
+
+    deleted = await store.delete(ids=[ID_A])
+
+    assert deleted == 0
+    results = await store.query(
+        namespace="other", vector=[1.0, 0.0, 0.0, 0.0], top_k=10
+    )
+    assert len(results) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_without_count(store: QdrantVectorStore) -> None:
+    """Test that return_count=False still deletes matching points."""
+    await store.upsert(
+        items=[VectorItem(id=ID_A, vector=[1.0, 0.0, 0.0, 0.0], metadata={"k": "x"})]
+    )
+
+    deleted = await store.delete(filters={"k": "x"}, return_count=False)
+
+    assert deleted == 0
+    assert await store.query(vector=[1.0, 0.0, 0.0, 0.0], top_k=10) == []
+
+
 @pytest.mark.asyncio
 async def test_delete_requires_ids_or_filters(store: QdrantVectorStore) -> None:
     """Test that delete raises ValueError without ids or filters."""
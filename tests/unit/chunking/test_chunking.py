@@ -1,6 +1,12 @@
+import re
+from unittest.mock import Mock
+
 import pytest
+from tokenizers import Tokenizer, models, normalizers, pre_tokenizers, processors
+from transformers import PreTrainedTokenizerFast
 
 from llm_kit.chunking.chunking import Chunk, chunk_text
+from llm_kit.observability import names
 
 
 class TestChunkText:
@@ -60,6 +66,106 @@ class TestChunkText:
             result[0].metadata is not result[1].metadata
         )  # Ensure copies, not same reference
 
+    def test_empty_text_produces_no_chunks(self) -> None:
+        assert chunk_text("", chunk_size=4, overlap=1, metadata={}) == []
+
+    def test_last_chunk_ends_at_text_end(self) -> None:
+        """No trailing chunks are emitted once the end of text is reached."""
+        result = chunk_text("abcdefghij", chunk_size=4, overlap=3, metadata={})
+
+        assert result[-1].offset_end == 10
+        assert [c.offset_start for c in result] == list(range(7))
+        assert all(isinstance(c.offset_start, int) for c in result)
+
+
+class WordTokenizer:
+    """Toy tokenizer: one token per whitespace-separated word."""
+
+    def __call__(
+        self,
+        text: str,
+        *,
+        add_special_tokens: bool,
+        return_offsets_mapping: bool,
+    ) -> dict[str, list]:
+        assert not add_special_tokens and return_offsets_mapping
+        spans = [m.span() for m in re.finditer(r"\S+", text)]
+        return {"input_ids": list(range(len(spans))), "offset_mapping": spans}
+
+
+def _hf_tokenizer() -> PreTrainedTokenizerFast:
+    """Real HF fast tokenizer that adds [CLS]/[SEP] and lowercases/strips accents."""
+    vocab = {"[UNK]": 0, "[CLS]": 1, "[SEP]": 2, "hello": 3, "world": 4, "cafe": 5}
+    vocab |= {",": 6, "!": 7}
+    tokenizer = Tokenizer(models.WordLevel(vocab, unk_token="[UNK]"))
+    tokenizer.normalizer = normalizers.BertNormalizer(
+        lowercase=True, strip_accents=True
+    )
+    tokenizer.pre_tokenizer = pre_tokenizers.BertPreTokenizer()
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="[CLS] $A [SEP]", special_tokens=[("[CLS]", 1), ("[SEP]", 2)]
+    )
+    return PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer,
+        unk_token="[UNK]",
+        cls_token="[CLS]",
+        sep_token="[SEP]",
+    )
+
+
+class TestChunkTextByToken:
+    def test_chunks_by_token_count(self) -> None:
+        """chunk_size and overlap count tokens when unit='token'."""
+        result = chunk_text(
+            "a b c d e f g",
+            chunk_size=3,
+            overlap=1,
+            metadata={"source_id": "doc1"},
+            unit="token",
+            tokenizer=WordTokenizer(),
+        )
+
+        assert [c.text for c in result] == ["a b c", "c d e", "e f g"]
+        # Offsets and ids are character offsets in both units
+        assert [c.chunk_id for c in result] == ["doc1:0:5", "doc1:4:9", "doc1:8:13"]
+
+    def test_hf_tokenizer_chunks_slice_source_without_specials(self) -> None:
+        """Special tokens are not counted and text is never decoded."""
+        text = "Hello,  World! Café"
+        result = chunk_text(
+            text,
+            chunk_size=2,
+            overlap=0,
+            metadata={},
+            unit="token",
+            tokenizer=_hf_tokenizer(),
+        )
+
+        assert [c.text for c in result] == ["Hello,", "World!", "Café"]
+        assert all(text[c.offset_start : c.offset_end] == c.text for c in result)
+
+    def test_raises_without_tokenizer(self) -> None:
+        with pytest.raises(ValueError, match="requires a tokenizer"):
+            chunk_text("text", chunk_size=5, overlap=0, metadata={}, unit="token")
+
+
+class TestChunkTextMetrics:
+    def test_records_wall_clock_duration(self) -> None:
+        """Duration is measured from the call start, not from a chunk offset."""
+        hook = Mock()
+        chunk_text(
+            "x" * 100_000,
+            chunk_size=10,
+            overlap=0,
+            metadata={},
+            metrics_hook=hook,
+        )
+
+        name, elapsed_ms = hook.record_latency.call_args.args
+        assert name == names.CHUNKING_DURATION
+        assert 0 <= elapsed_ms < 10_000
+        hook.increment.assert_called_once_with(names.CHUNKING_CHUNKS_CREATED, 10_000)
+
 
 class TestChunkTextValidation:
     def test_raises_on_zero_chunk_size(self) -> None:
@@ -92,3 +198,11 @@ class TestChunkDataclass:
 
         with pytest.raises(AttributeError):
             chunk.text = "modified"  # type: ignore
+
+    def test_chunk_has_no_instance_dict(self) -> None:
+        """Chunks use __slots__ to keep per-chunk overhead small."""
+        chunk = Chunk(
+            chunk_id="id", text="text", offset_start=0, offset_end=4, metadata={}
+        )
+
+        assert not hasattr(chunk, "__dict__")
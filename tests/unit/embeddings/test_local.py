@@ -3,17 +3,28 @@ from unittest.mock import Mock, patch
 
 import numpy as np
 import pytest
+import torch
 
 from llm_kit.embeddings.base import Embedding
-from llm_kit.embeddings.local import LocalEmbeddingsClient
+from llm_kit.embeddings.local import LocalEmbeddingsClient, _load_model
+from llm_kit.observability import names
 
 
 @pytest.fixture
-def mock_sentence_transformer() -> Generator[Mock, None, None]:
+def mock_sentence_transformer_cls() -> Generator[Mock, None, None]:
+    """Fixture that patches the SentenceTransformer class."""
+    _load_model.cache_clear()
+    with patch("llm_kit.embeddings.local.SentenceTransformer") as mock_cls:
+        mock_cls.return_value = Mock()
+        yield mock_cls
+    _load_model.cache_clear()
+
+
+@pytest.fixture
+def mock_sentence_transformer(mock_sentence_transformer_cls: Mock) -> Mock:
     """Fixture that patches SentenceTransformer and returns the mock model."""
-    mock_model = Mock()
-    with patch("llm_kit.embeddings.local.SentenceTransformer", return_value=mock_model):
-        yield mock_model
+    model: Mock = mock_sentence_transformer_cls.return_value
+    return model
 
 
 @pytest.mark.asyncio
@@ -31,7 +42,8 @@ async def test_embed_returns_one_vector_per_input(
 
     assert len(embeddings) == 3
     assert all(isinstance(e, Embedding) for e in embeddings)
-    assert all(isinstance(e.vector, list) for e in embeddings)
+    assert all(isinstance(e.vector, np.ndarray) for e in embeddings)
+    assert all(e.vector.dtype == np.float32 for e in embeddings)
 
 
 @pytest.mark.asyncio
@@ -69,3 +81,174 @@ async def test_embed_with_empty_input(mock_sentence_transformer: Mock) -> None:
     embeddings = await client.embed([])
     assert embeddings == []
     assert embeddings == []
+
+
+@pytest.mark.asyncio
+async def test_embed_batches_by_length_and_preserves_order(
+    mock_sentence_transformer: Mock,
+) -> None:
+    """Texts are batched shortest-first but returned in caller order."""
+    mock_sentence_transformer.encode.side_effect = lambda batch, **_: np.array(
+        [[float(len(t))] for t in batch]
+    )
+    client = LocalEmbeddingsClient(model_name="fake-model", batch_size=2)
+    texts = ["ccc", "a", "dddd", "bb"]
+
+    embeddings = await client.embed(texts)
+
+    assert [e.vector[0] for e in embeddings] == [3.0, 1.0, 4.0, 2.0]
+    calls = mock_sentence_transformer.encode.call_args_list
+    assert [call.args[0] for call in calls] == [["a", "bb"], ["ccc", "dddd"]]
+
+
+@pytest.mark.asyncio
+async def test_embed_stream_yields_batches_in_input_order(
+    mock_sentence_transformer: Mock,
+) -> None:
+    mock_sentence_transformer.encode.side_effect = lambda batch, **_: np.array(
+        [[float(len(t))] for t in batch]
+    )
+    client = LocalEmbeddingsClient(model_name="fake-model", batch_size=2)
+
+    batches = [b async for b in client.embed_stream(["ccc", "a", "dddd"])]
+
+    assert [offset for offset, _ in batches] == [0, 2]
+    assert [[e.vector[0] for e in embs] for _, embs in batches] == [
+        [3.0, 1.0],
+        [4.0],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_embed_matrix_returns_rows_in_input_order(
+    mock_sentence_transformer: Mock,
+) -> None:
+    mock_sentence_transformer.encode.side_effect = lambda batch, **_: np.array(
+        [[float(len(t)), 0.0] for t in batch]
+    )
+    client = LocalEmbeddingsClient(model_name="fake-model", batch_size=2)
+
+    matrix = await client.embed_matrix(["ccc", "a", "dddd"])
+
+    assert matrix.shape == (3, 2)
+    assert matrix.dtype == np.float32
+    assert matrix.flags.c_contiguous
+    assert matrix[:, 0].tolist() == [3.0, 1.0, 4.0]
+
+
+@pytest.mark.asyncio
+async def test_embed_caps_batches_by_total_characters(
+    mock_sentence_transformer: Mock,
+) -> None:
+    mock_sentence_transformer.encode.side_effect = lambda batch, **_: np.zeros(
+        (len(batch), 3)
+    )
+    client = LocalEmbeddingsClient(
+        model_name="fake-model", batch_size=10, max_batch_chars=6
+    )
+
+    await client.embed(["aa", "bb", "cc", "dddd", "eeeeeeee"])
+
+    calls = mock_sentence_transformer.encode.call_args_list
+    assert [call.args[0] for call in calls] == [
+        ["aa", "bb", "cc"],
+        ["dddd"],
+        ["eeeeeeee"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_embed_falls_back_to_sequential_on_oom(
+    mock_sentence_transformer: Mock,
+) -> None:
+    def encode(batch: list[str], **_: object) -> np.ndarray:
+        if len(batch) > 1:
+            raise torch.cuda.OutOfMemoryError("CUDA out of memory")
+        return np.array([[float(len(batch[0]))]])
+
+    mock_sentence_transformer.encode.side_effect = encode
+    client = LocalEmbeddingsClient(model_name="fake-model")
+
+    embeddings = await client.embed(["a", "bb", "ccc"])
+
+    assert [e.vector[0] for e in embeddings] == [1.0, 2.0, 3.0]
+
+
+def test_reduced_precision_casts_model_weights(
+    mock_sentence_transformer: Mock,
+) -> None:
+    LocalEmbeddingsClient(model_name="fake-model", dtype="bf16")
+
+    mock_sentence_transformer.to.assert_called_once_with(dtype=torch.bfloat16)
+
+
+@pytest.mark.asyncio
+async def test_reduced_precision_still_returns_float32(
+    mock_sentence_transformer: Mock,
+) -> None:
+    mock_sentence_transformer.encode.return_value = np.ones((2, 3), dtype=np.float16)
+    client = LocalEmbeddingsClient(model_name="fake-model", dtype="fp16")
+
+    embeddings = await client.embed(["a", "b"])
+
+    assert all(e.vector.dtype == np.float32 for e in embeddings)
+
+
+def test_onnx_backend_loads_requested_model_file(
+    mock_sentence_transformer_cls: Mock,
+) -> None:
+    LocalEmbeddingsClient(
+        model_name="fake-model",
+        backend="onnx",
+        model_file="onnx/model_qint8_avx512_vnni.onnx",
+    )
+
+    mock_sentence_transformer_cls.assert_called_once_with(
+        "fake-model",
+        backend="onnx",
+        model_kwargs={"file_name": "onnx/model_qint8_avx512_vnni.onnx"},
+    )
+
+
+def test_reduced_precision_requires_torch_backend(
+    mock_sentence_transformer_cls: Mock,
+) -> None:
+    with pytest.raises(ValueError, match="requires backend='torch'"):
+        LocalEmbeddingsClient(model_name="fake-model", backend="onnx", dtype="fp16")
+
+    mock_sentence_transformer_cls.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cache_skips_inference_for_seen_texts(
+    mock_sentence_transformer: Mock,
+) -> None:
+    mock_sentence_transformer.encode.side_effect = lambda batch, **_: np.array(
+        [[float(len(t))] for t in batch]
+    )
+    metrics_hook = Mock()
+    client = LocalEmbeddingsClient(
+        model_name="fake-model", cache_size=10, metrics_hook=metrics_hook
+    )
+
+    await client.embed(["a", "bb"])
+    embeddings = await client.embed(["bb", "ccc", "ccc", "a"])
+
+    assert [e.vector[0] for e in embeddings] == [2.0, 3.0, 3.0, 1.0]
+    calls = mock_sentence_transformer.encode.call_args_list
+    assert [call.args[0] for call in calls] == [["a", "bb"], ["ccc"]]
+    metrics_hook.increment.assert_any_call(
+        names.EMBEDDINGS_CACHE_HITS, 2, labels={"backend": "local"}
+    )
+
+
+def test_clients_with_same_settings_share_one_model(
+    mock_sentence_transformer_cls: Mock,
+) -> None:
+    LocalEmbeddingsClient.preload("fake-model")
+    first = LocalEmbeddingsClient(model_name="fake-model")
+    second = LocalEmbeddingsClient(model_name="fake-model")
+    LocalEmbeddingsClient(model_name="fake-model", dtype="fp16")
+
+    assert first._model is second._model
+    assert mock_sentence_transformer_cls.call_count == 2
@@ -1,15 +1,20 @@
+import asyncio
+import base64
 from unittest.mock import AsyncMock, Mock
 
+import numpy as np
 import pytest
-from openai import APITimeoutError
+from openai import APITimeoutError, BadRequestError, RateLimitError
 
 from llm_kit.embeddings.base import Embedding
 from llm_kit.embeddings.openai import OpenAIEmbeddingsClient
 
 
 def _mock_response(num_embeddings: int) -> Mock:
-    """Create a mock response with the given number of embeddings."""
-    return Mock(data=[Mock(embedding=[0.1, 0.2, 0.3]) for _ in range(num_embeddings)])
+    """Create a mock response with the given number of base64 embeddings."""
+    vector = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+    encoded = base64.b64encode(vector.tobytes()).decode()
+    return Mock(data=[Mock(embedding=encoded) for _ in range(num_embeddings)])
 
 
 @pytest.mark.asyncio
@@ -24,7 +29,10 @@ async def test_embed_returns_one_vector_per_input() -> None:
 
     assert len(embeddings) == 3
     assert all(isinstance(e, Embedding) for e in embeddings)
-    assert all(isinstance(e.vector, list) for e in embeddings)
+    assert all(isinstance(e.vector, np.ndarray) for e in embeddings)
+    assert all(e.vector.dtype == np.float32 for e in embeddings)
+    np.testing.assert_allclose(embeddings[0].vector, [0.1, 0.2, 0.3], rtol=1e-6)
+    assert mock_client.embeddings.create.call_args.kwargs["encoding_format"] == "base64"
 
 
 @pytest.mark.asyncio
@@ -71,3 +79,157 @@ async def test_embed_with_empty_input() -> None:
 
     assert embeddings == []
     mock_client.embeddings.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_embed_stream_yields_every_batch_with_offset() -> None:
+    client = OpenAIEmbeddingsClient(api_key="fake", model="fake-model", batch_size=2)
+
+    mock_client = AsyncMock()
+    mock_client.embeddings.create.side_effect = lambda **kwargs: _mock_response(
+        len(kwargs["input"])
+    )
+    client._client = mock_client
+
+    batches = [b async for b in client.embed_stream(["a", "b", "c", "d", "e"])]
+
+    assert sorted((offset, len(embs)) for offset, embs in batches) == [
+        (0, 2),
+        (2, 2),
+        (4, 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_embed_matrix_places_batches_at_their_offsets() -> None:
+    client = OpenAIEmbeddingsClient(api_key="fake", model="fake-model", batch_size=2)
+
+    mock_client = AsyncMock()
+    mock_client.embeddings.create.side_effect = lambda input, **_: _mock_response(
+        len(input)
+    )
+    client._client = mock_client
+
+    matrix = await client.embed_matrix(["a", "b", "c"])
+
+    assert matrix.shape == (3, 3)
+    assert matrix.dtype == np.float32
+    np.testing.assert_allclose(matrix[2], [0.1, 0.2, 0.3], rtol=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used() -> None:
+    client = OpenAIEmbeddingsClient(api_key="fake", model="fake-model", cache_size=2)
+
+    mock_client = AsyncMock()
+    mock_client.embeddings.create.side_effect = lambda **kwargs: _mock_response(
+        len(kwargs["input"])
+    )
+    client._client = mock_client
+
+    await client.embed(["a", "b"])
+    await client.embed(["c"])  # evicts "a"
+    await client.embed(["a", "c"])
+
+    calls = mock_client.embeddings.create.call_args_list
+    assert [call.kwargs["input"] for call in calls] == [["a", "b"], ["c"], ["a"]]
+
+
+@pytest.mark.asyncio
+async def test_embed_caps_requests_by_total_characters() -> None:
+    client = OpenAIEmbeddingsClient(
+        api_key="fake", model="fake-model", max_batch_chars=10
+    )
+
+    mock_client = AsyncMock()
+    mock_client.embeddings.create.side_effect = lambda **kwargs: _mock_response(
+        len(kwargs["input"])
+    )
+    client._client = mock_client
+
+    embeddings = await client.embed(["aaaa", "bbbb", "cccc", "dd"])
+
+    assert len(embeddings) == 4
+    calls = mock_client.embeddings.create.call_args_list
+    assert sorted(call.kwargs["input"] for call in calls) == [
+        ["aaaa", "bbbb"],
+        ["cccc", "dd"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_close_closes_http_client() -> None:
+    client = OpenAIEmbeddingsClient(api_key="fake", model="fake-model")
+    mock_client = AsyncMock()
+    client._client = mock_client
+
+    await client.close()
+
+    mock_client.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_embed_runs_batches_concurrently_up_to_max_concurrent() -> None:
+    client = OpenAIEmbeddingsClient(
+        api_key="fake", model="fake-model", batch_size=1, max_concurrent=2
+    )
+    in_flight = 0
+    peak = 0
+
+    async def create(**_: object) -> Mock:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _mock_response(1)
+
+    mock_client = AsyncMock()
+    mock_client.embeddings.create.side_effect = create
+    client._client = mock_client
+
+    embeddings = await client.embed(["a", "b", "c", "d", "e"])
+
+    assert len(embeddings) == 5
+    assert peak == 2
+
+
+def _error_response(status_code: int, headers: dict[str, str] | None = None) -> Mock:
+    return Mock(status_code=status_code, headers=headers or {}, request=Mock())
+
+
+@pytest.mark.asyncio
+async def test_embed_does_not_retry_bad_request() -> None:
+    client = OpenAIEmbeddingsClient(api_key="fake", model="fake-model")
+
+    mock_client = AsyncMock()
+    mock_client.embeddings.create.side_effect = BadRequestError(
+        "bad input", response=_error_response(400), body=None
+    )
+    client._client = mock_client
+
+    with pytest.raises(BadRequestError):
+        await client.embed(["test"])
+
+    assert mock_client.embeddings.create.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_embed_retries_rate_limit_after_retry_after() -> None:
+    client = OpenAIEmbeddingsClient(api_key="fake", model="fake-model")
+
+    mock_client = AsyncMock()
+    mock_client.embeddings.create.side_effect = [
+        RateLimitError(
+            "slow down",
+            response=_error_response(429, {"retry-after": "0"}),
+            body=None,
+        ),
+        _mock_response(1),
+    ]
+    client._client = mock_client
+
+    embeddings = await client.embed(["test"])
+
+    assert len(embeddings) == 1
+    assert mock_client.embeddings.create.call_count == 2
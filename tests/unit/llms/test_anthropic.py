@@ -1,8 +1,12 @@
 # tests/unit/llms/test_anthropic.py
 
+import asyncio
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from anthropic import APITimeoutError
 from pydantic import BaseModel
 
 from llm_kit.llms.anthropic import AnthropicLLMClient
@@ -68,6 +72,36 @@ class TestAnthropicLLMClient:
             assert response.usage.total_tokens == 18
             assert response.latency_ms > 0
 
+    @pytest.mark.asyncio
+    async def test_retries_send_no_idempotency_header(
+        self, mock_anthropic_response: MagicMock
+    ) -> None:
+        """Anthropic has no documented idempotency header; none is sent."""
+        with (
+            patch("llm_kit.llms.anthropic.AsyncAnthropic") as mock_anthropic,
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(
+                side_effect=[
+                    APITimeoutError(
+                        request=httpx.Request("POST", "https://api.anthropic.com")
+                    ),
+                    mock_anthropic_response,
+                ]
+            )
+            mock_anthropic.return_value = mock_client
+
+            client = AnthropicLLMClient(api_key="test-key")
+            response = await client.complete(
+                messages=[Message(role=Role.USER, content="Hi")]
+            )
+
+            assert response.content == "Hello! How can I help you?"
+            calls = mock_client.messages.create.call_args_list
+            assert len(calls) == 2
+            assert all("extra_headers" not in call.kwargs for call in calls)
+
     @pytest.mark.asyncio
     async def test_complete_with_tools(
         self, mock_anthropic_tool_response: MagicMock
@@ -173,3 +207,192 @@ class TestAnthropicLLMClient:
             )
 
             assert result.finish_reason == "length"
+
+    @pytest.mark.asyncio
+    async def test_complete_batch_routes_results_by_custom_id(
+        self, mock_anthropic_response: MagicMock
+    ) -> None:
+        """Batch results are mapped back to request order."""
+
+        async def results() -> AsyncIterator[MagicMock]:
+            yield MagicMock(
+                custom_id="1",
+                result=MagicMock(type="succeeded", message=mock_anthropic_response),
+            )
+            yield MagicMock(custom_id="0", result=MagicMock(type="errored"))
+
+        with patch("llm_kit.llms.anthropic.AsyncAnthropic") as mock_anthropic:
+            mock_client = AsyncMock()
+            mock_client.messages.batches.create.return_value = MagicMock(
+                id="batch-1", processing_status="in_progress"
+            )
+            mock_client.messages.batches.retrieve.return_value = MagicMock(
+                id="batch-1", processing_status="ended"
+            )
+            mock_client.messages.batches.results.return_value = results()
+            mock_anthropic.return_value = mock_client
+
+            client = AnthropicLLMClient(api_key="test-key")
+            responses = await client.complete_batch(
+                [
+                    [
+                        Message(role=Role.SYSTEM, content="Be brief"),
+                        Message(role=Role.USER, content="a"),
+                    ],
+                    [Message(role=Role.USER, content="b")],
+                ],
+                poll_interval=0,
+            )
+
+            assert [r.finish_reason for r in responses] == ["error", "stop"]
+            assert responses[1].content == "Hello! How can I help you?"
+            requests = mock_client.messages.batches.create.call_args.kwargs["requests"]
+            assert requests[0]["params"]["system"] == "Be brief"
+            assert "system" not in requests[1]["params"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_completions_overlap(
+        self, mock_anthropic_response: MagicMock
+    ) -> None:
+        """complete() is async-native: concurrent calls don't serialize."""
+        in_flight = 0
+        peak = 0
+
+        async def create(**_: object) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_anthropic_response
+
+        with patch("llm_kit.llms.anthropic.AsyncAnthropic") as mock_anthropic:
+            mock_client = AsyncMock()
+            mock_client.messages.create.side_effect = create
+            mock_anthropic.return_value = mock_client
+
+            client = AnthropicLLMClient(api_key="test-key")
+            await asyncio.gather(
+                *(
+                    client.complete(
+                        messages=[Message(role=Role.USER, content=str(i))],
+                        temperature=0.5,
+                    )
+                    for i in range(3)
+                )
+            )
+
+            assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_long_prompts_get_cache_breakpoints(
+        self, mock_anthropic_response: MagicMock
+    ) -> None:
+        """Long system prompts and conversations are marked for prompt caching."""
+        with patch("llm_kit.llms.anthropic.AsyncAnthropic") as mock_anthropic:
+            mock_client = AsyncMock()
+            mock_client.messages.create.return_value = mock_anthropic_response
+            mock_anthropic.return_value = mock_client
+
+            client = AnthropicLLMClient(api_key="test-key", prompt_caching=True)
+            history = [
+                Message(role=Role.SYSTEM, content="s" * 5000),
+                Message(role=Role.USER, content="u" * 5000),
+                Message(role=Role.ASSISTANT, content="a"),
+                Message(role=Role.USER, content="latest"),
+            ]
+            await client.complete(messages=history)
+
+            kwargs = mock_client.messages.create.call_args.kwargs
+            assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+            assert kwargs["messages"][0]["content"] == "u" * 5000
+            assert kwargs["messages"][-1]["content"] == [
+                {
+                    "type": "text",
+                    "text": "latest",
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+            # The memoized conversion of the message is left untouched
+            assert client._convert_messages(history[3:]) == [
+                {"role": "user", "content": "latest"}
+            ]
+
+    @pytest.mark.asyncio
+    async def test_prompt_caching_is_off_by_default(
+        self, mock_anthropic_response: MagicMock
+    ) -> None:
+        with patch("llm_kit.llms.anthropic.AsyncAnthropic") as mock_anthropic:
+            mock_client = AsyncMock()
+            mock_client.messages.create.return_value = mock_anthropic_response
+            mock_anthropic.return_value = mock_client
+
+            client = AnthropicLLMClient(api_key="test-key")
+            await client.complete(
+                messages=[
+                    Message(role=Role.SYSTEM, content="s" * 5000),
+                    Message(role=Role.USER, content="u" * 5000),
+                ]
+            )
+
+            kwargs = mock_client.messages.create.call_args.kwargs
+            assert kwargs["system"] == "s" * 5000
+            assert kwargs["messages"] == [{"role": "user", "content": "u" * 5000}]
+
+    @pytest.mark.asyncio
+    async def test_short_prompts_are_sent_unchanged(
+        self, mock_anthropic_response: MagicMock
+    ) -> None:
+        with patch("llm_kit.llms.anthropic.AsyncAnthropic") as mock_anthropic:
+            mock_client = AsyncMock()
+            mock_client.messages.create.return_value = mock_anthropic_response
+            mock_anthropic.return_value = mock_client
+
+            client = AnthropicLLMClient(api_key="test-key", prompt_caching=True)
+            await client.complete(
+                messages=[
+                    Message(role=Role.SYSTEM, content="Be brief"),
+                    Message(role=Role.USER, content="Hi"),
+                ]
+            )
+
+            kwargs = mock_client.messages.create.call_args.kwargs
+            assert kwargs["system"] == "Be brief"
+            assert kwargs["messages"] == [{"role": "user", "content": "Hi"}]
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_deltas_then_final_chunk(
+        self, mock_anthropic_response: MagicMock
+    ) -> None:
+        async def text_stream() -> AsyncIterator[str]:
+            yield "Hello! "
+            yield "How can I help you?"
+
+        stream = MagicMock()
+        stream.text_stream = text_stream()
+        stream.get_final_message = AsyncMock(return_value=mock_anthropic_response)
+        manager = MagicMock()
+        manager.__aenter__.return_value = stream
+
+        with patch("llm_kit.llms.anthropic.AsyncAnthropic") as mock_anthropic:
+            mock_client = MagicMock()
+            mock_client.messages.stream.return_value = manager
+            mock_anthropic.return_value = mock_client
+
+            client = AnthropicLLMClient(api_key="test-key")
+            chunks = [
+                chunk
+                async for chunk in client.stream(
+                    messages=[
+                        Message(role=Role.SYSTEM, content="Be brief"),
+                        Message(role=Role.USER, content="Hi"),
+                    ]
+                )
+            ]
+
+            assert [c.delta for c in chunks[:-1]] == ["Hello! ", "How can I help you?"]
+            assert chunks[-1].finish_reason == "stop"
+            assert chunks[-1].usage is not None
+            kwargs = mock_client.messages.stream.call_args.kwargs
+            assert kwargs["system"] == "Be brief"
+            assert kwargs["max_tokens"] == 4096
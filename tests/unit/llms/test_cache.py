@@ -0,0 +1,154 @@
+# tests/unit/llms/test_cache.py
+
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from llm_kit.embeddings.base import Embedding
+from llm_kit.llms.base import LLMResponse, Message, Role, Usage
+from llm_kit.llms.cache import InMemoryLRUCache, SemanticCache
+
+SCOPE = b"scope"
+
+
+def _response(content: str) -> LLMResponse:
+    return LLMResponse(
+        content=content,
+        tool_calls=[],
+        finish_reason="stop",
+        usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+        latency_ms=1.0,
+    )
+
+
+def _messages(content: str) -> list[Message]:
+    return [Message(role=Role.USER, content=content)]
+
+
+class TestInMemoryLRUCache:
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self) -> None:
+        cache = InMemoryLRUCache(maxsize=2)
+        await cache.put(b"a", _messages("a"), SCOPE, _response("a"))
+        await cache.put(b"b", _messages("b"), SCOPE, _response("b"))
+        await cache.get(b"a", _messages("a"), SCOPE)
+        await cache.put(b"c", _messages("c"), SCOPE, _response("c"))
+
+        assert await cache.get(b"a", _messages("a"), SCOPE) is not None
+        assert await cache.get(b"b", _messages("b"), SCOPE) is None
+        assert await cache.get(b"c", _messages("c"), SCOPE) is not None
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self) -> None:
+        cache = InMemoryLRUCache(ttl=10)
+        with patch("llm_kit.llms.cache.monotonic", return_value=100.0):
+            await cache.put(b"a", _messages("a"), SCOPE, _response("a"))
+
+        with patch("llm_kit.llms.cache.monotonic", return_value=105.0):
+            assert await cache.get(b"a", _messages("a"), SCOPE) is not None
+        with patch("llm_kit.llms.cache.monotonic", return_value=111.0):
+            assert await cache.get(b"a", _messages("a"), SCOPE) is None
+
+    def test_rejects_non_positive_maxsize(self) -> None:
+        with pytest.raises(ValueError, match="maxsize must be >= 1"):
+            InMemoryLRUCache(maxsize=0)
+
+
+class TestSemanticCache:
+    @pytest.mark.asyncio
+    async def test_similar_conversation_hits_and_dissimilar_misses(self) -> None:
+        vectors = {
+            "user: What is the capital of France?": [1.0, 0.0],
+            "user: what's the capital of France": [0.99, 0.05],
+            "user: How do I bake bread?": [0.0, 1.0],
+        }
+        embeddings = AsyncMock()
+        embeddings.embed.side_effect = lambda texts: [
+            Embedding(vector=np.array(vectors[t], dtype=np.float32)) for t in texts
+        ]
+        cache = SemanticCache(embeddings, threshold=0.95)
+
+        await cache.put(
+            b"k1",
+            _messages("What is the capital of France?"),
+            SCOPE,
+            _response("Paris"),
+        )
+
+        hit = await cache.get(b"k2", _messages("what's the capital of France"), SCOPE)
+        miss = await cache.get(b"k3", _messages("How do I bake bread?"), SCOPE)
+
+        assert hit is not None and hit.content == "Paris"
+        assert miss is None
+
+    @pytest.mark.asyncio
+    async def test_exact_hit_skips_embedding(self) -> None:
+        embeddings = AsyncMock()
+        embeddings.embed.return_value = [
+            Embedding(vector=np.array([1.0, 0.0], dtype=np.float32))
+        ]
+        cache = SemanticCache(embeddings)
+        await cache.put(b"k1", _messages("hi"), SCOPE, _response("hello"))
+        embeddings.embed.reset_mock()
+
+        assert await cache.get(b"k1", _messages("hi"), SCOPE) is not None
+        embeddings.embed.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_semantic_match_stays_within_scope(self) -> None:
+        embeddings = AsyncMock()
+        embeddings.embed.return_value = [
+            Embedding(vector=np.array([1.0, 0.0], dtype=np.float32))
+        ]
+        cache = SemanticCache(embeddings)
+        await cache.put(b"k1", _messages("hi"), b"model-a", _response("hello"))
+
+        assert await cache.get(b"k2", _messages("hi!"), b"model-b") is None
+        assert await cache.get(b"k2", _messages("hi!"), b"model-a") is not None
+
+    @pytest.mark.asyncio
+    async def test_evicted_entries_leave_the_index(self) -> None:
+        embeddings = AsyncMock()
+        embeddings.embed.side_effect = lambda texts: [
+            Embedding(vector=np.array([1.0, float(len(t))], dtype=np.float32))
+            for t in texts
+        ]
+        cache = SemanticCache(embeddings, maxsize=2)
+        for name in ("a", "bb", "ccc"):
+            await cache.put(name.encode(), _messages(name), SCOPE, _response(name))
+
+        assert set(cache._scopes) == {b"bb", b"ccc"}
+        keys, matrix = cache._matrix(SCOPE)
+        assert sorted(keys) == [b"bb", b"ccc"] and matrix.shape == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_put_after_expiry_keeps_one_row(self) -> None:
+        embeddings = AsyncMock()
+        embeddings.embed.return_value = [
+            Embedding(vector=np.array([1.0, 0.0], dtype=np.float32))
+        ]
+        cache = SemanticCache(embeddings, ttl=10)
+        with patch("llm_kit.llms.cache.monotonic", return_value=100.0):
+            await cache.put(b"k1", _messages("hi"), SCOPE, _response("old"))
+        with patch("llm_kit.llms.cache.monotonic", return_value=111.0):
+            await cache.put(b"k1", _messages("hi"), SCOPE, _response("new"))
+            hit = await cache.get(b"k2", _messages("hi!"), SCOPE)
+
+        assert hit is not None and hit.content == "new"
+        keys, _ = cache._matrix(SCOPE)
+        assert keys == [b"k1"]
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_dropped_from_index(self) -> None:
+        embeddings = AsyncMock()
+        embeddings.embed.return_value = [
+            Embedding(vector=np.array([1.0, 0.0], dtype=np.float32))
+        ]
+        cache = SemanticCache(embeddings, ttl=10)
+        with patch("llm_kit.llms.cache.monotonic", return_value=100.0):
+            await cache.put(b"k1", _messages("hi"), SCOPE, _response("hello"))
+        with patch("llm_kit.llms.cache.monotonic", return_value=111.0):
+            assert await cache.get(b"k2", _messages("hi!"), SCOPE) is None
+
+        assert cache._scopes == {} and cache._index == {}
@@ -46,4 +46,6 @@ class TestFactory:
 
             assert client._model == "gpt-4-turbo"
             assert client._max_retries == 5
-            mock_openai.assert_called_once_with(api_key="my-key", timeout=60.0)
+            mock_openai.assert_called_once_with(
+                api_key="my-key", timeout=60.0, http_client=None
+            )
@@ -0,0 +1,70 @@
+# tests/unit/llms/test_fanout.py
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from llm_kit.llms._fanout import RateLimiter, fan_out
+
+
+class TestFanOut:
+    @pytest.mark.asyncio
+    async def test_returns_results_in_input_order(self) -> None:
+        async def work(delay: float) -> float:
+            await asyncio.sleep(delay)
+            return delay
+
+        results = await fan_out(
+            work, [0.03, 0.01, 0.02], max_concurrency=3, rate_limit_per_min=None
+        )
+
+        assert results == [0.03, 0.01, 0.02]
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency_and_returns_failures(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def work(i: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if i == 2:
+                raise RuntimeError("boom")
+            return i
+
+        results = await fan_out(
+            work, list(range(5)), max_concurrency=2, rate_limit_per_min=None
+        )
+
+        assert peak == 2
+        assert results[:2] == [0, 1]
+        assert isinstance(results[2], RuntimeError)
+        assert results[3:] == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+            await fan_out(AsyncMock(), [1], max_concurrency=0, rate_limit_per_min=None)
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_allows_burst_then_waits_for_refill(self) -> None:
+        with (
+            patch("llm_kit.llms._fanout.monotonic", return_value=0.0),
+            patch("llm_kit.llms._fanout.asyncio.sleep") as mock_sleep,
+        ):
+            limiter = RateLimiter(rate=2, period=60)
+            await limiter.acquire()
+            await limiter.acquire()
+            mock_sleep.assert_not_called()
+
+            # Bucket is empty; the next token arrives after 30s
+            mock_sleep.side_effect = asyncio.CancelledError
+            with pytest.raises(asyncio.CancelledError):
+                await limiter.acquire()
+            mock_sleep.assert_called_once_with(30.0)
@@ -6,7 +6,9 @@ import pytest
 from pydantic import BaseModel
 
 from llm_kit.llms.base import Message, Role
-from llm_kit.llms.openai import OpenAILLMClient
+from llm_kit.llms.http import default_http_client
+from llm_kit.llms.openai import OpenAILLMClient, _parse_arguments
+from llm_kit.observability.base import NoOpMetricsHook
 from llm_kit.tools.tool import Tool
 
 
@@ -68,6 +70,32 @@ class TestOpenAILLMClient:
             assert response.usage.total_tokens == 18
             assert response.latency_ms > 0
 
+    @pytest.mark.asyncio
+    async def test_cache_scope_separates_request_shapes(
+        self, mock_openai_response: MagicMock
+    ) -> None:
+        """Semantic matches never cross models or token limits."""
+        with patch("llm_kit.llms.openai.AsyncOpenAI") as mock_openai:
+            mock_client = AsyncMock()
+            mock_client.chat.completions.create.return_value = mock_openai_response
+            mock_openai.return_value = mock_client
+            cache = AsyncMock()
+            cache.get.return_value = None
+            messages = [Message(role=Role.USER, content="Hello!")]
+
+            client = OpenAILLMClient(api_key="test-key", model="gpt-4o", cache=cache)
+            await client.complete(messages=messages)
+            await client.complete(messages=messages, max_tokens=5)
+            other = OpenAILLMClient(
+                api_key="test-key", model="gpt-4o-mini", cache=cache
+            )
+            await other.complete(messages=messages)
+
+            scopes = [call.args[2] for call in cache.get.await_args_list]
+            assert len(set(scopes)) == 3
+            put_key, _, put_scope, _ = cache.put.await_args_list[0].args
+            assert put_scope == scopes[0] != put_key
+
     @pytest.mark.asyncio
     async def test_complete_with_tools(
         self, mock_openai_tool_response: MagicMock
@@ -122,6 +150,39 @@ class TestOpenAILLMClient:
                 "tool_call_id": "call_123",
             }
 
+    def test_message_conversion_is_reused_across_calls(self) -> None:
+        """Resending the same history reuses the converted dicts."""
+        with patch("llm_kit.llms.openai.AsyncOpenAI"):
+            client = OpenAILLMClient(api_key="test-key")
+            history = [Message(role=Role.USER, content="Hello")]
+
+            first = client._convert_messages(history)
+            history.append(Message(role=Role.ASSISTANT, content="Hi there!"))
+            second = client._convert_messages(history)
+
+            assert second[0] is first[0]
+            assert second[1] == {"role": "assistant", "content": "Hi there!"}
+
+    @pytest.mark.asyncio
+    async def test_noop_metrics_hook_is_not_called(
+        self, mock_openai_response: MagicMock
+    ) -> None:
+        """The default no-op hook is skipped instead of called."""
+        with (
+            patch("llm_kit.llms.openai.AsyncOpenAI") as mock_openai,
+            patch.object(NoOpMetricsHook, "record_latency") as record_latency,
+            patch.object(NoOpMetricsHook, "increment") as increment,
+        ):
+            mock_client = AsyncMock()
+            mock_client.chat.completions.create.return_value = mock_openai_response
+            mock_openai.return_value = mock_client
+
+            client = OpenAILLMClient(api_key="test-key")
+            await client.complete(messages=[Message(role=Role.USER, content="Hi")])
+
+            record_latency.assert_not_called()
+            increment.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_metrics_hook_called(self, mock_openai_response: MagicMock) -> None:
         """Test that metrics hook is called."""
@@ -170,3 +231,30 @@ class TestOpenAILLMClient:
 
             # Should not raise, arguments should be empty dict
             assert result.tool_calls[0].arguments == {}
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ('{"city": "Tokyo"}', {"city": "Tokyo"}),
+        ("{}", {}),
+        ("", {}),
+        ("[1, 2]", {}),
+        ("invalid json", {}),
+    ],
+)
+def test_parse_arguments(raw: str, expected: dict) -> None:
+    assert _parse_arguments(raw) == expected
+
+
+def test_clients_can_share_one_http_client() -> None:
+    http_client = default_http_client()
+    assert default_http_client() is http_client
+
+    with patch("llm_kit.llms.openai.AsyncOpenAI") as mock_openai:
+        OpenAILLMClient(api_key="a", http_client=http_client)
+        OpenAILLMClient(api_key="b", http_client=http_client)
+
+    assert all(
+        call.kwargs["http_client"] is http_client for call in mock_openai.call_args_list
+    )
@@ -1,11 +1,16 @@
 # tests/unit/llms/test_openai_async.py
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from openai import OpenAIError
 from pydantic import BaseModel
 
-from llm_kit.llms.base import Message, Role
+from llm_kit.llms.base import LLMResponse, Message, Role
+from llm_kit.llms.cache import InMemoryLRUCache
 from llm_kit.llms.openai import OpenAILLMClient
 from llm_kit.tools.tool import Tool
 
@@ -177,3 +182,223 @@ class TestOpenAILLMClientAsync:
 
             # Should not raise, arguments should be empty dict
             assert result.tool_calls[0].arguments == {}
+
+    @pytest.mark.asyncio
+    async def test_complete_batch_routes_results_by_custom_id(self) -> None:
+        """Batch output lines are mapped back to request order."""
+
+        def output_line(custom_id: str, content: str) -> str:
+            return json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "response": {
+                        "status_code": 200,
+                        "body": {
+                            "id": "chatcmpl-1",
+                            "object": "chat.completion",
+                            "created": 0,
+                            "model": "gpt-4o",
+                            "choices": [
+                                {
+                                    "index": 0,
+                                    "finish_reason": "stop",
+                                    "message": {
+                                        "role": "assistant",
+                                        "content": content,
+                                    },
+                                }
+                            ],
+                            "usage": {
+                                "prompt_tokens": 3,
+                                "completion_tokens": 2,
+                                "total_tokens": 5,
+                            },
+                        },
+                    },
+                }
+            )
+
+        with patch("llm_kit.llms.openai.AsyncOpenAI") as mock_openai:
+            mock_client = AsyncMock()
+            mock_client.files.create.return_value = MagicMock(id="file-in")
+            mock_client.batches.create.return_value = MagicMock(
+                id="batch-1", status="in_progress"
+            )
+            mock_client.batches.retrieve.return_value = MagicMock(
+                id="batch-1", status="completed", output_file_id="file-out"
+            )
+            # Request 1 failed inside the batch and has no output line
+            mock_client.files.content.return_value = MagicMock(
+                text="\n".join([output_line("2", "third"), output_line("0", "first")])
+            )
+            mock_openai.return_value = mock_client
+
+            client = OpenAILLMClient(api_key="test-key")
+            results = await client.complete_batch(
+                [
+                    [Message(role=Role.USER, content="a")],
+                    [Message(role=Role.USER, content="b")],
+                    [Message(role=Role.USER, content="c")],
+                ],
+                poll_interval=0,
+            )
+
+            assert [r.content for r in results] == ["first", None, "third"]
+            assert [r.finish_reason for r in results] == ["stop", "error", "stop"]
+            submitted = mock_client.files.create.call_args.kwargs["file"][1]
+            assert len(submitted.decode().splitlines()) == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(
+        self, mock_openai_response: MagicMock
+    ) -> None:
+        """Deterministic duplicates in flight together hit the API once."""
+        with patch("llm_kit.llms.openai.AsyncOpenAI") as mock_openai:
+
+            async def create(**_: object) -> MagicMock:
+                await asyncio.sleep(0.01)
+                return mock_openai_response
+
+            mock_client = MagicMock()
+            mock_client.chat.completions.create = AsyncMock(side_effect=create)
+            mock_openai.return_value = mock_client
+
+            client = OpenAILLMClient(api_key="test-key")
+            messages = [Message(role=Role.USER, content="Hello!")]
+            results = await asyncio.gather(
+                *(client.complete(messages=messages) for _ in range(3))
+            )
+
+            assert mock_client.chat.completions.create.await_count == 1
+            assert all(r.content == "Hello! How can I help you?" for r in results)
+
+            await asyncio.gather(
+                *(client.complete(messages=messages, temperature=0.7) for _ in range(2))
+            )
+            assert mock_client.chat.completions.create.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_deterministic_responses_are_served_from_cache(
+        self, mock_openai_response: MagicMock
+    ) -> None:
+        """A cached temperature=0 request skips the API; sampled ones do not."""
+        with patch("llm_kit.llms.openai.AsyncOpenAI") as mock_openai:
+            mock_client = MagicMock()
+            mock_client.chat.completions.create = AsyncMock(
+                return_value=mock_openai_response
+            )
+            mock_openai.return_value = mock_client
+            metrics_hook = MagicMock()
+
+            client = OpenAILLMClient(
+                api_key="test-key",
+                cache=InMemoryLRUCache(),
+                metrics_hook=metrics_hook,
+            )
+            messages = [Message(role=Role.USER, content="Hello!")]
+            first = await client.complete(messages=messages)
+            second = await client.complete(messages=messages)
+            await client.complete(messages=messages, temperature=0.7)
+
+            assert second is first
+            assert mock_client.chat.completions.create.await_count == 2
+            metrics_hook.increment.assert_any_call(
+                "llm_cache_hits", labels={"provider": "openai", "model": "gpt-4o"}
+            )
+
+    @pytest.mark.asyncio
+    async def test_complete_many_returns_results_in_order(
+        self, mock_openai_response: MagicMock
+    ) -> None:
+        """complete_many keeps request order and returns failures in place."""
+        with patch("llm_kit.llms.openai.AsyncOpenAI") as mock_openai:
+
+            async def create(*, messages: list[dict], **_: object) -> MagicMock:
+                if messages[0]["content"] == "bad":
+                    raise ValueError("bad request")
+                return mock_openai_response
+
+            mock_client = MagicMock()
+            mock_client.chat.completions.create = AsyncMock(side_effect=create)
+            mock_openai.return_value = mock_client
+
+            client = OpenAILLMClient(api_key="test-key")
+            results = await client.complete_many(
+                [
+                    [Message(role=Role.USER, content="a")],
+                    [Message(role=Role.USER, content="bad")],
+                    [Message(role=Role.USER, content="c")],
+                ],
+                max_concurrency=2,
+            )
+
+            assert isinstance(results[0], LLMResponse)
+            assert isinstance(results[1], ValueError)
+            assert isinstance(results[2], LLMResponse)
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_deltas_then_final_chunk(
+        self, mock_openai_response: MagicMock
+    ) -> None:
+        class FakeStream:
+            async def __aenter__(self) -> "FakeStream":
+                return self
+
+            async def __aexit__(self, *_: object) -> None:
+                return None
+
+            async def __aiter__(self) -> AsyncIterator[MagicMock]:
+                yield MagicMock(type="content.delta", delta="Hello! ")
+                yield MagicMock(type="chunk")
+                yield MagicMock(type="content.delta", delta="How can I help you?")
+
+            async def get_final_completion(self) -> MagicMock:
+                return mock_openai_response
+
+        with patch("llm_kit.llms.openai.AsyncOpenAI") as mock_openai:
+            mock_client = MagicMock()
+            mock_client.chat.completions.stream.return_value = FakeStream()
+            mock_openai.return_value = mock_client
+
+            metrics_hook = MagicMock()
+            client = OpenAILLMClient(api_key="test-key", metrics_hook=metrics_hook)
+            chunks = [
+                chunk
+                async for chunk in client.stream(
+                    messages=[Message(role=Role.USER, content="Hi")]
+                )
+            ]
+
+            assert [c.delta for c in chunks[:-1]] == ["Hello! ", "How can I help you?"]
+            assert chunks[-1].finish_reason == "stop"
+            assert chunks[-1].usage is not None
+            assert chunks[-1].usage.total_tokens == 18
+            metrics_hook.record_latency.assert_called_once()
+            kwargs = mock_client.chat.completions.stream.call_args.kwargs
+            assert kwargs["stream_options"] == {"include_usage": True}
+
+    @pytest.mark.asyncio
+    async def test_retries_send_no_idempotency_header(
+        self, mock_openai_response: MagicMock
+    ) -> None:
+        with (
+            patch("llm_kit.llms.openai.AsyncOpenAI") as mock_openai,
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_client = MagicMock()
+            mock_client.chat.completions.create = AsyncMock(
+                side_effect=[
+                    OpenAIError("timeout"),
+                    mock_openai_response,
+                    mock_openai_response,
+                ]
+            )
+            mock_openai.return_value = mock_client
+
+            client = OpenAILLMClient(api_key="test-key")
+            await client.complete(messages=[Message(role=Role.USER, content="Hi")])
+            await client.complete(messages=[Message(role=Role.USER, content="Hi")])
+
+            calls = mock_client.chat.completions.create.call_args_list
+            assert len(calls) == 3
+            assert all("extra_headers" not in call.kwargs for call in calls)
@@ -78,3 +78,16 @@ class TestToolSchemaConversion:
 
         query_prop = schema[0]["function"]["parameters"]["properties"]["query"]
         assert query_prop.get("description") == "The search query"
+
+    def test_schema_is_reused_until_tool_changes(
+        self, sample_tools: list[Tool]
+    ) -> None:
+        """Repeated conversions reuse the schema unless the tool is edited."""
+        first = tools_to_openai_schema(sample_tools)
+        second = tools_to_openai_schema(sample_tools)
+        assert second[0] is first[0]
+
+        sample_tools[0].description = "Search everything"
+        third = tools_to_openai_schema(sample_tools)
+        assert third[0]["function"]["description"] == "Search everything"
+        assert third[1] is first[1]
@@ -1,6 +1,9 @@
+from unittest.mock import MagicMock
+
 import pytest
 from pydantic import BaseModel, ValidationError
 
+from llm_kit.observability.base import ToolCallMetricsHook
 from llm_kit.tools.tool import Tool, ToolCall
 from llm_kit.tools.tool_engine import ToolEngine
 from llm_kit.tools.tool_registry import ToolRegistry
@@ -49,3 +52,115 @@ async def test_call_tool_validates_input(engine: ToolEngine) -> None:
 async def test_call_unknown_tool_raises(engine: ToolEngine) -> None:
     with pytest.raises(KeyError, match="not found"):
         await engine.call_tool(ToolCall(tool_name="unknown", arguments={}))
+
+
+@pytest.mark.asyncio
+async def test_call_tool_awaits_async_handler() -> None:
+    async def async_add(args: AddInput) -> int:
+        return args.a + args.b
+
+    registry = ToolRegistry()
+    registry.register(
+        Tool(
+            name="add",
+            description="Adds two numbers",
+            input_schema=AddInput,
+            handler=async_add,
+        )
+    )
+
+    result = await ToolEngine(registry).call_tool(
+        ToolCall(tool_name="add", arguments={"a": 2, "b": 3})
+    )
+    assert result == 5
+
+
+@pytest.mark.asyncio
+async def test_call_tool_records_metrics() -> None:
+    registry = ToolRegistry()
+    registry.register(
+        Tool(
+            name="add",
+            description="Adds two numbers",
+            input_schema=AddInput,
+            handler=add_handler,
+        )
+    )
+    metrics_hook = MagicMock()
+
+    await ToolEngine(registry, metrics_hook=metrics_hook).call_tool(
+        ToolCall(tool_name="add", arguments={"a": 2, "b": 3})
+    )
+
+    metrics_hook.record_call.assert_called_once()
+    latency_name, counter_name, _, labels = metrics_hook.record_call.call_args.args
+    assert (latency_name, counter_name) == ("tool_call_duration", "tool_calls_total")
+    assert labels == {"tool": "add"}
+
+
+class StructuralHook:
+    """Implements MetricsHook structurally, without record_call."""
+
+    def __init__(self) -> None:
+        self.latencies: list[tuple[str, float, dict[str, str] | None]] = []
+        self.counts: list[tuple[str, int, dict[str, str] | None]] = []
+
+    def record_latency(
+        self, name: str, value_ms: float, labels: dict[str, str] | None = None
+    ) -> None:
+        self.latencies.append((name, value_ms, labels))
+
+    def increment(
+        self, name: str, value: int = 1, labels: dict[str, str] | None = None
+    ) -> None:
+        self.counts.append((name, value, labels))
+
+    def record_gauge(
+        self,
+        name: str,  # noqa: ARG002
+        value: float,  # noqa: ARG002
+        labels: dict[str, str] | None = None,  # noqa: ARG002
+    ) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_call_tool_with_structural_hook_records_both_metrics() -> None:
+    registry = ToolRegistry()
+    registry.register(
+        Tool(
+            name="add",
+            description="Adds two numbers",
+            input_schema=AddInput,
+            handler=add_handler,
+        )
+    )
+    hook = StructuralHook()
+    assert not isinstance(hook, ToolCallMetricsHook)
+
+    result = await ToolEngine(registry, metrics_hook=hook).call_tool(
+        ToolCall(tool_name="add", arguments={"a": 2, "b": 3})
+    )
+
+    assert result == 5
+    ((latency_name, value_ms, labels),) = hook.latencies
+    assert (latency_name, labels) == ("tool_call_duration", {"tool": "add"})
+    assert value_ms >= 0
+    assert hook.counts == [("tool_calls_total", 1, {"tool": "add"})]
+
+
+@pytest.mark.asyncio
+async def test_call_tools_returns_results_and_failures_in_order(
+    engine: ToolEngine,
+) -> None:
+    results = await engine.call_tools(
+        [
+            ToolCall(tool_name="add", arguments={"a": 1, "b": 1}),
+            ToolCall(tool_name="unknown", arguments={}),
+            ToolCall(tool_name="add", arguments={"a": 2, "b": 3}),
+        ]
+    )
+
+    assert results[0] == 2
+    assert isinstance(results[1], KeyError)
+    assert results[2] == 5
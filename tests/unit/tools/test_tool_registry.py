@@ -56,8 +56,9 @@ def test_remove_unknown_raises(registry: ToolRegistry) -> None:
         registry.remove("nonexistent")
 
 
-def test_list_returns_copy(registry: ToolRegistry, sample_tool: Tool) -> None:
-    registry.register(sample_tool)
+def test_list_returns_read_only_view(registry: ToolRegistry, sample_tool: Tool) -> None:
     tools = registry.list()
-    tools.clear()  # mutate the copy
-    assert registry.get("double") is sample_tool  # original unaffected
+    registry.register(sample_tool)
+    assert tools["double"] is sample_tool  # live view
+    with pytest.raises(TypeError):
+        tools["other"] = sample_tool  # type: ignore[index]
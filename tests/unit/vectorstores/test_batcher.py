@@ -0,0 +1,56 @@
+# tests/unit/vectorstores/test_batcher.py
+
+import asyncio
+
+import pytest
+
+from llm_kit.vectorstores._batcher import Batcher
+
+
+class TestBatcher:
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_submits(self) -> None:
+        flushed: list[list[int]] = []
+
+        async def flush(items: list[int]) -> None:
+            flushed.append(items)
+
+        batcher = Batcher(flush, max_size=100, max_delay=0.01)
+        await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        await batcher.close()
+
+        assert flushed == [[0, 1, 2, 3, 4]]
+
+    @pytest.mark.asyncio
+    async def test_splits_at_max_size(self) -> None:
+        flushed: list[list[int]] = []
+
+        async def flush(items: list[int]) -> None:
+            flushed.append(items)
+
+        batcher = Batcher(flush, max_size=2, max_delay=1.0)
+        await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        await batcher.close()
+
+        assert flushed[:2] == [[0, 1], [2, 3]]
+        assert sum(flushed, []) == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_raises_in_every_submitter(self) -> None:
+        async def flush(_: list[int]) -> None:
+            raise RuntimeError("boom")
+
+        batcher = Batcher(flush, max_size=10, max_delay=0.01)
+        results = await asyncio.gather(
+            batcher.submit(1), batcher.submit(2), return_exceptions=True
+        )
+        await batcher.close()
+
+        assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+
+    def test_rejects_non_positive_max_size(self) -> None:
+        async def flush(_: list[int]) -> None:
+            pass
+
+        with pytest.raises(ValueError, match="max_size must be >= 1"):
+            Batcher(flush, max_size=0, max_delay=0.01)
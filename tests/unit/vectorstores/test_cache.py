@@ -0,0 +1,76 @@
+# tests/unit/vectorstores/test_cache.py
+
+from unittest.mock import patch
+
+import pytest
+
+from llm_kit.vectorstores.cache import SemanticQueryCache
+from llm_kit.vectorstores.types import QueryResult
+
+
+def _results(id_: str) -> list[QueryResult]:
+    return [QueryResult(id=id_, score=1.0, metadata={})]
+
+
+class TestSemanticQueryCache:
+    def test_similar_vector_hits_and_dissimilar_misses(self) -> None:
+        cache = SemanticQueryCache(threshold=0.95)
+        cache.put("ns", [1.0, 0.0], _results("a"))
+
+        assert cache.get("ns", [0.99, 0.05]) == _results("a")
+        assert cache.get("ns", [0.0, 1.0]) is None
+
+    def test_scopes_do_not_collide(self) -> None:
+        cache = SemanticQueryCache()
+        cache.put(("ns", 5), [1.0, 0.0], _results("a"))
+        cache.put(("ns", 10), [1.0, 0.0], _results("b"))
+
+        assert cache.get(("ns", 10), [1.0, 0.0]) == _results("b")
+        assert cache.get(("other", 5), [1.0, 0.0]) is None
+
+    def test_overwrites_oldest_entry_when_full(self) -> None:
+        cache = SemanticQueryCache(maxsize=2)
+        cache.put("ns", [1.0, 0.0, 0.0], _results("a"))
+        cache.put("ns", [0.0, 1.0, 0.0], _results("b"))
+        cache.put("ns", [0.0, 0.0, 1.0], _results("c"))
+
+        assert cache.get("ns", [1.0, 0.0, 0.0]) is None
+        assert cache.get("ns", [0.0, 1.0, 0.0]) == _results("b")
+
+    def test_entries_expire_after_ttl(self) -> None:
+        cache = SemanticQueryCache(ttl=10)
+        with patch("llm_kit.vectorstores.cache.monotonic", return_value=100.0):
+            cache.put("ns", [1.0, 0.0], _results("a"))
+
+        with patch("llm_kit.vectorstores.cache.monotonic", return_value=105.0):
+            assert cache.get("ns", [1.0, 0.0]) is not None
+        with patch("llm_kit.vectorstores.cache.monotonic", return_value=111.0):
+            assert cache.get("ns", [1.0, 0.0]) is None
+
+    def test_clear_drops_entries(self) -> None:
+        cache = SemanticQueryCache()
+        cache.put("ns", [1.0, 0.0], _results("a"))
+        cache.clear()
+
+        assert cache.get("ns", [1.0, 0.0]) is None
+
+    def test_rejects_non_positive_maxsize(self) -> None:
+        with pytest.raises(ValueError, match="maxsize must be >= 1"):
+            SemanticQueryCache(maxsize=0)
+
+    def test_close_query_replaces_entry_instead_of_taking_a_slot(self) -> None:
+        cache = SemanticQueryCache(threshold=0.95, maxsize=2, merge_threshold=0.97)
+        cache.put("ns", [1.0, 0.0, 0.0], _results("a"))
+        cache.put("ns", [0.98, 0.2, 0.0], _results("b"))
+        cache.put("ns", [0.0, 0.0, 1.0], _results("c"))
+
+        # "b" took over "a"'s slot, so "c" evicted nothing
+        assert cache.get("ns", [1.0, 0.0, 0.0]) == _results("b")
+        assert cache.get("ns", [0.0, 0.0, 1.0]) == _results("c")
+        # Hits are tested against the query that produced the results: this
+        # one is close to "a" but below threshold to "b"
+        assert cache.get("ns", [1.0, -0.15, 0.0]) is None
+
+    def test_rejects_merge_threshold_below_threshold(self) -> None:
+        with pytest.raises(ValueError, match="merge_threshold must be >= threshold"):
+            SemanticQueryCache(threshold=0.99, merge_threshold=0.9)
@@ -0,0 +1,30 @@
+# tests/unit/vectorstores/test_kernels.py
+
+import numpy as np
+import pytest
+
+from llm_kit.vectorstores import cosine_top_k
+
+
+class TestCosineTopK:
+    def test_returns_best_rows_first(self) -> None:
+        matrix = np.array(
+            [[0.0, 1.0], [1.0, 0.0], [1.0, 1.0], [-1.0, 0.0]], dtype=np.float32
+        )
+
+        indices, scores = cosine_top_k(matrix, np.array([2.0, 0.0]), k=2)
+
+        assert indices.tolist() == [1, 2]
+        np.testing.assert_allclose(scores, [1.0, np.sqrt(0.5)], rtol=1e-6)
+
+    def test_k_larger_than_matrix_returns_all_rows(self) -> None:
+        matrix = np.array([[1.0, 0.0], [0.0, 0.0]], dtype=np.float32)
+
+        indices, scores = cosine_top_k(matrix, np.array([1.0, 0.0]), k=5)
+
+        assert indices.tolist() == [0, 1]
+        assert scores.tolist() == [1.0, 0.0]  # zero vector scores 0
+
+    def test_rejects_non_positive_k(self) -> None:
+        with pytest.raises(ValueError, match="k must be at least 1"):
+            cosine_top_k(np.ones((1, 2)), np.ones(2), k=0)
@@ -3,9 +3,11 @@
 import tempfile
 from pathlib import Path
 
+import apsw
+import numpy as np
 import pytest
 
-from llm_kit.vectorstores import SQLiteVectorStore, VectorItem
+from llm_kit.vectorstores import SQLiteVectorStore, VectorItem, VectorItemBatch
 
 
 class TestSQLiteVectorStore:
@@ -31,6 +33,70 @@ class TestSQLiteVectorStore:
 
         await store.close()
 
+    @pytest.mark.asyncio
+    async def test_upsert_accepts_column_batch(self) -> None:
+        store = SQLiteVectorStore(db_path=":memory:", dimensions=2)
+
+        await store.upsert(
+            items=VectorItemBatch(
+                ids=["1", "2"],
+                vectors=np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32),
+                metadatas=[{"n": 1}, {"n": 2}],
+            )
+        )
+
+        results = await store.query(vector=[0.0, 1.0], top_k=1)
+        assert results[0].id == "2"
+        assert results[0].metadata["n"] == 2
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_upsert_rolls_back_whole_batch(self) -> None:
+        store = SQLiteVectorStore(db_path=":memory:", dimensions=2)
+        await store.upsert(items=[VectorItem(id="1", vector=[1.0, 0.0], metadata={})])
+
+        # The repeated id fails the insert after the delete already ran
+        with pytest.raises(apsw.Error):
+            await store.upsert(
+                items=[
+                    VectorItem(id="1", vector=[0.0, 1.0], metadata={}),
+                    VectorItem(id="1", vector=[0.0, 1.0], metadata={}),
+                ]
+            )
+
+        (item,) = await store.get_by_ids(ids=["1"])
+        assert isinstance(item.vector, np.ndarray)
+        assert item.vector.dtype == np.float32
+        assert item.vector == pytest.approx([1.0, 0.0])
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_id_operations_handle_many_and_repeated_ids(self) -> None:
+        store = SQLiteVectorStore(db_path=":memory:", dimensions=2)
+        ids = [str(i) for i in range(600)]
+        await store.upsert(
+            items=[VectorItem(id=i, vector=[1.0, 0.0], metadata={}) for i in ids]
+        )
+        # Re-upserting replaces every row rather than duplicating any
+        await store.upsert(
+            items=[VectorItem(id=i, vector=[0.0, 1.0], metadata={}) for i in ids]
+        )
+
+        assert await store.count() == 600
+        assert len(await store.get_by_ids(ids=ids + ids[:10])) == 600
+        assert await store.delete(ids=ids[:300] + ids[:5]) == 300
+        assert await store.count() == 300
+
+        await store.close()
+
+    def test_column_batch_rejects_mismatched_lengths(self) -> None:
+        with pytest.raises(ValueError, match="equal length"):
+            VectorItemBatch(
+                ids=["1"], vectors=np.zeros((2, 3), dtype=np.float32), metadatas=[{}]
+            )
+
     @pytest.mark.asyncio
     async def test_upsert_updates_existing(self) -> None:
         """Test that upsert updates existing vectors."""
@@ -88,6 +154,51 @@ class TestSQLiteVectorStore:
 
         await store.close()
 
+    @pytest.mark.asyncio
+    async def test_nested_filter_ignores_key_order(self) -> None:
+        store = SQLiteVectorStore(db_path=":memory:", dimensions=2)
+        await store.upsert(
+            items=[
+                VectorItem(id="1", vector=[1.0, 0.0], metadata={"d": {"x": 1, "y": 2}}),
+                VectorItem(
+                    id="2", vector=[1.0, 0.1], metadata={"d": [{"b": 1, "a": 2}]}
+                ),
+            ]
+        )
+
+        results = await store.query(
+            vector=[1.0, 0.0], top_k=10, filters={"d": {"y": 2, "x": 1}}
+        )
+        assert [r.id for r in results] == ["1"]
+
+        results = await store.query(
+            vector=[1.0, 0.0], top_k=10, filters={"d": [{"a": 2, "b": 1}]}
+        )
+        assert [r.id for r in results] == ["2"]
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_filtered_query_finds_matches_beyond_nearest(self) -> None:
+        store = SQLiteVectorStore(db_path=":memory:", dimensions=2)
+        # The ten nearest vectors do not match; the two matches are far away
+        await store.upsert(
+            items=[
+                VectorItem(id=f"n{i}", vector=[1.0, i / 100], metadata={"k": "no"})
+                for i in range(10)
+            ]
+            + [
+                VectorItem(id=f"y{i}", vector=[0.0, 1.0], metadata={"k": "yes"})
+                for i in range(2)
+            ]
+        )
+
+        results = await store.query(vector=[1.0, 0.0], top_k=2, filters={"k": "yes"})
+
+        assert sorted(r.id for r in results) == ["y0", "y1"]
+
+        await store.close()
+
     @pytest.mark.asyncio
     async def test_delete_by_ids(self) -> None:
         """Test deleting vectors by IDs."""
@@ -189,6 +300,31 @@ class TestSQLiteVectorStore:
             assert results[0].metadata["test"] == "data"
             await store2.close()
 
+    @pytest.mark.asyncio
+    async def test_file_database_uses_wal(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SQLiteVectorStore(db_path=Path(tmpdir) / "test.db", dimensions=2)
+            await store.count()
+
+            assert store._conn is not None
+            assert next(store._conn.execute("PRAGMA journal_mode"))[0] == "wal"
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_refreshes_planner_statistics(self) -> None:
+        store = SQLiteVectorStore(db_path=":memory:", dimensions=2)
+        await store.upsert(
+            items=VectorItemBatch(
+                ids=[str(i) for i in range(1024)],
+                vectors=np.ones((1024, 2), dtype=np.float32),
+                metadatas=[{}] * 1024,
+            )
+        )
+
+        assert store._conn is not None
+        assert next(store._conn.execute("SELECT COUNT(*) FROM sqlite_stat1"))[0] > 0
+        await store.close()
+
     @pytest.mark.asyncio
     async def test_empty_upsert(self) -> None:
         """Test that empty upsert doesn't raise an error."""
@@ -227,6 +363,39 @@ class TestSQLiteVectorStore:
 
         await store.close()
 
+    @pytest.mark.asyncio
+    async def test_int8_quantization_matches_float32_ranking(self) -> None:
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((200, 16)).astype(np.float32)
+        batch = VectorItemBatch(
+            ids=[str(i) for i in range(200)],
+            vectors=vectors,
+            metadatas=[{"even": i % 2 == 0} for i in range(200)],
+        )
+        exact = SQLiteVectorStore(db_path=":memory:", dimensions=16)
+        int8 = SQLiteVectorStore(db_path=":memory:", dimensions=16, quantization="int8")
+        await exact.upsert(items=batch)
+        await int8.upsert(items=batch)
+
+        for filters in (None, {"even": True}):
+            expected = await exact.query(vector=vectors[7], top_k=5, filters=filters)
+            results = await int8.query(vector=vectors[7], top_k=5, filters=filters)
+            assert [r.id for r in results] == [r.id for r in expected]
+            assert [r.score for r in results] == pytest.approx(
+                [r.score for r in expected], abs=1e-5
+            )
+
+        # The float32 copy is returned, not the quantized vector
+        (item,) = await int8.get_by_ids(ids=["3"])
+        np.testing.assert_array_equal(item.vector, vectors[3])
+
+        await exact.close()
+        await int8.close()
+
+    def test_rejects_unknown_quantization(self) -> None:
+        with pytest.raises(ValueError, match="quantization"):
+            SQLiteVectorStore(quantization="int4")  # type: ignore[arg-type]
+
     @pytest.mark.asyncio
     async def test_get_by_ids(self) -> None:
         """Test retrieving vectors by IDs."""
@@ -246,6 +415,10 @@ class TestSQLiteVectorStore:
         ids = {item.id for item in retrieved}
         assert ids == {"1", "3"}
 
+        # Found items come back in request order; missing ids are skipped
+        retrieved = await store.get_by_ids(ids=["3", "missing", "1", "2", "3"])
+        assert [item.id for item in retrieved] == ["3", "1", "2"]
+
         await store.close()
 
     @pytest.mark.asyncio
@@ -0,0 +1,46 @@
+# tests/unit/vectorstores/test_worker.py
+
+import asyncio
+import threading
+from functools import partial
+
+import pytest
+
+from llm_kit.vectorstores._worker import ThreadWorker
+
+
+class TestThreadWorker:
+    @pytest.mark.asyncio
+    async def test_runs_calls_in_order_on_one_thread(self) -> None:
+        worker = ThreadWorker(name="test-worker")
+        seen: list[tuple[int, str]] = []
+
+        def job(i: int) -> int:
+            seen.append((i, threading.current_thread().name))
+            return i * 2
+
+        results = await asyncio.gather(*(worker.run(partial(job, i)) for i in range(5)))
+        worker.stop()
+
+        assert results == [0, 2, 4, 6, 8]
+        assert seen == [(i, "test-worker") for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_propagates_exceptions(self) -> None:
+        worker = ThreadWorker(name="test-worker")
+
+        def fail() -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await worker.run(fail)
+        worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_restarts_after_stop(self) -> None:
+        worker = ThreadWorker(name="test-worker")
+        assert await worker.run(lambda: 1) == 1
+        worker.stop()
+
+        assert await worker.run(lambda: 2) == 2
+        worker.stop()